@@ -0,0 +1,86 @@
+"""
+Compare the learned bid predictor with the simulation baseline.
+
+Both estimate a hand's trick distribution; the benchmark deals fresh
+hands, plays each deal out once, and reports per-decision latency, the
+log-loss of each estimate against the tricks actually taken, and how
+often the two methods choose the same bid.
+
+    python -m benchmarks.bid_predictor --deals 200 --samples 200
+"""
+
+import argparse
+import random
+import time
+import numpy as np
+from src.ml.agent import RandomAgent
+from src.ml.bid_predictor import (
+    FEATURE_SIZE,
+    BidPredictor,
+    best_bid,
+    hand_features,
+    simulate_distribution,
+)
+from src.models.deck import Deck
+from src.models.game_round import GameRound, HistoryMode, Phase
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--deals", type=int, default=200)
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--cards", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--weights", help="weights file (default: shipped model)")
+    args = parser.parse_args(argv)
+
+    predictor = BidPredictor.load(args.weights) if args.weights else BidPredictor.load()
+    rng = random.Random(args.seed)
+    agents = [RandomAgent(rng.getrandbits(32)) for _ in range(args.players)]
+    names = [f"Seat {i + 1}" for i in range(args.players)]
+    options = list(range(args.cards + 1))
+    predictor.predict(np.zeros(FEATURE_SIZE))  # Keep NumPy warm-up out of the timings
+
+    model_time = sim_time = 0.0
+    model_loss = sim_loss = 0.0
+    agree = hands = 0
+    for _ in range(args.deals):
+        deck = Deck.standard_deck(rng)
+        trump_card = deck.cards[-args.players * args.cards - 1]
+        round = GameRound(names, history=HistoryMode.COUNTS)
+        round.setup_round(args.cards, trump=True, deck=deck)
+        dealt = [list(round.get_hand(player)) for player in round.players]
+        while round.phase != Phase.OVER:
+            seat = round.to_move_index
+            round.step(agents[seat].choose_card(round, round.players[seat]))
+
+        for seat, player in enumerate(round.players):
+            taken = round.trick_count(player)
+
+            start = time.perf_counter()
+            model = predictor.predict(
+                hand_features(dealt[seat], round.trump_suit, seat, args.players)
+            )
+            model_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            sim = simulate_distribution(
+                dealt[seat], trump_card, seat, args.players, args.samples, rng
+            )
+            sim_time += time.perf_counter() - start
+
+            model_loss -= np.log(max(model[taken], 1e-12))
+            sim_loss -= np.log(max(sim[taken], 1e-12))
+            agree += best_bid(model, options) == best_bid(sim, options)
+            hands += 1
+
+    print(f"{hands} hands, {args.players} players, {args.cards} cards, trumps")
+    print(f"{'':12}{'us/decision':>14}{'log-loss':>10}")
+    print(f"{'model':12}{1e6 * model_time / hands:14.1f}{model_loss / hands:10.3f}")
+    print(f"{'simulation':12}{1e6 * sim_time / hands:14.1f}{sim_loss / hands:10.3f}")
+    print(f"Same bid chosen for {agree / hands:.1%} of hands")
+
+
+if __name__ == "__main__":
+    main()
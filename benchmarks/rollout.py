@@ -0,0 +1,86 @@
+"""
+Benchmark rollout policies for speed and playout quality.
+
+Speed is card decisions per second over whole rounds. Quality is how
+close a self-play playout's trick split comes to the double-dummy value
+of the deal, for two-player deals where that value is exact.
+
+    python -m benchmarks.rollout --rounds 2000 --deals 200
+"""
+
+import argparse
+import random
+import time
+from typing import Tuple
+from src.ml.agent import RandomAgent
+from src.ml.double_dummy import DoubleDummySolver
+from src.ml.rollout import HeuristicAgent, greedy_policy
+from src.models.deck import Deck
+from src.models.game_round import GameRound, HistoryMode, Phase
+
+
+def playout(round: GameRound, agents) -> Tuple[int, float]:
+    """
+    Play a dealt round out. Returns the number of card decisions and the
+    time spent choosing cards, which leaves out the engine's own cost.
+    """
+    decisions, elapsed = 0, 0.0
+    while round.phase != Phase.OVER:
+        seat = round.to_move_index
+        start = time.perf_counter()
+        card = agents[seat].choose_card(round, round.players[seat])
+        elapsed += time.perf_counter() - start
+        round.step(card)
+        decisions += 1
+    return decisions, elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=2000)
+    parser.add_argument("--deals", type=int, default=200)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--cards", type=int, default=10)
+    parser.add_argument("--solver-cards", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    policies = {
+        "random": lambda: RandomAgent(args.seed),
+        "heuristic": lambda: HeuristicAgent(greedy_policy()),
+    }
+    names = [f"Seat {i + 1}" for i in range(args.players)]
+    print(f"{'':12}{'decisions/s':>14}{'mean |error|':>14}{'exact':>8}")
+    for label, make in policies.items():
+        rng = random.Random(args.seed)
+        agents = [make() for _ in names]
+        decisions, elapsed = 0, 0.0
+        for _ in range(args.rounds):
+            round = GameRound(names, history=HistoryMode.COUNTS)
+            round.setup_round(args.cards, deck=Deck.standard_deck(rng))
+            count, seconds = playout(round, agents)
+            decisions += count
+            elapsed += seconds
+
+        rng = random.Random(args.seed)
+        error, exact = 0, 0
+        for _ in range(args.deals):
+            round = GameRound(["North", "South"], history=HistoryMode.COUNTS)
+            round.setup_round(args.solver_cards, deck=Deck.standard_deck(rng))
+            solver = DoubleDummySolver(
+                [list(round.get_hand(p)) for p in round.players], round.trump_suit
+            )
+            best = solver.tricks(0)
+            playout(round, [make(), make()])
+            miss = abs(round.trick_count(round.players[0]) - best)
+            error += miss
+            exact += miss == 0
+
+        print(
+            f"{label:12}{decisions / elapsed:14.0f}"
+            f"{error / args.deals:14.3f}{exact / args.deals:8.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -10,12 +10,20 @@ from src.models.scoring import (
     FixedBidScorer,
     RoundScore,
 )
-from src.cli_helpers import play_round_loop, get_bids
+from src.cli_helpers import (
+    TerminalSink,
+    play_round_loop,
+    get_bids,
+    run_session,
+    ask,
+    say,
+)
+from src.utils.constants import MAX_PLAYERS, MIN_PLAYERS
 
 
 def print_hand(round: GameRound, player: Player):
     """Print cards vertically, numbering only valid plays."""
-    print("Your hand:")
+    say("Your hand:")
     playable_indices = {}
     index = 0
     hand = round.get_hand(player)
@@ -26,7 +34,7 @@ def print_hand(round: GameRound, player: Player):
             prefix = f"[{index}]"
             playable_indices[index] = i
             index += 1
-        print(f"{prefix} {card}")
+        say(f"{prefix} {card}")
     return playable_indices, hand
 
 
@@ -34,106 +42,120 @@ def get_card_choice(playable_indices, hand):
     """Get valid card selection from user."""
     while True:
         try:
-            choice = int(input("Choose a card (number): "))
+            choice = int(ask("Choose a card (number): "))
             if choice in playable_indices:
                 return hand[playable_indices[choice]]
-            print("Invalid choice. Try again.")
+            say("Invalid choice. Try again.")
         except ValueError:
-            print("Please enter a number.")
+            say("Please enter a number.")
 
 
 def get_scorer(round: GameRound) -> RoundScorer:
-    print("\nSelect scoring scheme:")
-    print("1. Bidding (10 points + bid if correct)")
-    print("2. All or Nothing (-2 per trick unless all taken)")
-    print("3. Fixed Bid (20 points for exactly 3 tricks)")
+    say("\nSelect scoring scheme:")
+    say("1. Bidding (10 points + bid if correct)")
+    say("2. All or Nothing (-2 per trick unless all taken)")
+    say("3. Fixed Bid (20 points for exactly 3 tricks)")
 
     while True:
-        choice = input("Enter choice (1-3): ")
+        choice = ask("Enter choice (1-3): ")
         if choice == "1":
             return get_bidding_scorer(round)
         elif choice == "2":
             return AllOrNothingScorer()
         elif choice == "3":
             return FixedBidScorer()
-        print("Invalid choice, try again")
+        say("Invalid choice, try again")
 
 
 def get_bidding_scorer(round: GameRound) -> Optional[BiddingScorer]:
     scorer = BiddingScorer.create()
     num_tricks = len(round.get_hand(round.players[0]))
     bids = get_bids(round.players, num_tricks)
-    if not scorer.set_bids(bids, num_tricks):
+    # Feed the bids through the round so they are reported as events
+    round.start_bidding()
+    for player in round.players:
+        round.step(bids[player])
+    if not scorer.set_bids(round.bids, num_tricks):
         return None
     return scorer
 
 
 def display_scores(score: RoundScore) -> None:
-    print("\nFinal scores:")
+    say("\nFinal scores:")
     for player, points in score.points.items():
-        print(f"{player.name}: {points}")
+        say(f"{player.name}: {points}")
 
 
-def main():
+def play_test_round():
     # Game setup
-    print("Playing a test round of Gulk.")
+    say("Playing a test round of Gulk.")
     while True:
         try:
-            num_players = int(input("Enter number of players (2-4): "))
-            if 2 <= num_players <= 4:
+            num_players = int(
+                ask(f"Enter number of players ({MIN_PLAYERS}-{MAX_PLAYERS}): ")
+            )
+            if MIN_PLAYERS <= num_players <= MAX_PLAYERS:
                 break
-            print("Please enter a number between 2 and 4.")
+            say(f"Please enter a number between {MIN_PLAYERS} and {MAX_PLAYERS}.")
         except ValueError:
-            print("Please enter a valid number.")
+            say("Please enter a valid number.")
 
     player_names = []
     for i in range(num_players):
-        name = input(f"Enter name for Player {i+1}: ")
+        name = ask(f"Enter name for Player {i+1}: ")
         player_names.append(name)
 
-    round = GameRound(player_names)
+    round = GameRound(player_names, sink=TerminalSink())
 
     # Ask about trump suits
     while True:
-        trump_choice = input("Use trump suits? (y/n): ").lower()
+        trump_choice = ask("Use trump suits? (y/n): ").lower()
         if trump_choice in ["y", "n"]:
             use_trump = trump_choice == "y"
             break
-        print("Please enter 'y' or 'n'.")
+        say("Please enter 'y' or 'n'.")
 
     # Ask for number of cards
     while True:
         try:
-            max_cards = (Deck.STANDARD_DECK_SIZE - 1) // len(
-                round.players
-            )  # Account for trump card
+            # As many as one deck gives two players; big tables add decks
+            max_cards = (Deck.STANDARD_DECK_SIZE - 1) // 2
             cards_per_player = int(
-                input(f"Enter number of cards per player (1-{max_cards}): ")
+                ask(f"Enter number of cards per player (1-{max_cards}): ")
             )
             if 1 <= cards_per_player <= max_cards:
                 break
-            print(f"Please enter a number between 1 and {max_cards}.")
+            say(f"Please enter a number between 1 and {max_cards}.")
         except ValueError:
-            print("Please enter a valid number.")
+            say("Please enter a valid number.")
 
-    round.setup_round(cards_per_player, trump=use_trump)
+    num_decks = Deck.decks_needed(len(round.players), cards_per_player, use_trump)
+    round.setup_round(
+        cards_per_player,
+        trump=use_trump,
+        deck=Deck.standard_deck(num_decks=num_decks),
+    )
 
     # Move scorer selection here, after round setup
     scorer = get_scorer(round)
     if scorer is None:
-        print("Failed to create scorer")
+        say("Failed to create scorer")
         return
 
     play_round_loop(round)
 
     # Game end
-    print("\nRound Over!")
+    say("\nRound Over!")
     for player in round.players:
-        print(f"{player.name}: {len(round.tricks_won[player])} tricks")
+        say(f"{player.name}: {round.trick_count(player)} tricks")
 
     score = scorer.score_round(round)
     display_scores(score)
 
 
+def main(argv=None):
+    run_session(play_test_round, argv, "Play a single test round.")
+
+
 if __name__ == "__main__":
     main()
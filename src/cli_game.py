@@ -1,5 +1,18 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import List, Type
+from itertools import repeat
+from typing import Dict, List, Optional, Sequence, Type
+from src.ml.agent import Agent
+from src.models.events import (
+    EventSink,
+    GameOver,
+    GameStarted,
+    NullSink,
+    RoundScored,
+    RoundStarted,
+)
+from src.models.deck import Deck
 from src.models.game_round import GameRound
 from src.models.player import Player
 from src.models.scoring import (
@@ -7,9 +20,17 @@ from src.models.scoring import (
     BiddingScorer,
     AllOrNothingScorer,
     FixedBidScorer,
-    RoundScore,
 )
-from src.cli_helpers import get_bids, play_round_loop
+from src.cli_helpers import (
+    TerminalSink,
+    get_bids,
+    play_round_loop,
+    run_session,
+    ask,
+    say,
+)
+from src.sim.runner import play_configured_round
+from src.utils.constants import MAX_PLAYERS, MIN_PLAYERS
 
 @dataclass
 class RoundConfig:
@@ -18,65 +39,91 @@ class RoundConfig:
     scorer_type: Type[RoundScorer]
     scorer_params: dict
 
+    def new_deck(self, num_players: int, rng: Optional[random.Random] = None) -> Deck:
+        """A shuffled deck with enough standard decks to deal this round."""
+        num_decks = Deck.decks_needed(
+            num_players, self.cards_per_player, self.use_trump
+        )
+        return Deck.standard_deck(rng, num_decks)
+
+def default_round_configs() -> List[RoundConfig]:
+    """Define the 20 rounds of the game"""
+    configs = []
+
+    # Rounds 1-5: Bidding rounds with decreasing cards (10 to 6)
+    for cards in range(10, 5, -1):
+        configs.append(RoundConfig(
+            cards_per_player=cards,
+            use_trump=True,
+            scorer_type=BiddingScorer,
+            scorer_params={}
+        ))
+
+    # Rounds 6-10: All or Nothing rounds with increasing cards (6 to 10)
+    for cards in range(6, 11):
+        configs.append(RoundConfig(
+            cards_per_player=cards,
+            use_trump=True,
+            scorer_type=AllOrNothingScorer,
+            scorer_params={}
+        ))
+
+    # Rounds 11-15: Fixed Bid rounds with varying targets
+    for cards, target in zip(range(8, 13), range(2, 7)):
+        configs.append(RoundConfig(
+            cards_per_player=cards,
+            use_trump=False,
+            scorer_type=FixedBidScorer,
+            scorer_params={'target_tricks': target, 'points': 20}
+        ))
+
+    # Rounds 16-20: Bidding rounds without trump
+    for cards in range(10, 5, -1):
+        configs.append(RoundConfig(
+            cards_per_player=cards,
+            use_trump=False,
+            scorer_type=BiddingScorer,
+            scorer_params={}
+        ))
+
+    return configs
+
 class GameController:
-    def __init__(self, player_names: List[str]):
+    def __init__(
+        self,
+        player_names: List[str],
+        agents: Optional[Sequence[Agent]] = None,
+        sink: Optional[EventSink] = None,
+    ):
+        """
+        Game progress is reported as events to `sink`, which defaults to
+        the terminal. Pass a NullSink to play silently.
+        """
+        self.sink = sink if sink is not None else TerminalSink()
         self.players = [Player(name) for name in player_names]
         self.total_scores = {player: 0 for player in self.players}
         self.round_configs = self._setup_round_configs()
+        if agents is not None and len(agents) != len(self.players):
+            raise ValueError("Need exactly one agent per player")
+        self.agents = list(agents) if agents is not None else None
 
     def _setup_round_configs(self) -> List[RoundConfig]:
-        """Define the 20 rounds of the game"""
-        configs = []
-
-        # Rounds 1-5: Bidding rounds with decreasing cards (10 to 6)
-        for cards in range(10, 5, -1):
-            configs.append(RoundConfig(
-                cards_per_player=cards,
-                use_trump=True,
-                scorer_type=BiddingScorer,
-                scorer_params={}
-            ))
-
-        # Rounds 6-10: All or Nothing rounds with increasing cards (6 to 10)
-        for cards in range(6, 11):
-            configs.append(RoundConfig(
-                cards_per_player=cards,
-                use_trump=True,
-                scorer_type=AllOrNothingScorer,
-                scorer_params={}
-            ))
-
-        # Rounds 11-15: Fixed Bid rounds with varying targets
-        for cards, target in zip(range(8, 13), range(2, 7)):
-            configs.append(RoundConfig(
-                cards_per_player=cards,
-                use_trump=False,
-                scorer_type=FixedBidScorer,
-                scorer_params={'target_tricks': target, 'points': 20}
-            ))
-
-        # Rounds 16-20: Bidding rounds without trump
-        for cards in range(10, 5, -1):
-            configs.append(RoundConfig(
-                cards_per_player=cards,
-                use_trump=False,
-                scorer_type=BiddingScorer,
-                scorer_params={}
-            ))
-
-        return configs
+        return default_round_configs()
 
     def play_game(self):
-        print("Starting new game with players:", ", ".join(p.name for p in self.players))
+        self._start_game()
 
+        # Rounds skip building events altogether when nobody is listening
+        round_sink = None if isinstance(self.sink, NullSink) else self.sink
         for round_num, config in enumerate(self.round_configs, 1):
-            print(f"\n=== Round {round_num} of {len(self.round_configs)} ===")
-            print(f"Cards per player: {config.cards_per_player}")
-            print(f"Trump suits: {'Enabled' if config.use_trump else 'Disabled'}")
-            print(f"Scoring: {config.scorer_type.__name__}")
+            self._start_round(round_num, config)
 
-            round = GameRound(self.players)
-            round.setup_round(config.cards_per_player, trump=config.use_trump)
+            round = GameRound([player.name for player in self.players], sink=round_sink)
+            round.setup_round(
+                config.cards_per_player,
+                trump=config.use_trump,
+                deck=config.new_deck(len(self.players)),
+            )
 
             # Create scorer based on config
             scorer = config.scorer_type(**config.scorer_params)
@@ -84,65 +131,123 @@ class GameController:
             self._play_round(round, scorer)
             round_score = scorer.score_round(round)
 
-            # Update total scores
-            for player, points in round_score.points.items():
-                self.total_scores[player] += points
-
-            self._display_scores(round_num, round_score)
-
-        self._display_final_scores()
+            # Round players are distinct objects, so match them up by seat
+            self._record_round(
+                round_num,
+                [round.trick_count(player) for player in round.players],
+                [round_score.points[player] for player in round.players],
+            )
+
+        self._end_game()
+
+    def play_game_parallel(
+        self, max_workers: Optional[int] = None, seed: Optional[int] = None
+    ) -> Dict[Player, int]:
+        """
+        Play every round concurrently on a process pool.
+        Only possible with agents in every seat, since rounds are then
+        independent. Scores are reduced in round order, so the output
+        matches a sequential game dealt from the same seed.
+        """
+        if self.agents is None:
+            raise ValueError("Parallel play requires an agent for every player")
+
+        self._start_game()
+
+        rng = random.Random(seed)
+        seeds = [rng.getrandbits(32) for _ in self.round_configs]
+        player_names = [player.name for player in self.players]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                play_configured_round,
+                repeat(player_names),
+                self.round_configs,
+                repeat(self.agents),
+                seeds,
+            )
+            for round_num, (config, result) in enumerate(
+                zip(self.round_configs, results), 1
+            ):
+                self._start_round(round_num, config)
+                self._record_round(round_num, result.tricks, result.points)
+
+        self._end_game()
+        return self.total_scores
 
     def _play_round(self, round: GameRound, scorer: RoundScorer):
         if isinstance(scorer, BiddingScorer):
             num_tricks = len(round.get_hand(round.players[0]))
             bids = get_bids(round.players, num_tricks)
-            if not scorer.set_bids(bids, num_tricks):
+            # Feed the bids through the round so they are reported as events
+            round.start_bidding()
+            for player in round.players:
+                round.step(bids[player])
+            if not scorer.set_bids(round.bids, num_tricks):
                 raise ValueError("Invalid bids")
 
         play_round_loop(round)
 
-        print("\nRound Over!")
-        for player in round.players:
-            print(f"{player.name}: {len(round.tricks_won[player])} tricks")
-
-    def _display_scores(self, round_num: int, round_score: RoundScore):
-        print(f"\nScores after round {round_num}:")
-        print("Round scores:")
-        for player, points in round_score.points.items():
-            print(f"{player.name}: {points}")
-        print("\nTotal scores:")
-        for player, total in self.total_scores.items():
-            print(f"{player.name}: {total}")
-
-    def _display_final_scores(self):
-        print("\n=== Final Scores ===")
-        # Sort players by score
-        sorted_players = sorted(
-            self.players,
-            key=lambda p: self.total_scores[p],
-            reverse=True
+    def _record_round(self, round_num: int, tricks: List[int], points: List[int]):
+        """Add one round's per-seat points to the totals and report them."""
+        for player, round_points in zip(self.players, points):
+            self.total_scores[player] += round_points
+        self.sink.emit(
+            RoundScored(
+                round_num,
+                [player.name for player in self.players],
+                list(tricks),
+                list(points),
+                [self.total_scores[player] for player in self.players],
+            )
         )
-        for i, player in enumerate(sorted_players, 1):
-            print(f"{i}. {player.name}: {self.total_scores[player]}")
 
-def main():
-    print("Welcome to the Card Game!")
+    def _start_game(self):
+        self.sink.emit(GameStarted([player.name for player in self.players]))
+
+    def _start_round(self, round_num: int, config: RoundConfig):
+        self.sink.emit(
+            RoundStarted(
+                round_num,
+                len(self.round_configs),
+                config.cards_per_player,
+                config.use_trump,
+                config.scorer_type.__name__,
+            )
+        )
+
+    def _end_game(self):
+        self.sink.emit(
+            GameOver(
+                [player.name for player in self.players],
+                [self.total_scores[player] for player in self.players],
+            )
+        )
+        self.sink.flush()
+
+def play_interactive_game():
+    say("Welcome to the Card Game!")
     while True:
         try:
-            num_players = int(input("Enter number of players (2-4): "))
-            if 2 <= num_players <= 4:
+            num_players = int(
+                ask(f"Enter number of players ({MIN_PLAYERS}-{MAX_PLAYERS}): ")
+            )
+            if MIN_PLAYERS <= num_players <= MAX_PLAYERS:
                 break
-            print("Please enter a number between 2 and 4.")
+            say(f"Please enter a number between {MIN_PLAYERS} and {MAX_PLAYERS}.")
         except ValueError:
-            print("Please enter a valid number.")
+            say("Please enter a valid number.")
 
     player_names = []
     for i in range(num_players):
-        name = input(f"Enter name for Player {i+1}: ")
+        name = ask(f"Enter name for Player {i+1}: ")
         player_names.append(name)
 
     game = GameController(player_names)
     game.play_game()
 
+def main(argv=None):
+    run_session(play_interactive_game, argv, "Play a full 20-round game.")
+
 if __name__ == "__main__":
     main()
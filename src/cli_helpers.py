@@ -1,11 +1,139 @@
-from typing import Dict, List, Tuple
-from src.models.game_round import GameRound
+import argparse
+import random
+import sys
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from src.models.game_round import GameRound, Phase
 from src.models.player import Player
 from src.models.card import Card
+from src.models.events import (
+    Deal,
+    Event,
+    EventSink,
+    GameOver,
+    GameStarted,
+    RoundScored,
+    RoundStarted,
+    TrickWon,
+)
+
+
+class ScriptExhausted(EOFError):
+    """Raised when a scripted session runs out of input lines."""
+
+
+class Console:
+    """Terminal input and output for the CLIs."""
+
+    def read(self, prompt: str) -> str:
+        return input(prompt)
+
+    def write(self, *args, **kwargs) -> None:
+        print(*args, **kwargs)
+
+
+class ScriptedConsole(Console):
+    """
+    Answers prompts from a script instead of the keyboard, one line per
+    answer. Blank lines and lines starting with '#' are skipped. With
+    quiet=True nothing is printed at all.
+    """
+
+    def __init__(self, lines: Iterable[str], quiet: bool = False):
+        self._lines = iter(lines)
+        self.quiet = quiet
+        self.answers_read = 0
+
+    def read(self, prompt: str) -> str:
+        for line in self._lines:
+            answer = line.strip()
+            if answer and not answer.startswith("#"):
+                self.answers_read += 1
+                self.write(f"{prompt}{answer}")
+                return answer
+        raise ScriptExhausted()
+
+    def write(self, *args, **kwargs) -> None:
+        if not self.quiet:
+            print(*args, **kwargs)
+
+
+_console = Console()
+
+
+def set_console(console: Console) -> None:
+    """Route all CLI input and output through `console`."""
+    global _console
+    _console = console
+
+
+def run_session(
+    play: Callable[[], None],
+    argv: Optional[Sequence[str]] = None,
+    description: Optional[str] = None,
+) -> None:
+    """
+    Run `play` once interactively, or, with --script, back to back until
+    the script runs out, then report throughput on stderr.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--script", help="read answers from a file ('-' for stdin), one per line"
+    )
+    parser.add_argument(
+        "--quiet", action="store_true", help="suppress game output (needs --script)"
+    )
+    parser.add_argument(
+        "--seed", type=int, help="seed the shuffles so scripted games replay exactly"
+    )
+    args = parser.parse_args(argv)
+    if args.quiet and args.script is None:
+        parser.error("--quiet requires --script")
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    if args.script is None:
+        play()
+        return
+
+    source = sys.stdin if args.script == "-" else open(args.script, encoding="utf-8")
+    console = ScriptedConsole(source, quiet=args.quiet)
+    set_console(console)
+    games = 0
+    start = time.perf_counter()
+    try:
+        while True:
+            answers_before = console.answers_read
+            try:
+                play()
+            except ScriptExhausted:
+                if console.answers_read != answers_before:
+                    sys.exit(f"Script ended in the middle of game {games + 1}")
+                break
+            games += 1
+    finally:
+        set_console(Console())
+        if source is not sys.stdin:
+            source.close()
+
+    elapsed = time.perf_counter() - start
+    rate = games / elapsed if elapsed > 0 else float("inf")
+    print(
+        f"Played {games} games in {elapsed:.3f}s ({rate:.1f} games/s)", file=sys.stderr
+    )
+
+
+def ask(prompt: str) -> str:
+    return _console.read(prompt)
+
+
+def say(*args, **kwargs) -> None:
+    _console.write(*args, **kwargs)
+
 
 def print_hand(round: GameRound, player: Player) -> Tuple[Dict[int, int], List[Card]]:
     """Print cards vertically, numbering only valid plays."""
-    print("Your hand:")
+    say("Your hand:")
     playable_indices = {}
     index = 0
     hand = round.get_hand(player)
@@ -16,89 +144,113 @@ def print_hand(round: GameRound, player: Player) -> Tuple[Dict[int, int], List[C
             prefix = f"[{index}]"
             playable_indices[index] = i
             index += 1
-        print(f"{prefix} {card}")
+        say(f"{prefix} {card}")
     return playable_indices, hand
 
+
 def get_card_choice(playable_indices: Dict[int, int], hand: List[Card]) -> Card:
     """Get valid card selection from user."""
     while True:
         try:
-            choice = int(input("Choose a card (number): "))
+            choice = int(ask("Choose a card (number): "))
             if choice in playable_indices:
                 return hand[playable_indices[choice]]
-            print("Invalid choice. Try again.")
+            say("Invalid choice. Try again.")
         except ValueError:
-            print("Please enter a number.")
+            say("Please enter a number.")
+
 
 def get_bids(players, num_tricks) -> Dict[Player, int]:
     """Get bids from all players for a round."""
     bids = {}
     total_bid = 0
-    print(f"\nEnter bids (0-{num_tricks})")
+    say(f"\nEnter bids (0-{num_tricks})")
 
     for i, player in enumerate(players):
         while True:
             try:
                 remaining = num_tricks - total_bid
                 if i == len(players) - 1:
-                    print(f"Cannot bid {remaining}")
-                bid = int(input(f"{player.name}'s bid: "))
+                    say(f"Cannot bid {remaining}")
+                bid = int(ask(f"{player.name}'s bid: "))
                 if bid < 0 or bid > num_tricks:
-                    print(f"Bid must be between 0 and {num_tricks}")
+                    say(f"Bid must be between 0 and {num_tricks}")
                     continue
                 if i == len(players) - 1 and bid == remaining:
-                    print("Last player cannot make bids sum to total tricks")
+                    say("Last player cannot make bids sum to total tricks")
                     continue
                 bids[player] = bid
                 total_bid += bid
                 break
             except ValueError:
-                print("Please enter a number")
+                say("Please enter a number")
 
     return bids
 
-def play_round_loop(round: GameRound) -> None:
-    """Main game loop for playing a single round."""
-    current_player_idx = 0
 
-    if round.trump_suit:
-        print(f"\nTrump suit for this round: {Card._suit_symbols[round.trump_suit]}")
+class TerminalSink(EventSink):
+    """Renders game events as the CLI's human-readable output."""
+
+    def emit(self, event: Event) -> None:
+        if isinstance(event, GameStarted):
+            say("Starting new game with players:", ", ".join(event.players))
+        elif isinstance(event, RoundStarted):
+            say(f"\n=== Round {event.round_num} of {event.num_rounds} ===")
+            say(f"Cards per player: {event.cards_per_player}")
+            say(f"Trump suits: {'Enabled' if event.use_trump else 'Disabled'}")
+            say(f"Scoring: {event.scoring}")
+        elif isinstance(event, Deal):
+            if event.trump is not None:
+                say(
+                    f"\nTrump suit for this round: {Card._suit_symbols[event.trump.suit]}"
+                )
+        elif isinstance(event, TrickWon):
+            say("\nCompleted trick:")
+            for name, card in zip(event.players, event.cards):
+                say(f"{name}: {card}")
+            say()
+            say(f"\n{event.winner} wins the trick!")
+        elif isinstance(event, RoundScored):
+            say("\nRound Over!")
+            for name, tricks in zip(event.players, event.tricks):
+                say(f"{name}: {tricks} tricks")
+            say(f"\nScores after round {event.round_num}:")
+            say("Round scores:")
+            for name, points in zip(event.players, event.points):
+                say(f"{name}: {points}")
+            say("\nTotal scores:")
+            for name, total in zip(event.players, event.totals):
+                say(f"{name}: {total}")
+        elif isinstance(event, GameOver):
+            say("\n=== Final Scores ===")
+            # Sort players by score
+            ranking = sorted(
+                zip(event.players, event.totals), key=lambda p: p[1], reverse=True
+            )
+            for i, (name, total) in enumerate(ranking, 1):
+                say(f"{i}. {name}: {total}")
 
-    while not round.is_over():
-        print("\n" + "=" * 40)
-        current_player = round.players[current_player_idx]
-        print(f"\nCurrent player: {current_player.name}")
+
+def play_round_loop(round: GameRound) -> None:
+    """
+    Main game loop for playing a single round interactively.
+    Deals and completed tricks are shown by the round's event sink.
+    """
+    while round.phase == Phase.PLAYING:
+        say("\n" + "=" * 40)
+        current_player = round.to_move
+        say(f"\nCurrent player: {current_player.name}")
 
         if round.trump_suit:
-            print(f"Trump suit: {Card._suit_symbols[round.trump_suit]}")
+            say(f"Trump suit: {Card._suit_symbols[round.trump_suit]}")
 
         if round.current_trick:
-            print("\nCurrent trick:")
+            say("\nCurrent trick:")
             for played_card in round.current_trick:
-                print(f"{played_card.player.name}: {played_card.card}")
-
-        while True:
-            playable_indices, hand = print_hand(round, current_player)
-            if not playable_indices:
-                print("No playable cards!")
-                break
-            card = get_card_choice(playable_indices, hand)
-            error = round.check_play_validity(current_player, card)
-            if error is None:
-                round.play_card(current_player, card)
-                break
-            print(f"Invalid play: {error}")
+                say(f"{played_card.player.name}: {played_card.card}")
 
-        if len(round.current_trick) == len(round.players):
-            print("\nCompleted trick:")
-            for played_card in round.current_trick:
-                print(f"{played_card.player.name}: {played_card.card}")
-            print()
-            try:
-                winner = round.evaluate_trick()
-                print(f"\n{winner.name} wins the trick!")
-                current_player_idx = round.players.index(winner)
-            except ValueError as e:
-                print(f"Error: {e}")
-        else:
-            current_player_idx = (current_player_idx + 1) % len(round.players)
+        playable_indices, hand = print_hand(round, current_player)
+        if not playable_indices:
+            say("No playable cards!")
+            break
+        round.step(get_card_choice(playable_indices, hand))
@@ -0,0 +1,117 @@
+import random
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+import numpy as np
+from src.ml.inference import InferenceBroker
+from src.models.card import Card, Suit
+from src.models.deck import Deck
+from src.models.game_round import GameRound, legal_bids
+from src.models.player import Player
+
+NUM_CARDS = Deck.STANDARD_DECK_SIZE
+MAX_BID = (Deck.STANDARD_DECK_SIZE - 1) // 2  # Most tricks in any round
+OBSERVATION_SIZE = 2 * NUM_CARDS + len(Suit) + 1 + 2
+ACTION_SIZE = NUM_CARDS + MAX_BID + 1
+
+
+def encode_observation(
+    round: GameRound, player: Player, bidding: bool = False
+) -> np.ndarray:
+    """
+    Encode what a player can see as a flat float vector:
+    own hand, cards in the current trick, trump suit (or none),
+    a bidding-phase flag, and the number of cards left in hand.
+    """
+    obs = np.zeros(OBSERVATION_SIZE, dtype=np.float32)
+    hand = round.get_hand(player)
+    for card in hand:
+        obs[card.index] = 1.0
+    for played in round.current_trick:
+        obs[NUM_CARDS + played.card.index] = 1.0
+    offset = 2 * NUM_CARDS
+    trump_slot = round.trump_suit.value - 1 if round.trump_suit else len(Suit)
+    obs[offset + trump_slot] = 1.0
+    offset += len(Suit) + 1
+    obs[offset] = float(bidding)
+    obs[offset + 1] = len(hand) / MAX_BID
+    return obs
+
+
+class Agent(ABC):
+    """A non-interactive decision maker that can occupy a seat."""
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        """Called before each round; agents with internal randomness reseed here."""
+        pass
+
+    @abstractmethod
+    def choose_bid(
+        self,
+        round: GameRound,
+        player: Player,
+        num_tricks: int,
+        bids: Dict[Player, int],
+    ) -> int:
+        """
+        Choose a bid for a BiddingScorer round.
+        `bids` holds the bids already made by earlier players.
+        """
+        pass
+
+    @abstractmethod
+    def choose_card(self, round: GameRound, player: Player) -> Card:
+        """Choose a card to play. Must be one of round.get_valid_plays(player)."""
+        pass
+
+
+class RandomAgent(Agent):
+    """Bids and plays uniformly at random among legal options."""
+
+    def __init__(self, seed: Optional[int] = None):
+        self._rng = random.Random(seed)
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        if seed is not None:
+            self._rng.seed(seed)
+
+    def choose_bid(
+        self,
+        round: GameRound,
+        player: Player,
+        num_tricks: int,
+        bids: Dict[Player, int],
+    ) -> int:
+        is_last = len(bids) == len(round.players) - 1
+        return self._rng.choice(legal_bids(num_tricks, bids, is_last))
+
+    def choose_card(self, round: GameRound, player: Player) -> Card:
+        return self._rng.choice(round.get_valid_plays(player))
+
+
+class PolicyAgent(Agent):
+    """
+    Acts greedily on the logits of a neural policy served by an
+    InferenceBroker. The first NUM_CARDS outputs score cards by
+    Card.index, the rest score bids 0..MAX_BID. Illegal actions are
+    masked out before the argmax.
+    """
+
+    def __init__(self, broker: InferenceBroker):
+        self.broker = broker
+
+    def choose_bid(
+        self,
+        round: GameRound,
+        player: Player,
+        num_tricks: int,
+        bids: Dict[Player, int],
+    ) -> int:
+        is_last = len(bids) == len(round.players) - 1
+        options = legal_bids(num_tricks, bids, is_last)
+        logits = self.broker.infer(encode_observation(round, player, bidding=True))
+        return max(options, key=lambda bid: logits[NUM_CARDS + bid])
+
+    def choose_card(self, round: GameRound, player: Player) -> Card:
+        options = round.get_valid_plays(player)
+        logits = self.broker.infer(encode_observation(round, player))
+        return max(options, key=lambda card: logits[card.index])
@@ -0,0 +1,313 @@
+import argparse
+import os
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from src.ml.agent import MAX_BID, Agent, RandomAgent
+from src.models.card import Card, Rank, Suit
+from src.models.deck import Deck
+from src.models.game_round import GameRound, HistoryMode, Phase, legal_bids
+from src.models.player import Player
+
+DEFAULT_WEIGHTS = os.path.join(
+    os.path.dirname(__file__), "weights", "bid_predictor.npz"
+)
+
+# Tricks taken can be anything from 0 to the most cards anyone holds
+NUM_CLASSES = MAX_BID + 1
+
+FEATURE_NAMES = (
+    "trumps",
+    "trump_honours",
+    "side_aces",
+    "side_kings",
+    "side_queens",
+    "side_jacks",
+    "voids",
+    "singletons",
+    "longest_side_suit",
+    "seat",
+    "players",
+    "cards_per_player",
+    "fair_share",
+)
+FEATURE_SIZE = len(FEATURE_NAMES)
+
+
+def hand_features(
+    hand: Sequence[Card],
+    trump_suit: Optional[Suit],
+    seat: int,
+    num_players: int,
+) -> np.ndarray:
+    """
+    Summarise a dealt hand for bid prediction: trump length and honours,
+    side-suit high cards, suit shape, and where the seat sits at the table.
+    `seat` counts from the player who leads the first trick.
+    """
+    lengths = {suit: 0 for suit in Suit}
+    trump_honours = 0
+    side_high = [0, 0, 0, 0]  # Aces, kings, queens, jacks outside trumps
+    for card in hand:
+        lengths[card.suit] += 1
+        if card.rank.value < Rank.JACK.value:
+            continue
+        if card.suit == trump_suit:
+            trump_honours += 1
+        else:
+            side_high[Rank.ACE.value - card.rank.value] += 1
+
+    side = [n for suit, n in lengths.items() if suit != trump_suit]
+    # A void only helps a hand that holds trumps to ruff with
+    return np.array(
+        [
+            lengths[trump_suit] if trump_suit else 0,
+            trump_honours,
+            *side_high,
+            sum(n == 0 for n in side) if trump_suit else 0,
+            sum(n == 1 for n in side),
+            max(side),
+            seat / (num_players - 1),
+            num_players,
+            len(hand),
+            len(hand) / num_players,
+        ],
+        dtype=np.float64,
+    )
+
+
+class BidPredictor:
+    """
+    Multinomial logistic regression from hand_features to the number of
+    tricks a hand will take. Features are standardised with the training
+    mean and scale, which are stored with the weights.
+    """
+
+    def __init__(
+        self,
+        weights: np.ndarray,
+        bias: np.ndarray,
+        mean: np.ndarray,
+        scale: np.ndarray,
+    ):
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.bias = np.asarray(bias, dtype=np.float64)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+
+    @classmethod
+    def fit(
+        cls,
+        features: np.ndarray,
+        tricks: np.ndarray,
+        epochs: int = 300,
+        learning_rate: float = 0.5,
+        l2: float = 1e-4,
+    ) -> "BidPredictor":
+        """Fit by full-batch gradient descent on the cross-entropy loss."""
+        features = np.asarray(features, dtype=np.float64)
+        tricks = np.asarray(tricks, dtype=np.int64)
+        mean = features.mean(axis=0)
+        scale = features.std(axis=0)
+        scale[scale == 0] = 1.0
+        x = (features - mean) / scale
+        targets = np.zeros((len(tricks), NUM_CLASSES))
+        targets[np.arange(len(tricks)), tricks] = 1.0
+        # Never put mass on more tricks than there are cards in hand
+        mask = (
+            np.arange(NUM_CLASSES)
+            > features[:, [FEATURE_NAMES.index("cards_per_player")]]
+        )
+
+        weights = np.zeros((x.shape[1], NUM_CLASSES))
+        bias = np.zeros(NUM_CLASSES)
+        for _ in range(epochs):
+            probs = _softmax(x @ weights + bias, mask)
+            error = (probs - targets) / len(x)
+            weights -= learning_rate * (x.T @ error + l2 * weights)
+            bias -= learning_rate * error.sum(axis=0)
+        return cls(weights, bias, mean, scale)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_WEIGHTS) -> "BidPredictor":
+        with np.load(path) as data:
+            return cls(data["weights"], data["bias"], data["mean"], data["scale"])
+
+    def save(self, path: str) -> None:
+        np.savez(
+            path,
+            weights=self.weights,
+            bias=self.bias,
+            mean=self.mean,
+            scale=self.scale,
+        )
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        """
+        Trick distributions for a (N, FEATURE_SIZE) batch, or a single
+        distribution for one feature vector.
+        """
+        features = np.asarray(features, dtype=np.float64)
+        x = (features - self.mean) / self.scale
+        cards = features[..., FEATURE_NAMES.index("cards_per_player"), None]
+        return _softmax(x @ self.weights + self.bias, np.arange(NUM_CLASSES) > cards)
+
+    def predict_hand(
+        self,
+        hand: Sequence[Card],
+        trump_suit: Optional[Suit],
+        seat: int,
+        num_players: int,
+    ) -> np.ndarray:
+        return self.predict(hand_features(hand, trump_suit, seat, num_players))
+
+
+def _softmax(logits: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    logits = np.where(mask, -np.inf, logits)
+    logits = logits - logits.max(axis=-1, keepdims=True)
+    exp = np.exp(logits)
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+def best_bid(distribution: np.ndarray, options: Sequence[int]) -> int:
+    """The legal bid with the highest expected BiddingScorer points."""
+    return max(options, key=lambda bid: distribution[bid] * (10 + bid))
+
+
+class BidPredictorAgent(Agent):
+    """
+    Bids from a BidPredictor, taking the legal bid with the best expected
+    BiddingScorer score, and delegates card play to another agent.
+    """
+
+    def __init__(self, predictor: BidPredictor, player: Optional[Agent] = None):
+        self.predictor = predictor
+        self.player = player if player is not None else RandomAgent()
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        self.player.reset(seed)
+
+    def choose_bid(
+        self,
+        round: GameRound,
+        player: Player,
+        num_tricks: int,
+        bids: Dict[Player, int],
+    ) -> int:
+        is_last = len(bids) == len(round.players) - 1
+        distribution = self.predictor.predict_hand(
+            round.get_hand(player),
+            round.trump_suit,
+            round.players.index(player),
+            len(round.players),
+        )
+        return best_bid(distribution, legal_bids(num_tricks, bids, is_last))
+
+    def choose_card(self, round: GameRound, player: Player) -> Card:
+        return self.player.choose_card(round, player)
+
+
+def _play_out(round: GameRound, agents: Sequence[Agent]) -> List[int]:
+    while round.phase != Phase.OVER:
+        seat = round.to_move_index
+        round.step(agents[seat].choose_card(round, round.players[seat]))
+    return [round.trick_count(player) for player in round.players]
+
+
+def simulate_rounds(
+    num_rounds: int,
+    seed: Optional[int] = None,
+    player_counts: Sequence[int] = (2, 3, 4),
+    cards_range: Tuple[int, int] = (1, 12),
+    agents: Optional[Sequence[Agent]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Training data: deal and play out random rounds, returning one row of
+    hand features per seat and the tricks that seat went on to take.
+    Play uses `agents` (one per seat of the largest table) or random play.
+    """
+    rng = random.Random(seed)
+    if agents is None:
+        agents = [RandomAgent(rng.getrandbits(32)) for _ in range(max(player_counts))]
+    features, tricks = [], []
+    for _ in range(num_rounds):
+        num_players = rng.choice(player_counts)
+        max_cards = min(cards_range[1], (Deck.STANDARD_DECK_SIZE - 1) // num_players)
+        cards = rng.randint(cards_range[0], max_cards)
+        use_trump = rng.random() < 0.5
+
+        round = GameRound(
+            [f"Seat {i + 1}" for i in range(num_players)], history=HistoryMode.COUNTS
+        )
+        round.setup_round(cards, trump=use_trump, deck=Deck.standard_deck(rng))
+        for seat, player in enumerate(round.players):
+            features.append(
+                hand_features(
+                    round.get_hand(player), round.trump_suit, seat, num_players
+                )
+            )
+        tricks.extend(_play_out(round, agents[:num_players]))
+    return np.array(features), np.array(tricks)
+
+
+def simulate_distribution(
+    hand: Sequence[Card],
+    trump_card: Optional[Card],
+    seat: int,
+    num_players: int,
+    samples: int = 200,
+    rng: Optional[random.Random] = None,
+    agents: Optional[Sequence[Agent]] = None,
+) -> np.ndarray:
+    """
+    The slow baseline: estimate a hand's trick distribution by dealing the
+    unseen cards to the other seats `samples` times and playing each deal
+    out. Returns a length NUM_CLASSES probability vector.
+    """
+    rng = rng or random.Random()
+    if agents is None:
+        agents = [RandomAgent(rng.getrandbits(32)) for _ in range(num_players)]
+    known = {card.index for card in hand}
+    if trump_card is not None:
+        known.add(trump_card.index)
+    unseen = [
+        Card(suit, rank)
+        for suit in Suit
+        for rank in Rank
+        if Card(suit, rank).index not in known
+    ]
+    cards = len(hand)
+    counts = np.zeros(NUM_CLASSES)
+    for _ in range(samples):
+        rng.shuffle(unseen)
+        hands = [unseen[i * cards : (i + 1) * cards] for i in range(num_players - 1)]
+        hands.insert(seat, list(hand))
+        # setup_round deals seat 0 from the top of the deck, then the trump
+        order = [trump_card] if trump_card else []
+        for dealt in reversed(hands):
+            order.extend(dealt)
+        round = GameRound(
+            [f"Seat {i + 1}" for i in range(num_players)], history=HistoryMode.COUNTS
+        )
+        round.setup_round(cards, trump=trump_card is not None, deck=Deck(order))
+        counts[_play_out(round, agents)[seat]] += 1
+    return counts / samples
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train the bid predictor")
+    parser.add_argument("--rounds", type=int, default=20000)
+    parser.add_argument("--epochs", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=DEFAULT_WEIGHTS)
+    args = parser.parse_args(argv)
+
+    features, tricks = simulate_rounds(args.rounds, seed=args.seed)
+    predictor = BidPredictor.fit(features, tricks, epochs=args.epochs)
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    predictor.save(args.out)
+    print(f"Trained on {len(tricks)} hands, saved to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
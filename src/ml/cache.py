@@ -0,0 +1,145 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, MutableMapping, Optional, Tuple
+from src.ml.agent import Agent
+from src.models.card import Card
+from src.models.game_round import GameRound
+from src.models.player import Player
+
+BID = 0
+CARD = 1
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    shared_hits: int = 0
+    misses: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.shared_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return (self.hits + self.shared_hits) / self.lookups if self.lookups else 0.0
+
+
+def _hand_mask(hand) -> int:
+    mask = 0
+    for card in hand:
+        mask |= 1 << card.uid
+    return mask
+
+
+def information_set_key(
+    round: GameRound, player: Player, bids: Optional[Dict[Player, int]] = None
+) -> Tuple[Hashable, ...]:
+    """
+    Canonical key for everything `player` knows at a decision: seat and
+    table size, own hand, every card played so far, the current trick in
+    play order, trump suit, the bids and each seat's tricks taken.
+    Hand and played cards are bitmasks, so card order never matters.
+    Pass `bids` for a bidding decision, where they are the bids so far.
+    """
+    players = round.players
+    kind = CARD if bids is None else BID
+    if bids is None:
+        bids = round.bids or {}
+    return (
+        kind,
+        players.index(player),
+        len(players),
+        _hand_mask(round.get_hand(player)),
+        round.played_mask,
+        tuple(played.card.uid for played in round.current_trick),
+        round.trump_suit.value if round.trump_suit else 0,
+        tuple(bids.get(p, -1) for p in players),
+        tuple(round.trick_count(p) for p in players),
+    )
+
+
+class CachedAgent(Agent):
+    """
+    Serves repeat decisions of a deterministic agent from a cache.
+
+    Decisions are keyed by information_set_key and kept in an LRU of at
+    most `max_size` entries. An optional `shared` mapping, such as a
+    multiprocessing.Manager().dict(), is consulted on local misses and
+    filled with every fresh decision, so workers in a tournament reuse
+    each other's answers. Cards are stored as Card.uid, which keeps
+    entries small and cheap to ship between processes.
+
+    Only wrap agents whose decisions depend on nothing but the
+    information set; a cached answer is returned even after reset().
+    """
+
+    def __init__(
+        self,
+        agent: Agent,
+        max_size: int = 100_000,
+        shared: Optional[MutableMapping] = None,
+    ):
+        self.agent = agent
+        self.max_size = max_size
+        self.shared = shared
+        self.stats = CacheStats()
+        self._cache: "OrderedDict[Tuple, int]" = OrderedDict()
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        self.agent.reset(seed)
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def _lookup(self, key: Tuple) -> Optional[int]:
+        action = self._cache.get(key)
+        if action is not None:
+            self._cache.move_to_end(key)
+            self.stats.hits += 1
+            return action
+        if self.shared is not None:
+            action = self.shared.get(key)
+            if action is not None:
+                self.stats.shared_hits += 1
+                self._store(key, action, share=False)
+                return action
+        self.stats.misses += 1
+        return None
+
+    def _store(self, key: Tuple, action: int, share: bool = True) -> None:
+        self._cache[key] = action
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        if share and self.shared is not None:
+            self.shared[key] = action
+
+    def choose_bid(
+        self,
+        round: GameRound,
+        player: Player,
+        num_tricks: int,
+        bids: Dict[Player, int],
+    ) -> int:
+        key = information_set_key(round, player, bids) + (num_tricks,)
+        bid = self._lookup(key)
+        if bid is None:
+            bid = self.agent.choose_bid(round, player, num_tricks, bids)
+            self._store(key, bid)
+        return bid
+
+    def choose_card(self, round: GameRound, player: Player) -> Card:
+        key = information_set_key(round, player)
+        uid = self._lookup(key)
+        if uid is None:
+            card = self.agent.choose_card(round, player)
+            self._store(key, card.uid)
+            return card
+        for card in round.get_hand(player):
+            if card.uid == uid:
+                return card
+        raise ValueError(f"Cached card {uid} is not in {player.name}'s hand")
@@ -0,0 +1,403 @@
+from collections import defaultdict
+from itertools import combinations
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from src.models.card import Card, Suit
+from src.models.game_round import legal_bids, trick_winner_index
+from src.models.scoring import BiddingScorer
+
+CHANCE = -1
+TERMINAL = 2
+
+# A history is the public action sequence: both bids, then every card played
+History = Tuple[Union[int, Card], ...]
+
+
+class CFRSolver:
+    """
+    CFR / CFR+ solver for two-player BiddingScorer rounds.
+
+    The game is the full round: a uniform deal of cards_per_player cards
+    to each player from `cards`, bidding in seat order (the last bid may
+    not make the bids sum to the tricks), then trick play with player 0
+    leading. It is solved as the zero-sum game on the BiddingScorer score
+    difference (player 0's points minus player 1's).
+
+    The game tree is built once into flat per-depth edge arrays, and
+    every information set gets a dense index into preallocated
+    (num_infosets, num_actions) regret and strategy-sum arrays, so an
+    iteration is a handful of vectorised passes per tree depth.
+    Bid actions use their value as the slot; card actions use the card's
+    position in the player's sorted initial hand.
+    """
+
+    def __init__(
+        self,
+        cards: Sequence[Card],
+        cards_per_player: int,
+        trump_suit: Optional[Suit] = None,
+        plus: bool = True,
+    ):
+        if not 1 <= cards_per_player <= 4:
+            raise ValueError("CFR supports 1-4 cards per player")
+        if len(cards) < 2 * cards_per_player:
+            raise ValueError(f"Not enough cards for {cards_per_player} per player")
+
+        self.cards = sorted(cards, key=lambda c: c.index)
+        self.cards_per_player = cards_per_player
+        self.trump_suit = trump_suit
+        self.plus = plus
+        self.num_actions = cards_per_player + 1
+        self.iterations = 0
+
+        self._build_tree()
+        self.regrets = np.zeros((self.num_infosets, self.num_actions))
+        self.strategy_sum = np.zeros((self.num_infosets, self.num_actions))
+
+    # Tree construction
+
+    def _build_tree(self) -> None:
+        self._node_player: List[int] = []
+        self._node_infoset: List[int] = []
+        self._edges: Dict[int, List[Tuple[int, int, int]]] = defaultdict(list)
+        self._terminals: List[Tuple[int, int, int, int, int]] = []
+        self._infoset_ids: Dict[tuple, int] = {}
+        self.infoset_keys: List[Tuple[int, Tuple[int, ...], tuple]] = []
+        self._infoset_first_node: List[int] = []
+        self._infoset_actions: List[List[int]] = []
+
+        root = self._new_node(CHANCE)
+        deals = []
+        for hand0 in combinations(range(len(self.cards)), self.cards_per_player):
+            rest = [c for c in range(len(self.cards)) if c not in hand0]
+            for hand1 in combinations(rest, self.cards_per_player):
+                deals.append(self._expand(1, (hand0, hand1)))
+        self._root = root
+        self._deals = np.array(deals)
+        self._finalize()
+
+    def _new_node(self, player: int) -> int:
+        self._node_player.append(player)
+        self._node_infoset.append(-1)
+        return len(self._node_player) - 1
+
+    def _infoset(
+        self,
+        player: int,
+        hand: Tuple[int, ...],
+        history: tuple,
+        node: int,
+        actions: List[int],
+    ) -> int:
+        key = (player, hand, history)
+        infoset = self._infoset_ids.get(key)
+        if infoset is None:
+            infoset = len(self.infoset_keys)
+            self._infoset_ids[key] = infoset
+            self.infoset_keys.append(key)
+            self._infoset_first_node.append(node)
+            self._infoset_actions.append(actions)
+        return infoset
+
+    def _expand(
+        self,
+        depth: int,
+        hands: Tuple[Tuple[int, ...], Tuple[int, ...]],
+        remaining: Optional[List[Tuple[int, ...]]] = None,
+        history: tuple = (),
+        tricks: Tuple[int, int] = (0, 0),
+        trick: Tuple[int, ...] = (),
+        leader: int = 0,
+    ) -> int:
+        """Create the node for this state and its subtree; returns its id."""
+        if remaining is None:
+            remaining = list(hands)
+
+        # Bidding phase: history holds only bids until both are made
+        if len(history) < 2:
+            player = len(history)
+            bids = {p: history[p] for p in range(player)}
+            actions = legal_bids(self.cards_per_player, bids, is_last=player == 1)
+            node = self._new_node(player)
+            self._node_infoset[node] = self._infoset(
+                player, hands[player], history, node, actions
+            )
+            for bid in actions:
+                child = self._expand(
+                    depth + 1, hands, remaining, history + (bid,), tricks, trick, leader
+                )
+                self._edges[depth].append((node, child, bid))
+            return node
+
+        if not remaining[0] and not remaining[1] and not trick:
+            node = self._new_node(TERMINAL)
+            self._terminals.append((node, tricks[0], tricks[1], history[0], history[1]))
+            return node
+
+        player = (leader + len(trick)) % 2
+        hand = remaining[player]
+        playable = hand
+        if trick:
+            led_suit = self.cards[trick[0]].suit
+            following = tuple(c for c in hand if self.cards[c].suit == led_suit)
+            playable = following or hand
+        slots = [hands[player].index(c) for c in playable]
+        node = self._new_node(player)
+        self._node_infoset[node] = self._infoset(
+            player, hands[player], history, node, slots
+        )
+
+        for card, slot in zip(playable, slots):
+            next_remaining = list(remaining)
+            next_remaining[player] = tuple(c for c in hand if c != card)
+            next_trick = trick + (card,)
+            next_tricks, next_leader = tricks, leader
+            if len(next_trick) == 2:
+                winner_offset = trick_winner_index(
+                    [self.cards[c] for c in next_trick], self.trump_suit
+                )
+                next_leader = (leader + winner_offset) % 2
+                next_tricks = tuple(
+                    t + (p == next_leader) for p, t in enumerate(tricks)
+                )
+                next_trick = ()
+            child = self._expand(
+                depth + 1,
+                hands,
+                next_remaining,
+                history + (card,),
+                next_tricks,
+                next_trick,
+                next_leader,
+            )
+            self._edges[depth].append((node, child, slot))
+        return node
+
+    def _finalize(self) -> None:
+        """Convert the build-time lists into the arrays used by iterations."""
+        self.num_nodes = len(self._node_player)
+        self.num_infosets = len(self.infoset_keys)
+        self._player = np.array(self._node_player, dtype=np.int8)
+        self._infoset_of = np.array(self._node_infoset, dtype=np.int64)
+        self._first_node = np.array(self._infoset_first_node, dtype=np.int64)
+        self._infoset_player = np.array(
+            [k[0] for k in self.infoset_keys], dtype=np.int8
+        )
+
+        self._mask = np.zeros((self.num_infosets, self.num_actions), dtype=bool)
+        for infoset, actions in enumerate(self._infoset_actions):
+            self._mask[infoset, actions] = True
+
+        terminals = np.array(self._terminals, dtype=np.int64)
+        self._terminal_nodes = terminals[:, 0]
+        tricks, bids = terminals[:, 1:3], terminals[:, 3:5]
+        points = BiddingScorer().score_batch(tricks, bids)
+        self._terminal_utility = (points[:, 0] - points[:, 1]).astype(np.float64)
+
+        self._levels = []
+        for depth in sorted(self._edges):
+            edges = np.array(self._edges[depth], dtype=np.int64)
+            parents, local = np.unique(edges[:, 0], return_inverse=True)
+            self._levels.append(
+                {
+                    "parents": parents,
+                    "local": local,
+                    "parent": edges[:, 0],
+                    "child": edges[:, 1],
+                    "flat": self._infoset_of[edges[:, 0]] * self.num_actions
+                    + edges[:, 2],
+                    "player": self._player[edges[:, 0]].astype(np.int64),
+                }
+            )
+
+        # Drop build-time structures that iterations never touch
+        del self._node_player, self._node_infoset, self._edges, self._terminals
+        del self._infoset_first_node, self._infoset_actions
+
+    # Strategies
+
+    def _normalize(self, weights: np.ndarray) -> np.ndarray:
+        weights = np.where(self._mask, weights, 0.0)
+        totals = weights.sum(axis=1, keepdims=True)
+        uniform = self._mask / self._mask.sum(axis=1, keepdims=True)
+        return np.where(
+            totals > 0, weights / np.where(totals > 0, totals, 1.0), uniform
+        )
+
+    def current_strategy(self) -> np.ndarray:
+        """Regret-matching strategy, shape (num_infosets, num_actions)."""
+        return self._normalize(np.maximum(self.regrets, 0.0))
+
+    def average_strategy(self) -> np.ndarray:
+        """The average strategy, which converges to an equilibrium."""
+        return self._normalize(self.strategy_sum)
+
+    # Tree passes
+
+    def _reach(self, strategy: np.ndarray, players=(0, 1)) -> np.ndarray:
+        """
+        Top-down reach probabilities, shape (num_nodes, 3): the
+        contributions of player 0, player 1 and chance. Only the actions
+        of `players` are weighted by the strategy.
+        """
+        reach = np.ones((self.num_nodes, 3))
+        reach[self._deals, 2] = 1.0 / len(self._deals)
+        flat_strategy = strategy.ravel()
+        for level in self._levels:
+            parent, child, player = level["parent"], level["child"], level["player"]
+            reach[child] = reach[parent]
+            probs = flat_strategy[level["flat"]]
+            for p in players:
+                acting = player == p
+                reach[child[acting], p] *= probs[acting]
+        return reach
+
+    def _values(self, strategy: np.ndarray) -> np.ndarray:
+        """Expected utility for player 0 at every node under `strategy`."""
+        values = np.zeros(self.num_nodes)
+        values[self._terminal_nodes] = self._terminal_utility
+        flat_strategy = strategy.ravel()
+        for level in reversed(self._levels):
+            weighted = flat_strategy[level["flat"]] * values[level["child"]]
+            values[level["parents"]] = np.bincount(
+                level["local"], weights=weighted, minlength=len(level["parents"])
+            )
+        values[self._root] = values[self._deals].mean()
+        return values
+
+    def iterate(self) -> None:
+        """Run one simultaneous-update CFR (or CFR+) iteration."""
+        self.iterations += 1
+        strategy = self.current_strategy()
+        reach = self._reach(strategy)
+        values = self._values(strategy)
+
+        size = self.num_infosets * self.num_actions
+        instant = np.zeros(size)
+        for level in self._levels:
+            parent, child, player = level["parent"], level["child"], level["player"]
+            sign = np.where(player == 0, 1.0, -1.0)
+            opponent_reach = reach[parent, 1 - player] * reach[parent, 2]
+            gain = opponent_reach * sign * (values[child] - values[parent])
+            instant += np.bincount(level["flat"], weights=gain, minlength=size)
+
+        self.regrets += instant.reshape(self.regrets.shape)
+        if self.plus:
+            np.maximum(self.regrets, 0.0, out=self.regrets)
+
+        own_reach = reach[self._first_node, self._infoset_player]
+        weight = self.iterations if self.plus else 1.0
+        self.strategy_sum += weight * own_reach[:, None] * strategy
+
+    def solve(
+        self,
+        iterations: int,
+        callback: Optional[Callable[["CFRSolver"], None]] = None,
+    ) -> np.ndarray:
+        """Run iterations and return the average strategy."""
+        for _ in range(iterations):
+            self.iterate()
+            if callback is not None:
+                callback(self)
+        return self.average_strategy()
+
+    def game_value(self, strategy: Optional[np.ndarray] = None) -> float:
+        """Expected score difference for player 0 when both play `strategy`."""
+        if strategy is None:
+            strategy = self.average_strategy()
+        return float(self._values(strategy)[self._root])
+
+    def best_response_value(self, player: int, strategy: np.ndarray) -> float:
+        """Best expected utility `player` can get against the opponent's `strategy`."""
+        opponent = 1 - player
+        reach = self._reach(strategy, players=(opponent,))
+        sign = 1.0 if player == 0 else -1.0
+        values = np.zeros(self.num_nodes)
+        values[self._terminal_nodes] = sign * self._terminal_utility
+        flat_strategy = strategy.ravel()
+        size = self.num_infosets * self.num_actions
+
+        for level in reversed(self._levels):
+            parent, child, flat = level["parent"], level["child"], level["flat"]
+            mine = level["player"] == player
+
+            # Opponent nodes: expectation under their strategy
+            theirs = ~mine
+            weighted = np.where(theirs, flat_strategy[flat] * values[child], 0.0)
+            level_values = np.bincount(
+                level["local"], weights=weighted, minlength=len(level["parents"])
+            )
+
+            # Own nodes: one action per infoset, chosen on counterfactual value
+            if mine.any():
+                cf_reach = reach[parent, opponent] * reach[parent, 2]
+                action_values = np.bincount(
+                    flat[mine],
+                    weights=cf_reach[mine] * values[child[mine]],
+                    minlength=size,
+                ).reshape(self.num_infosets, self.num_actions)
+                action_values[~self._mask] = -np.inf
+                best = action_values.argmax(axis=1)
+                chosen = mine & (
+                    flat % self.num_actions == best[flat // self.num_actions]
+                )
+                level_values += np.bincount(
+                    level["local"][chosen],
+                    weights=values[child[chosen]],
+                    minlength=len(level["parents"]),
+                )
+            values[level["parents"]] = level_values
+
+        return float(values[self._deals].mean())
+
+    def exploitability(self, strategy: Optional[np.ndarray] = None) -> float:
+        """
+        Mean gain of a best response against each side of `strategy`
+        (NashConv / 2). Zero exactly at an equilibrium.
+        """
+        if strategy is None:
+            strategy = self.average_strategy()
+        return (
+            self.best_response_value(0, strategy)
+            + self.best_response_value(1, strategy)
+        ) / 2
+
+    # Lookups
+
+    def infoset_index(self, player: int, hand: Sequence[Card], history: History) -> int:
+        """Dense index of the information set for a hand and public history."""
+        positions = tuple(sorted(self.cards.index(card) for card in hand))
+        encoded = tuple(
+            a if isinstance(a, int) else self.cards.index(a) for a in history
+        )
+        key = (player, positions, encoded)
+        if key not in self._infoset_ids:
+            raise ValueError("Unknown information set")
+        return self._infoset_ids[key]
+
+    def policy_strategy(
+        self,
+        choose: Callable[
+            [int, Tuple[Card, ...], History, List[Union[int, Card]]], Union[int, Card]
+        ],
+    ) -> np.ndarray:
+        """
+        Tabulate a deterministic policy as a strategy array, e.g. to
+        measure a heuristic's exploitability. `choose` gets the player,
+        their initial hand, the public history and the legal actions.
+        """
+        strategy = np.zeros((self.num_infosets, self.num_actions))
+        for infoset, (player, positions, encoded) in enumerate(self.infoset_keys):
+            hand = tuple(self.cards[c] for c in positions)
+            history = tuple(
+                a if i < 2 else self.cards[a] for i, a in enumerate(encoded)
+            )
+            slots = np.flatnonzero(self._mask[infoset])
+            if len(history) < 2:
+                actions = [int(s) for s in slots]
+                slot = choose(player, hand, history, actions)
+            else:
+                actions = [hand[s] for s in slots]
+                slot = hand.index(choose(player, hand, history, actions))
+            strategy[infoset, slot] = 1.0
+        return strategy
@@ -0,0 +1,181 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+from src.models.card import Card, Rank, Suit
+
+RANKS = len(Rank)
+SUIT_MASKS = [((1 << RANKS) - 1) << (RANKS * s) for s in range(len(Suit))]
+
+
+def hand_mask(cards: Sequence[Card]) -> int:
+    """Bitmask of a hand, one bit per Card.index."""
+    mask = 0
+    for card in cards:
+        mask |= 1 << card.index
+    return mask
+
+
+def trick_winner(cards: Sequence[int], trump: Optional[int]) -> int:
+    """trick_winner_index for card indices, with `trump` as a suit number."""
+    best = cards[0]
+    winner = 0
+    for i in range(1, len(cards)):
+        card = cards[i]
+        suit, best_suit = card // RANKS, best // RANKS
+        # Within a suit, card indices are in rank order
+        if suit == best_suit:
+            if card > best:
+                best, winner = card, i
+        elif suit == trump:
+            best, winner = card, i
+    return winner
+
+
+class DoubleDummySolver:
+    """
+    Perfect-information trick counts for a dealt round.
+
+    tricks(seat) is the number of tricks `seat` can guarantee when every
+    hand is visible and all other seats play together against it, which
+    for two players is the exact minimax value. Search is alpha-beta over
+    card bitmasks, with a transposition table at trick boundaries, and
+    only one card is tried from each run of cards that are equivalent
+    because every card ranked between them is already gone.
+    """
+
+    def __init__(
+        self,
+        hands: Sequence[Sequence[Card]],
+        trump_suit: Optional[Suit] = None,
+        leader: int = 0,
+    ):
+        masks = [hand_mask(hand) for hand in hands]
+        self._start(masks, sum(len(hand) for hand in hands), trump_suit, leader)
+
+    @classmethod
+    def from_indices(
+        cls,
+        hands: Sequence[Sequence[int]],
+        trump_suit: Optional[Suit] = None,
+        leader: int = 0,
+    ) -> "DoubleDummySolver":
+        """Build a solver from hands of Card.index values, skipping Card objects."""
+        solver = cls.__new__(cls)
+        masks = [sum(1 << int(card) for card in hand) for hand in hands]
+        solver._start(masks, sum(len(hand) for hand in hands), trump_suit, leader)
+        return solver
+
+    def _start(
+        self,
+        masks: List[int],
+        num_cards: int,
+        trump_suit: Optional[Suit],
+        leader: int,
+    ) -> None:
+        union = 0
+        for mask in masks:
+            union |= mask
+        # Cards are bits by Card.index, so copies from a second deck collide
+        if bin(union).count("1") != num_cards:
+            raise ValueError("Double-dummy analysis needs a single-deck deal")
+        if len({bin(mask).count("1") for mask in masks}) != 1:
+            raise ValueError("All hands must hold the same number of cards")
+        self.masks = tuple(masks)
+        self.trump = trump_suit.value - 1 if trump_suit else None
+        self.leader = leader
+        self.num_players = len(masks)
+        self.nodes = 0
+
+    def tricks(self, seat: int) -> int:
+        self._seat = seat
+        self._table: Dict[Tuple[Tuple[int, ...], int], Tuple[int, int]] = {}
+        tricks = bin(self.masks[0]).count("1")
+        return self._search(list(self.masks), self.leader, [], 0, tricks + 1)
+
+    def all_tricks(self) -> List[int]:
+        """tricks(seat) for every seat."""
+        return [self.tricks(seat) for seat in range(self.num_players)]
+
+    def _moves(self, hands: List[int], player: int, trick: List[int]) -> List[int]:
+        hand = hands[player]
+        if trick:
+            follow = hand & SUIT_MASKS[trick[0] // RANKS]
+            if follow:
+                hand = follow
+        remaining = 0
+        for mask in hands:
+            remaining |= mask
+        for card in trick:
+            remaining |= 1 << card
+
+        moves = []
+        for suit_mask in SUIT_MASKS:
+            if not hand & suit_mask:
+                continue
+            # Walk the suit's live cards from the top, one bit at a time
+            live = remaining & suit_mask
+            in_run = False
+            while live:
+                bit = 1 << (live.bit_length() - 1)
+                live ^= bit
+                if hand & bit:
+                    if not in_run:
+                        moves.append(bit.bit_length() - 1)
+                    in_run = True
+                else:
+                    in_run = False
+        return moves
+
+    def _search(
+        self, hands: List[int], leader: int, trick: List[int], alpha: int, beta: int
+    ) -> int:
+        """Tricks the seat takes from here on, within the (alpha, beta) window."""
+        self.nodes += 1
+        n = self.num_players
+        if len(trick) == n:
+            winner = (leader + trick_winner(trick, self.trump)) % n
+            won = 1 if winner == self._seat else 0
+            return won + self._search(hands, winner, [], alpha - won, beta - won)
+
+        if not trick:
+            remaining = bin(hands[leader]).count("1")
+            if remaining == 0:
+                return 0
+            key = (tuple(hands), leader)
+            low, high = self._table.get(key, (0, remaining))
+            if low >= beta or low == high:
+                return low
+            if high <= alpha:
+                return high
+            alpha, beta = max(alpha, low), min(beta, high)
+            value = self._search_moves(hands, leader, trick, alpha, beta)
+            if value <= alpha:
+                high = value
+            elif value >= beta:
+                low = value
+            else:
+                low = high = value
+            self._table[key] = (low, high)
+            return value
+
+        return self._search_moves(hands, leader, trick, alpha, beta)
+
+    def _search_moves(
+        self, hands: List[int], leader: int, trick: List[int], alpha: int, beta: int
+    ) -> int:
+        player = (leader + len(trick)) % self.num_players
+        maximising = player == self._seat
+        best = -1 if maximising else RANKS + 1
+        for card in self._moves(hands, player, trick):
+            hands[player] ^= 1 << card
+            trick.append(card)
+            value = self._search(hands, leader, trick, alpha, beta)
+            trick.pop()
+            hands[player] ^= 1 << card
+            if maximising:
+                best = max(best, value)
+                alpha = max(alpha, value)
+            else:
+                best = min(best, value)
+                beta = min(beta, value)
+            if alpha >= beta:
+                break
+        return best
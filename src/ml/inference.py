@@ -0,0 +1,187 @@
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+
+
+class MLP:
+    """A plain ReLU multi-layer perceptron evaluated with NumPy."""
+
+    def __init__(self, layers: Sequence[Tuple[np.ndarray, np.ndarray]]):
+        if not layers:
+            raise ValueError("MLP needs at least one layer")
+        self.layers = [
+            (np.asarray(w, dtype=np.float32), np.asarray(b, dtype=np.float32))
+            for w, b in layers
+        ]
+
+    @classmethod
+    def random(cls, sizes: Sequence[int], seed: Optional[int] = None) -> "MLP":
+        """Create an MLP with He-initialised weights for the given layer sizes."""
+        rng = np.random.default_rng(seed)
+        layers = []
+        for fan_in, fan_out in zip(sizes[:-1], sizes[1:]):
+            w = rng.standard_normal((fan_in, fan_out)) * np.sqrt(2.0 / fan_in)
+            layers.append((w, np.zeros(fan_out)))
+        return cls(layers)
+
+    @classmethod
+    def load(cls, path: str) -> "MLP":
+        with np.load(path) as data:
+            count = len(data.files) // 2
+            return cls([(data[f"w{i}"], data[f"b{i}"]) for i in range(count)])
+
+    def save(self, path: str) -> None:
+        arrays = {}
+        for i, (w, b) in enumerate(self.layers):
+            arrays[f"w{i}"] = w
+            arrays[f"b{i}"] = b
+        np.savez(path, **arrays)
+
+    @property
+    def input_size(self) -> int:
+        return self.layers[0][0].shape[0]
+
+    @property
+    def output_size(self) -> int:
+        return self.layers[-1][0].shape[1]
+
+    def forward(self, x: np.ndarray) -> np.ndarray:
+        """Map a (batch, input_size) array to (batch, output_size) logits."""
+        h = np.asarray(x, dtype=np.float32)
+        for w, b in self.layers[:-1]:
+            h = np.maximum(h @ w + b, 0.0)
+        w, b = self.layers[-1]
+        return h @ w + b
+
+
+@dataclass
+class BrokerStats:
+    requests: int = 0
+    batches: int = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.requests / self.batches if self.batches else 0.0
+
+
+_STOP = object()
+
+
+class InferenceBroker:
+    """
+    Collects observations from many concurrent games and evaluates them
+    in micro-batches. A batch is dispatched once it holds max_batch_size
+    requests, or max_latency seconds after its first request arrived.
+
+    Callers in threads use infer(); asyncio tasks use infer_async().
+    """
+
+    def __init__(
+        self, model: MLP, max_batch_size: int = 64, max_latency: float = 0.001
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.stats = BrokerStats()
+        self._requests: "queue.Queue" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        # Guards _worker and _closed, so nothing is queued behind _STOP
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def start(self) -> "InferenceBroker":
+        with self._lock:
+            if self._worker is None:
+                self._closed = False
+                self._worker = threading.Thread(target=self._serve, daemon=True)
+                self._worker.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Serve everything already queued, then stop. Submissions fail from
+        the moment stopping starts.
+        """
+        with self._lock:
+            if self._worker is None or self._closed:
+                return
+            self._closed = True
+            self._requests.put(_STOP)
+            worker = self._worker
+        worker.join()
+        # Fail anything the worker never got to, rather than leave it pending
+        while True:
+            try:
+                item = self._requests.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                item[1].set_exception(RuntimeError("Broker stopped"))
+        with self._lock:
+            self._worker = None
+
+    def __enter__(self) -> "InferenceBroker":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def submit(self, observation: np.ndarray) -> Future:
+        """Queue one observation; the future resolves to its output row."""
+        future: Future = Future()
+        with self._lock:
+            if self._worker is None or self._closed:
+                raise RuntimeError("Broker is not running")
+            self._requests.put((observation, future))
+        return future
+
+    def infer(self, observation: np.ndarray) -> np.ndarray:
+        return self.submit(observation).result()
+
+    async def infer_async(self, observation: np.ndarray) -> np.ndarray:
+        return await asyncio.wrap_future(self.submit(observation))
+
+    def _serve(self) -> None:
+        while True:
+            first = self._requests.get()
+            if first is _STOP:
+                return
+            batch = [first]
+            deadline = time.monotonic() + self.max_latency
+            stopping = False
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                try:
+                    item = (
+                        self._requests.get(timeout=timeout)
+                        if timeout > 0
+                        else self._requests.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._run_batch(batch)
+            if stopping:
+                return
+
+    def _run_batch(self, batch: List[Tuple[np.ndarray, Future]]) -> None:
+        self.stats.requests += len(batch)
+        self.stats.batches += 1
+        try:
+            outputs = self.model.forward(np.stack([obs for obs, _ in batch]))
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for row, (_, future) in zip(outputs, batch):
+            future.set_result(row)
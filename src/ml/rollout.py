@@ -0,0 +1,344 @@
+from typing import Callable, Dict, List, Optional, Sequence, Type
+from src.ml.agent import MAX_BID, Agent, RandomAgent
+from src.models.card import Card, Suit
+from src.models.game_round import GameRound
+from src.models.player import Player
+from src.models.scoring import (
+    AllOrNothingScorer,
+    BiddingScorer,
+    FixedBidScorer,
+    RoundScorer,
+)
+
+# Cards are bits of one int, at position (rank + bonus) * 4 + suit, where
+# trumps get TRUMP_BONUS. Positions then order cards from lowest to highest
+# with trumps above everything else, so rules pick cards with bit tricks.
+TRUMP_BONUS = 16
+NO_SUIT = -1
+NUM_SUITS = len(Suit)
+SUIT_MASKS = [
+    sum(1 << (key * NUM_SUITS + suit) for key in range(2 * TRUMP_BONUS))
+    for suit in range(NUM_SUITS)
+]
+
+
+def trump_index(round: GameRound) -> int:
+    """The round's trump suit as 0-3, or NO_SUIT."""
+    return round.trump_suit._value_ - 1 if round.trump_suit else NO_SUIT
+
+
+def position(card: Card, trump: int) -> int:
+    """The card's bit position in a HandIndex with the given trump suit."""
+    # _value_ is the plain attribute behind Enum.value, several times cheaper
+    suit = card.suit._value_ - 1
+    bonus = TRUMP_BONUS if suit == trump else 0
+    return (card.rank._value_ + bonus) * NUM_SUITS + suit
+
+
+def lowest_bit(mask: int) -> int:
+    return (mask & -mask).bit_length() - 1
+
+
+class HandIndex:
+    """
+    A hand as one bitmask of card positions for a given trump suit, with
+    the card at each position. Built once per hand and kept in step by
+    discard(), so a decision never re-sorts Card objects.
+    """
+
+    __slots__ = ("hand", "size", "trump", "offsets", "mask", "cards", "copies")
+
+    def __init__(self, hand: List[Card], trump: int = NO_SUIT):
+        self.hand = hand
+        self.size = len(hand)
+        self.trump = trump
+        # position(card, trump) is rank * NUM_SUITS + offsets[suit]
+        self.offsets = offsets = [
+            suit + (TRUMP_BONUS * NUM_SUITS if suit == trump else 0)
+            for suit in range(NUM_SUITS)
+        ]
+        mask = 0
+        cards: Dict[int, Card] = {}
+        # Further copies of a card in multi-deck games, kept apart so a
+        # single-deck hand allocates nothing per card
+        self.copies: Dict[int, List[Card]] = {}
+        for card in hand:
+            bit = card.rank._value_ * NUM_SUITS + offsets[card.suit._value_ - 1]
+            if mask >> bit & 1:
+                self.copies.setdefault(bit, []).append(card)
+            else:
+                mask |= 1 << bit
+                cards[bit] = card
+        self.mask = mask
+        self.cards = cards
+
+    def matches(self, hand: List[Card], trump: int) -> bool:
+        """Whether this index still describes `hand` under `trump`."""
+        return hand is self.hand and len(hand) == self.size and trump == self.trump
+
+    def discard(self, card: Card) -> None:
+        """Drop a card that is about to be played."""
+        bit = card.rank._value_ * NUM_SUITS + self.offsets[card.suit._value_ - 1]
+        self.size -= 1
+        spare = self.copies.get(bit) if self.copies else None
+        if not spare:
+            self.mask ^= 1 << bit
+        elif self.cards[bit] is card:
+            self.cards[bit] = spare.pop()
+        else:
+            spare.remove(card)
+
+    def at(self, bit: int) -> List[Card]:
+        """Every copy of the card at a position."""
+        return [self.cards[bit]] + self.copies.get(bit, [])
+
+
+class TrickView:
+    """
+    What a rollout rule sees, computed once per decision from a
+    HandIndex: bitmasks of the legal cards, of the legal cards that
+    would take the lead in the trick and of the trump suit, and whether
+    the player leads, is void in the led suit or plays last. lowest()
+    and highest() turn a mask back into a Card.
+    """
+
+    __slots__ = (
+        "hand",
+        "legal_mask",
+        "winners",
+        "trumps",
+        "leading",
+        "void",
+        "last",
+        "want",
+    )
+
+    def __init__(
+        self,
+        round: GameRound,
+        player: Player,
+        want: bool,
+        hand: Optional[HandIndex] = None,
+    ):
+        if hand is None:
+            hand = HandIndex(round.get_hand(player), trump_index(round))
+        trump = hand.trump
+        trick = round.current_trick
+        self.hand = hand
+        self.want = want
+        self.last = len(trick) == len(round.players) - 1
+        self.trumps = trumps = SUIT_MASKS[trump] if trump != NO_SUIT else 0
+
+        legal = hand.mask
+        if not trick:
+            self.leading, self.void = True, False
+            self.legal_mask = self.winners = legal
+            return
+        led = trick[0].card.suit._value_ - 1
+        follow = legal & SUIT_MASKS[led]
+        self.leading, self.void = False, not follow
+        if follow:
+            legal = follow
+        # The card winning so far is the highest of the led suit and trumps
+        winning, offsets = 0, hand.offsets
+        for played in trick:
+            card = played.card
+            suit = card.suit._value_ - 1
+            if suit == led or suit == trump:
+                bit = card.rank._value_ * NUM_SUITS + offsets[suit]
+                if bit > winning:
+                    winning = bit
+        self.legal_mask = legal
+        # Only a strictly higher card takes the lead
+        self.winners = legal & (SUIT_MASKS[led] | trumps) & ~((2 << winning) - 1)
+
+    @property
+    def legal(self) -> List[Card]:
+        """Legal cards from lowest to highest, trumps above everything else."""
+        cards, mask = [], self.legal_mask
+        while mask:
+            cards.extend(self.hand.at(lowest_bit(mask)))
+            mask &= mask - 1
+        return cards
+
+    def lowest(self, mask: int) -> Card:
+        return self.hand.cards[(mask & -mask).bit_length() - 1]
+
+    def highest(self, mask: int) -> Card:
+        return self.hand.cards[mask.bit_length() - 1]
+
+
+# A rule proposes a card, or passes with None to the next rule
+Rule = Callable[[TrickView], Optional[Card]]
+
+
+def duck_when_over_bid(view: TrickView) -> Optional[Card]:
+    """With enough tricks already, play the highest card that loses."""
+    if view.want:
+        return None
+    if view.leading:
+        return view.lowest(view.legal_mask)
+    losers = view.legal_mask & ~view.winners
+    if losers:
+        return view.highest(losers)
+    # Taking this trick is forced; spend the highest card if nobody follows
+    if view.last:
+        return view.highest(view.legal_mask)
+    return view.lowest(view.legal_mask)
+
+
+def lead_high_when_short(view: TrickView) -> Optional[Card]:
+    """When leading and still short of tricks, lead the best side-suit card."""
+    if not view.leading:
+        return None
+    return view.highest(view.legal_mask & ~view.trumps or view.legal_mask)
+
+
+def win_cheaply_when_last(view: TrickView) -> Optional[Card]:
+    """As the last player, take the trick with the lowest card that does."""
+    if not view.last or not view.winners:
+        return None
+    return view.lowest(view.winners)
+
+
+def trump_in_when_void(view: TrickView) -> Optional[Card]:
+    """Out of the led suit, ruff with the lowest trump that wins."""
+    if not view.void:
+        return None
+    ruffs = view.winners & view.trumps
+    return view.lowest(ruffs) if ruffs else None
+
+
+def dump_lowest_loser(view: TrickView) -> Optional[Card]:
+    """When no card can win the trick, throw away the lowest."""
+    return None if view.winners else view.lowest(view.legal_mask)
+
+
+def play_to_win(view: TrickView) -> Card:
+    """Fallback: the highest winning card, or the lowest card if none wins."""
+    if view.winners:
+        return view.highest(view.winners)
+    return view.lowest(view.legal_mask)
+
+
+BIDDING_RULES = (
+    duck_when_over_bid,
+    lead_high_when_short,
+    win_cheaply_when_last,
+    trump_in_when_void,
+    dump_lowest_loser,
+)
+
+# AllOrNothingScorer charges for every trick short of a sweep
+AVOID_RULES = (duck_when_over_bid,)
+
+# Trick targets for a seat: the tricks it is happy to stop at
+Target = Callable[[GameRound, Player], int]
+
+
+def bid_target(round: GameRound, player: Player) -> int:
+    return round.bids[player] if round.bids else 0
+
+
+class RolloutPolicy:
+    """
+    Picks a card by trying each rule in order; play_to_win decides if
+    every rule passes. A seat wants tricks while it has fewer than
+    target(round, player). Each seat's HandIndex is built on its first
+    decision of a round and updated as its chosen cards are played.
+    """
+
+    def __init__(self, rules: Sequence[Rule], target: Target):
+        self.rules = tuple(rules)
+        self.target = target
+        self._round: Optional[GameRound] = None
+        self._hands: Dict[Player, HandIndex] = {}
+
+    def _hand_index(self, round: GameRound, player: Player) -> HandIndex:
+        """
+        The player's HandIndex, built on its first decision in a round and
+        rebuilt if the hand or trump changed other than by this policy's
+        plays, as when the same GameRound is dealt again.
+        """
+        if round is not self._round:
+            self._round, self._hands = round, {}
+        hand = round.hands[player]
+        trump = trump_index(round)
+        index = self._hands.get(player)
+        if index is None or not index.matches(hand, trump):
+            index = self._hands[player] = HandIndex(hand, trump)
+        return index
+
+    def choose(self, round: GameRound, player: Player) -> Card:
+        want = round.trick_count(player) < self.target(round, player)
+        index = self._hand_index(round, player)
+        view = TrickView(round, player, want, index)
+        for rule in self.rules:
+            card = rule(view)
+            if card is not None:
+                break
+        else:
+            card = play_to_win(view)
+        index.discard(card)
+        return card
+
+
+def _fixed_bid_policy(scorer: FixedBidScorer) -> RolloutPolicy:
+    return RolloutPolicy(BIDDING_RULES, lambda round, player: scorer.target_tricks)
+
+
+POLICIES: Dict[Type[RoundScorer], Callable[[RoundScorer], RolloutPolicy]] = {
+    BiddingScorer: lambda scorer: RolloutPolicy(BIDDING_RULES, bid_target),
+    AllOrNothingScorer: lambda scorer: RolloutPolicy(AVOID_RULES, lambda r, p: 0),
+    FixedBidScorer: _fixed_bid_policy,
+}
+
+
+def policy_for(scorer: RoundScorer) -> RolloutPolicy:
+    """The heuristic rollout policy for a round scored by `scorer`."""
+    return POLICIES[type(scorer)](scorer)
+
+
+def greedy_policy() -> RolloutPolicy:
+    """Tries to take every trick; the baseline for trick-count analysis."""
+    return RolloutPolicy(BIDDING_RULES, lambda round, player: MAX_BID + 1)
+
+
+class HeuristicAgent(Agent):
+    """
+    Plays cards with a RolloutPolicy. Without a policy it follows the
+    bidding policy in rounds with bids and avoids tricks otherwise.
+    Bids come from `bidder`, which defaults to random legal bids.
+    """
+
+    def __init__(
+        self, policy: Optional[RolloutPolicy] = None, bidder: Optional[Agent] = None
+    ):
+        self.policy = policy
+        self.bidder = bidder if bidder is not None else RandomAgent()
+        self._bidding = RolloutPolicy(BIDDING_RULES, bid_target)
+        self._avoiding = RolloutPolicy(AVOID_RULES, bid_target)
+
+    @classmethod
+    def for_scorer(
+        cls, scorer: RoundScorer, bidder: Optional[Agent] = None
+    ) -> "HeuristicAgent":
+        return cls(policy_for(scorer), bidder)
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        self.bidder.reset(seed)
+
+    def choose_bid(
+        self,
+        round: GameRound,
+        player: Player,
+        num_tricks: int,
+        bids: Dict[Player, int],
+    ) -> int:
+        return self.bidder.choose_bid(round, player, num_tricks, bids)
+
+    def choose_card(self, round: GameRound, player: Player) -> Card:
+        policy = self.policy
+        if policy is None:
+            policy = self._bidding if round.bids is not None else self._avoiding
+        return policy.choose(round, player)
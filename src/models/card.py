@@ -29,6 +29,9 @@ class Rank(Enum):
 class Card:
     suit: Suit
     rank: Rank
+    # Which copy of the card this is when several decks are shuffled together.
+    # Copies compare unequal, so removing one from a hand never takes another.
+    deck: int = 0
 
     _suit_symbols = {
         Suit.HEARTS: "♥",
@@ -53,6 +56,17 @@ class Card:
         Rank.ACE: "A",
     }
 
+    @property
+    def index(self) -> int:
+        """Dense 0-51 index, grouped by suit then rank."""
+        # _value_ is the plain attribute behind Enum.value, several times cheaper
+        return (self.suit._value_ - 1) * 13 + (self.rank._value_ - 2)
+
+    @property
+    def uid(self) -> int:
+        """Dense index that also tells copies from different decks apart."""
+        return self.deck * 52 + self.index
+
     def __str__(self):
         return f"{self._rank_symbols[self.rank]}{self._suit_symbols[self.suit]}"
 
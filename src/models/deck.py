@@ -1,4 +1,4 @@
-from typing import List, Sequence
+from typing import List, Optional, Sequence
 import random
 from .card import Card, Suit, Rank
 
@@ -11,12 +11,30 @@ class Deck:
         self._cards = tuple(cards)
 
     @classmethod
-    def standard_deck(cls) -> "Deck":
-        """Creates a shuffled standard 52-card deck."""
-        cards = [Card(suit, rank) for suit in Suit for rank in Rank]
-        random.shuffle(cards)
+    def standard_deck(
+        cls, rng: Optional[random.Random] = None, num_decks: int = 1
+    ) -> "Deck":
+        """
+        Creates `num_decks` standard 52-card decks shuffled together.
+        Pass a seeded rng to get a reproducible shuffle.
+        """
+        cards = [
+            Card(suit, rank, deck)
+            for deck in range(num_decks)
+            for suit in Suit
+            for rank in Rank
+        ]
+        (rng or random).shuffle(cards)
         return cls(cards)
 
+    @classmethod
+    def decks_needed(
+        cls, num_players: int, cards_per_player: int, trump: bool = True
+    ) -> int:
+        """Fewest standard decks that can deal a round (plus its trump card)."""
+        needed = num_players * cards_per_player + (1 if trump else 0)
+        return max(1, -(-needed // cls.STANDARD_DECK_SIZE))
+
     @property
     def cards(self) -> tuple[Card, ...]:
         return self._cards
@@ -0,0 +1,136 @@
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, fields
+from typing import IO, ClassVar, List, Optional, Union
+from .card import Card
+
+
+def _jsonable(value):
+    if isinstance(value, Card):
+        return str(value)
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    return value
+
+
+class Event:
+    """Base class for structured game events. Players are named by string."""
+
+    type: ClassVar[str] = "event"
+
+    def to_dict(self) -> dict:
+        data = {"type": self.type}
+        for f in fields(self):
+            data[f.name] = _jsonable(getattr(self, f.name))
+        return data
+
+
+@dataclass
+class GameStarted(Event):
+    type: ClassVar[str] = "game_started"
+    players: List[str]
+
+
+@dataclass
+class RoundStarted(Event):
+    type: ClassVar[str] = "round_started"
+    round_num: int
+    num_rounds: int
+    cards_per_player: int
+    use_trump: bool
+    scoring: str
+
+
+@dataclass
+class Deal(Event):
+    type: ClassVar[str] = "deal"
+    players: List[str]
+    hands: List[List[Card]]
+    trump: Optional[Card]
+
+
+@dataclass
+class Bid(Event):
+    type: ClassVar[str] = "bid"
+    player: str
+    bid: int
+
+
+@dataclass
+class CardPlayed(Event):
+    type: ClassVar[str] = "card_played"
+    player: str
+    card: Card
+
+
+@dataclass
+class TrickWon(Event):
+    type: ClassVar[str] = "trick_won"
+    winner: str
+    players: List[str]
+    cards: List[Card]
+
+
+@dataclass
+class RoundScored(Event):
+    type: ClassVar[str] = "round_scored"
+    round_num: int
+    players: List[str]
+    tricks: List[int]
+    points: List[int]
+    totals: List[int]
+
+
+@dataclass
+class GameOver(Event):
+    type: ClassVar[str] = "game_over"
+    players: List[str]
+    totals: List[int]
+
+
+class EventSink(ABC):
+    @abstractmethod
+    def emit(self, event: Event) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+
+class NullSink(EventSink):
+    """
+    Discards everything. Engine code skips building events entirely
+    when it has no sink, so prefer sink=None on hot paths.
+    """
+
+    def emit(self, event: Event) -> None:
+        pass
+
+
+class JsonlSink(EventSink):
+    """Buffers events as JSON lines and writes them in batches."""
+
+    def __init__(self, target: Union[str, IO[str]], flush_every: int = 1000):
+        self._owns_file = isinstance(target, str)
+        self._file = open(target, "a", encoding="utf-8") if self._owns_file else target
+        self.flush_every = flush_every
+        self._buffer: List[str] = []
+
+    def emit(self, event: Event) -> None:
+        self._buffer.append(json.dumps(event.to_dict(), ensure_ascii=False))
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._file.write("\n".join(self._buffer) + "\n")
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self._owns_file:
+            self._file.close()
@@ -1,8 +1,11 @@
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Optional, Dict
+from enum import Enum, auto
+from typing import Deque, Iterable, List, Optional, Dict, Union
 from .player import Player
 from .deck import Deck
 from .card import Card, Suit
+from .events import Bid, CardPlayed, Deal, EventSink, TrickWon
 
 
 @dataclass
@@ -11,11 +14,80 @@ class PlayedCard:
     player: Player
 
 
+class HistoryMode(Enum):
+    FULL = auto()  # Keep every won trick in tricks_won (CLI, replays)
+    COUNTS = auto()  # Only count tricks per player (simulation)
+    RECENT = auto()  # Counts plus a ring buffer of the latest tricks (agents)
+
+
+class Phase(Enum):
+    BIDDING = auto()
+    PLAYING = auto()
+    OVER = auto()
+
+
+def legal_bids(num_tricks: int, bids: Dict[Player, int], is_last: bool) -> List[int]:
+    """
+    List the bids available to a player.
+    The last bidder may not make the bids sum to the number of tricks.
+    """
+    forbidden = num_tricks - sum(bids.values()) if is_last else None
+    return [bid for bid in range(num_tricks + 1) if bid != forbidden]
+
+
+def trick_winner_index(cards: Iterable[Card], trump_suit: Optional[Suit]) -> int:
+    """
+    Return the position of the winning card in a complete trick.
+    Only a strictly higher card takes the lead, so when identical cards
+    from different decks meet, the first one played wins.
+    """
+    cards = iter(cards)
+    winning_card = next(cards)
+    led_suit = winning_card.suit
+    winner_index = 0
+
+    for i, card in enumerate(cards, 1):
+        # If trump suit is played, it wins over non-trump
+        if trump_suit:
+            if card.suit == trump_suit and winning_card.suit != trump_suit:
+                winning_card = card
+                winner_index = i
+            elif (
+                card.suit == winning_card.suit
+                and card.rank.value > winning_card.rank.value
+            ):
+                winning_card = card
+                winner_index = i
+        # No trump suit - follow basic trick-taking rules
+        elif card.suit == led_suit and card.rank.value > winning_card.rank.value:
+            winning_card = card
+            winner_index = i
+
+    return winner_index
+
+
 class GameRound:
-    def __init__(self, player_names: List[str]):
+    def __init__(
+        self,
+        player_names: List[str],
+        history: HistoryMode = HistoryMode.FULL,
+        recent_tricks: int = 4,
+        sink: Optional[EventSink] = None,
+    ):
+        """
+        `history` controls what is kept of won tricks. Only FULL mode fills
+        tricks_won, and COUNTS mode leaves last_trick empty; read trick
+        counts through trick_count(). RECENT mode keeps the last
+        `recent_tricks` tricks in recent_tricks.
+        Deals, bids, plays and won tricks are reported to `sink`, if given.
+        """
         if len(player_names) < 2:
             raise ValueError("Need at least 2 players")
 
+        self.history = history
+        self.sink = sink
+        self.recent_tricks: Deque[List[PlayedCard]] = deque(maxlen=recent_tricks)
+
         self.players = [Player(name) for name in player_names]
         self.current_trick: List[PlayedCard] = []
         self.trump_suit: Optional[Suit] = None
@@ -23,6 +95,19 @@ class GameRound:
             player: [] for player in self.players
         }
         self.hands: Dict[Player, List[Card]] = {player: [] for player in self.players}
+        self._trick_counts: Dict[Player, int] = {player: 0 for player in self.players}
+        # Bit Card.uid is set for every card played this round, in any mode
+        self.played_mask = 0
+        self.bids: Optional[Dict[Player, int]] = None
+        self.last_trick: List[PlayedCard] = []
+        self._leader_idx = 0
+        self._num_tricks = 0
+
+    def trick_count(self, player: Player) -> int:
+        """Number of tricks a player has won this round."""
+        if self.history == HistoryMode.FULL:
+            return len(self.tricks_won[player])
+        return self._trick_counts[player]
 
     def get_hand(self, player: Player) -> List[Card]:
         """Get a player's current hand."""
@@ -47,6 +132,12 @@ class GameRound:
         self.trump_suit = None
         self.tricks_won = {player: [] for player in self.players}
         self.hands = {player: [] for player in self.players}
+        self._trick_counts = {player: 0 for player in self.players}
+        self.recent_tricks.clear()
+        self.played_mask = 0
+        self.bids = None
+        self.last_trick = []
+        self._leader_idx = 0
 
         # Initialize deck
         self.deck = deck if deck is not None else Deck.standard_deck()
@@ -70,6 +161,82 @@ class GameRound:
             trump_card = self.deck.take_cards(1)[0]
             self.trump_suit = trump_card.suit
 
+        if self.sink is not None:
+            self.sink.emit(
+                Deal(
+                    [player.name for player in self.players],
+                    [list(self.hands[player]) for player in self.players],
+                    trump_card if trump else None,
+                )
+            )
+
+    def start_bidding(self) -> None:
+        """
+        Open a bidding phase (for BiddingScorer rounds) before play.
+        Players bid in seat order; pass round.bids to BiddingScorer.set_bids
+        once the phase is over.
+        """
+        self.bids = {}
+        self._num_tricks = len(self.hands[self.players[0]])
+
+    @property
+    def phase(self) -> Phase:
+        if self.bids is not None and len(self.bids) < len(self.players):
+            return Phase.BIDDING
+        if self.is_over():
+            return Phase.OVER
+        return Phase.PLAYING
+
+    @property
+    def to_move_index(self) -> Optional[int]:
+        """Seat index of the player step() expects next, or None once over."""
+        phase = self.phase
+        if phase == Phase.BIDDING:
+            return len(self.bids)
+        if phase == Phase.OVER:
+            return None
+        return (self._leader_idx + len(self.current_trick)) % len(self.players)
+
+    @property
+    def to_move(self) -> Optional[Player]:
+        """The player whose action step() expects next, or None once over."""
+        index = self.to_move_index
+        return self.players[index] if index is not None else None
+
+    def get_valid_bids(self) -> List[int]:
+        """Bids available to the player currently bidding."""
+        if self.phase != Phase.BIDDING:
+            return []
+        is_last = len(self.bids) == len(self.players) - 1
+        return legal_bids(self._num_tricks, self.bids, is_last)
+
+    def step(self, action: Union[int, Card]) -> Optional[Player]:
+        """
+        Apply the next action for to_move: a bid during bidding, otherwise a card.
+        A trick is resolved as soon as its last card is played, in which
+        case the trick winner is returned (and leads next).
+        Raises ValueError if the action is not legal.
+        """
+        phase = self.phase
+        if phase == Phase.OVER:
+            raise ValueError("Round is over")
+
+        player = self.to_move
+        if phase == Phase.BIDDING:
+            if action not in self.get_valid_bids():
+                raise ValueError(f"Invalid bid: {action}")
+            self.bids[player] = action
+            if self.sink is not None:
+                self.sink.emit(Bid(player.name, action))
+            return None
+
+        if not isinstance(action, Card):
+            raise ValueError(f"Expected a card to play, got {action!r}")
+        self.play_card(player, action)
+        if len(self.current_trick) == len(self.players):
+            return self.evaluate_trick()
+        return None
+
     def check_play_validity(self, player: Player, card: Card) -> Optional[str]:
         """
         Check if playing a card would be valid.
@@ -93,6 +260,17 @@ class GameRound:
 
         return None
 
+    def get_valid_plays(self, player: Player) -> List[Card]:
+        """Get the cards in a player's hand that can legally be played now."""
+        # Same rules as check_play_validity, in one pass over the hand
+        hand = self.hands[player]
+        if len(self.current_trick) == len(self.players):
+            return []
+        if not self.current_trick:
+            return list(hand)
+        led_suit = self.current_trick[0].card.suit
+        return [card for card in hand if card.suit == led_suit] or list(hand)
+
     def play_card(self, player: Player, card: Card) -> None:
         """
         Handle a player playing a card.
@@ -104,6 +282,9 @@ class GameRound:
 
         self.remove_card_from_hand(player, card)
         self.current_trick.append(PlayedCard(card, player))
+        self.played_mask |= 1 << card.uid
+        if self.sink is not None:
+            self.sink.emit(CardPlayed(player.name, card))
 
     def evaluate_trick(self) -> Player:
         """
@@ -115,38 +296,32 @@ class GameRound:
                 f"Cannot evaluate incomplete trick. Expected {len(self.players)} cards, got {len(self.current_trick)}"
             )
 
-        led_suit = self.current_trick[0].card.suit
-        winning_played_card = self.current_trick[0]
-        winner_index = 0
-
-        for i, played in enumerate(self.current_trick[1:], 1):
-            card = played.card
-            # If trump suit is played, it wins over non-trump
-            if self.trump_suit:
-                if (
-                    card.suit == self.trump_suit
-                    and winning_played_card.card.suit != self.trump_suit
-                ):
-                    winning_played_card = played
-                    winner_index = i
-                elif (
-                    card.suit == winning_played_card.card.suit
-                    and card.rank.value > winning_played_card.card.rank.value
-                ):
-                    winning_played_card = played
-                    winner_index = i
-            # No trump suit - follow basic trick-taking rules
-            elif (
-                card.suit == led_suit
-                and card.rank.value > winning_played_card.card.rank.value
-            ):
-                winning_played_card = played
-                winner_index = i
+        winner_index = trick_winner_index(
+            (played.card for played in self.current_trick), self.trump_suit
+        )
 
         winning_player = self.current_trick[winner_index].player
-        trick_cards = [played.card for played in self.current_trick]
-        self.tricks_won[winning_player].append(trick_cards)
-        self.current_trick = []
+        if self.sink is not None:
+            self.sink.emit(
+                TrickWon(
+                    winning_player.name,
+                    [played.player.name for played in self.current_trick],
+                    [played.card for played in self.current_trick],
+                )
+            )
+        self._trick_counts[winning_player] += 1
+        if self.history == HistoryMode.COUNTS:
+            # Reuse the trick list so simulation allocates nothing per trick
+            self.current_trick.clear()
+        else:
+            if self.history == HistoryMode.FULL:
+                trick_cards = [played.card for played in self.current_trick]
+                self.tricks_won[winning_player].append(trick_cards)
+            else:
+                self.recent_tricks.append(self.current_trick)
+            self.last_trick = self.current_trick
+            self.current_trick = []
+        self._leader_idx = self.players.index(winning_player)
         return winning_player
 
     def is_over(self) -> bool:
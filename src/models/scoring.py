@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Dict, List, Optional
+import numpy as np
 from .player import Player
 from .game_round import GameRound
 
@@ -16,6 +17,18 @@ class RoundScorer(ABC):
         """Calculate scores for the round"""
         pass
 
+    @abstractmethod
+    def score_batch(
+        self, tricks: np.ndarray, bids: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Score many rounds at once.
+        `tricks` (and `bids`, where the scheme uses them) are (N, P) arrays
+        with one row per round and one column per seat, in round.players
+        order. Returns an (N, P) integer array matching score_round.
+        """
+        pass
+
 
 class BiddingScorer(RoundScorer):
     def __init__(self):
@@ -42,21 +55,29 @@ class BiddingScorer(RoundScorer):
 
         scores = {}
         for player in round.players:
-            tricks_taken = len(round.tricks_won[player])
+            tricks_taken = round.trick_count(player)
             if tricks_taken == self._bids[player]:
                 scores[player] = 10 + self._bids[player]
             else:
                 scores[player] = 0
         return RoundScore(scores)
 
+    def score_batch(
+        self, tricks: np.ndarray, bids: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        if bids is None:
+            raise ValueError("Bids must be given for batch scoring")
+        tricks, bids = np.asarray(tricks), np.asarray(bids)
+        return np.where(tricks == bids, 10 + bids, 0)
+
 
 class AllOrNothingScorer(RoundScorer):
     def score_round(self, round: GameRound) -> RoundScore:
         scores = {}
-        total_tricks = sum(len(tricks) for tricks in round.tricks_won.values())
+        total_tricks = sum(round.trick_count(player) for player in round.players)
 
         for player in round.players:
-            tricks_taken = len(round.tricks_won[player])
+            tricks_taken = round.trick_count(player)
             if tricks_taken == total_tricks:
                 scores[player] = 10
                 # Penalize others
@@ -70,6 +91,17 @@ class AllOrNothingScorer(RoundScorer):
                 scores[player] = -2 * tricks_taken
         return RoundScore(scores)
 
+    def score_batch(
+        self, tricks: np.ndarray, bids: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        tricks = np.asarray(tricks)
+        took_all = tricks == tricks.sum(axis=1, keepdims=True)
+        # Like score_round, the first seat to take every trick is the sweeper
+        sweeper = took_all.argmax(axis=1)[:, None]
+        seats = np.arange(tricks.shape[1])[None, :]
+        sweep_scores = np.where(seats == sweeper, 10, -10)
+        return np.where(took_all.any(axis=1, keepdims=True), sweep_scores, -2 * tricks)
+
 
 class FixedBidScorer(RoundScorer):
     def __init__(self, target_tricks: int = 3, points: int = 20):
@@ -81,9 +113,14 @@ class FixedBidScorer(RoundScorer):
             {
                 player: (
                     self.points
-                    if len(round.tricks_won[player]) == self.target_tricks
+                    if round.trick_count(player) == self.target_tricks
                     else 0
                 )
                 for player in round.players
             }
         )
+
+    def score_batch(
+        self, tricks: np.ndarray, bids: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        return np.where(np.asarray(tricks) == self.target_tricks, self.points, 0)
@@ -0,0 +1,408 @@
+import argparse
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+from src.cli_game import RoundConfig, default_round_configs
+from src.ml.agent import Agent
+from src.models.card import Card
+from src.models.game_round import GameRound, Phase, legal_bids
+from src.models.player import Player
+from src.models.scoring import BiddingScorer
+from src.utils.constants import MAX_PLAYERS, MIN_PLAYERS
+
+
+def card_to_json(card: Card) -> dict:
+    return {"uid": card.uid, "text": str(card)}
+
+
+class Seat(ABC):
+    def __init__(self, name: str):
+        self.name = name
+
+    @abstractmethod
+    async def request_bid(
+        self, round: GameRound, player: Player, num_tricks: int, bids: Dict[Player, int]
+    ) -> int:
+        pass
+
+    @abstractmethod
+    async def request_card(self, round: GameRound, player: Player) -> Card:
+        pass
+
+    async def notify(self, message: dict) -> None:
+        """Receive a table event. Seats that don't care can ignore it."""
+        pass
+
+
+class AgentSeat(Seat):
+    """An in-process bot seat."""
+
+    def __init__(self, name: str, agent: Agent):
+        super().__init__(name)
+        self.agent = agent
+
+    async def request_bid(self, round, player, num_tricks, bids) -> int:
+        return self.agent.choose_bid(round, player, num_tricks, bids)
+
+    async def request_card(self, round, player) -> Card:
+        return self.agent.choose_card(round, player)
+
+
+class RemoteSeat(Seat):
+    """A seat driven by a connected client."""
+
+    def __init__(
+        self,
+        name: str,
+        writer: asyncio.StreamWriter,
+        inbox: "asyncio.Queue[Optional[dict]]",
+        move_timeout: float,
+    ):
+        super().__init__(name)
+        self.writer = writer
+        self.inbox = inbox
+        self.move_timeout = move_timeout
+        self.connected = True
+
+    async def notify(self, message: dict) -> None:
+        if not self.connected:
+            return
+        try:
+            self.writer.write(json.dumps(message).encode() + b"\n")
+            await self.writer.drain()
+        except ConnectionError:
+            self.connected = False
+
+    def _deadline(self) -> float:
+        return asyncio.get_running_loop().time() + self.move_timeout
+
+    async def _await_reply(self, expected: str, deadline: float) -> Optional[dict]:
+        """
+        Wait for a reply of the expected type, or None on timeout/disconnect.
+        The deadline covers the whole move, retries after illegal replies included.
+        """
+        loop = asyncio.get_running_loop()
+        while self.connected:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None
+            try:
+                message = await asyncio.wait_for(self.inbox.get(), remaining)
+            except asyncio.TimeoutError:
+                return None
+            if message is None:
+                self.connected = False
+                return None
+            if message.get("type") == expected:
+                return message
+            await self.notify({"type": "error", "message": f"Expected '{expected}'"})
+        return None
+
+    async def request_bid(self, round, player, num_tricks, bids) -> int:
+        options = legal_bids(num_tricks, bids, len(bids) == len(round.players) - 1)
+        deadline = self._deadline()
+        while True:
+            await self.notify(
+                {
+                    "type": "bid_request",
+                    "num_tricks": num_tricks,
+                    "options": options,
+                    "timeout": self.move_timeout,
+                }
+            )
+            reply = await self._await_reply("bid", deadline)
+            if reply is None:
+                return options[0]
+            bid = reply.get("bid")
+            if isinstance(bid, int) and not isinstance(bid, bool) and bid in options:
+                return bid
+            await self.notify({"type": "error", "message": "Illegal bid"})
+
+    async def request_card(self, round, player) -> Card:
+        options = round.get_valid_plays(player)
+        by_uid = {card.uid: card for card in options}
+        deadline = self._deadline()
+        while True:
+            await self.notify(
+                {
+                    "type": "play_request",
+                    "hand": [card_to_json(c) for c in round.get_hand(player)],
+                    "options": list(by_uid),
+                    "trick": [
+                        {"player": p.player.name, "card": card_to_json(p.card)}
+                        for p in round.current_trick
+                    ],
+                    "timeout": self.move_timeout,
+                }
+            )
+            reply = await self._await_reply("play", deadline)
+            if reply is None:
+                return options[0]
+            card = reply.get("card")
+            if isinstance(card, int) and not isinstance(card, bool) and card in by_uid:
+                return by_uid[card]
+            await self.notify({"type": "error", "message": "Illegal card"})
+
+
+class Table:
+    """One full game played out over the network."""
+
+    def __init__(
+        self,
+        table_id: str,
+        num_seats: int,
+        round_configs: Optional[List[RoundConfig]] = None,
+    ):
+        self.table_id = table_id
+        self.num_seats = num_seats
+        self.seats: List[Seat] = []
+        self.round_configs = round_configs or default_round_configs()
+        self.totals: List[int] = []
+
+    @property
+    def is_full(self) -> bool:
+        return len(self.seats) == self.num_seats
+
+    async def broadcast(self, message: dict) -> None:
+        await asyncio.gather(*(seat.notify(message) for seat in self.seats))
+
+    async def play(self) -> List[int]:
+        """Play every round; returns the final totals in seat order."""
+        self.totals = [0] * len(self.seats)
+
+        for round_num, config in enumerate(self.round_configs, 1):
+            points = await self._play_round(round_num, config)
+            self.totals = [
+                total + round_points for total, round_points in zip(self.totals, points)
+            ]
+            await self.broadcast(
+                {
+                    "type": "round_scores",
+                    "round": round_num,
+                    "points": points,
+                    "totals": list(self.totals),
+                }
+            )
+
+        # Seat order, like round_scores; display names need not be unique
+        await self.broadcast({"type": "game_over", "totals": list(self.totals)})
+        return list(self.totals)
+
+    async def _play_round(self, round_num: int, config: RoundConfig) -> List[int]:
+        round = GameRound([seat.name for seat in self.seats])
+        round.setup_round(
+            config.cards_per_player,
+            trump=config.use_trump,
+            deck=config.new_deck(len(self.seats)),
+        )
+        scorer = config.scorer_type(**config.scorer_params)
+        await self.broadcast(
+            {
+                "type": "round",
+                "round": round_num,
+                "cards_per_player": config.cards_per_player,
+                "trump": round.trump_suit.name if round.trump_suit else None,
+                "scoring": config.scorer_type.__name__,
+            }
+        )
+
+        num_tricks = config.cards_per_player
+        bidding = isinstance(scorer, BiddingScorer)
+        if bidding:
+            round.start_bidding()
+
+        while round.phase != Phase.OVER:
+            seat_idx = round.to_move_index
+            seat, player = self.seats[seat_idx], round.players[seat_idx]
+            if round.phase == Phase.BIDDING:
+                bid = await seat.request_bid(round, player, num_tricks, round.bids)
+                round.step(bid)
+                await self.broadcast({"type": "bid", "seat": seat_idx, "bid": bid})
+                continue
+
+            card = await seat.request_card(round, player)
+            winner = round.step(card)
+            await self.broadcast(
+                {"type": "played", "seat": seat_idx, "card": card_to_json(card)}
+            )
+            if winner is not None:
+                await self.broadcast(
+                    {"type": "trick", "winner": round.players.index(winner)}
+                )
+
+        if bidding and not scorer.set_bids(round.bids, num_tricks):
+            raise ValueError("Invalid bids")
+
+        score = scorer.score_round(round)
+        return [score.points[player] for player in round.players]
+
+
+class GameServer:
+    """
+    Accepts connections and runs every full table as its own task.
+
+    Clients connect over TCP or a Unix socket and speak newline-delimited
+    JSON. A client joins a table with
+
+        {"type": "join", "table": "t1", "name": "Alice"}
+
+    and is then sent "bid_request" and "play_request" prompts, answered with
+
+        {"type": "bid", "bid": 2}
+        {"type": "play", "card": 17}
+
+    where a card is identified by Card.uid, so the copies of a card in a
+    multi-deck game stay distinct. Everything else the server sends
+    ("seated", "round", "bid", "played", "trick", "round_scores",
+    "game_over", "error") is informational. Points and totals are lists in
+    seat order, as are the final totals kept in results for each table. A
+    seat that does not answer within the move timeout has a default move
+    made for it.
+    """
+
+    def __init__(
+        self,
+        seats_per_table: int = 4,
+        move_timeout: float = 30.0,
+        round_configs: Optional[List[RoundConfig]] = None,
+    ):
+        if not MIN_PLAYERS <= seats_per_table <= MAX_PLAYERS:
+            raise ValueError(
+                f"Tables seat between {MIN_PLAYERS} and {MAX_PLAYERS} players"
+            )
+        self.seats_per_table = seats_per_table
+        self.move_timeout = move_timeout
+        self.round_configs = round_configs
+        self.tables: Dict[str, Table] = {}
+        self.results: Dict[str, List[int]] = {}
+        self._games: Dict[str, asyncio.Task] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Listen on TCP; returns the bound port."""
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start_unix(self, path: str) -> None:
+        self._server = await asyncio.start_unix_server(self._handle_connection, path)
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for task in self._games.values():
+            task.cancel()
+        await asyncio.gather(*self._games.values(), return_exceptions=True)
+
+    async def wait_for_games(self) -> None:
+        await asyncio.gather(*self._games.values())
+
+    async def add_seat(self, table_id: str, seat: Seat) -> int:
+        """Seat a player at a table, starting the game once it is full."""
+        table = self.tables.get(table_id)
+        if table is None:
+            table = Table(table_id, self.seats_per_table, self.round_configs)
+            self.tables[table_id] = table
+        if table.is_full:
+            raise ValueError(f"Table {table_id} is full")
+        table.seats.append(seat)
+        seat_idx = len(table.seats) - 1
+        await seat.notify({"type": "seated", "table": table_id, "seat": seat_idx})
+        if table.is_full:
+            self._games[table_id] = asyncio.create_task(self._run_table(table))
+        return seat_idx
+
+    def remove_seat(self, table_id: str, seat: Seat) -> None:
+        """Give up a seat at a table whose game has not started yet."""
+        table = self.tables.get(table_id)
+        if table is None or table_id in self._games or seat not in table.seats:
+            return
+        table.seats.remove(seat)
+        if not table.seats:
+            del self.tables[table_id]
+
+    async def add_bot(self, table_id: str, name: str, agent: Agent) -> int:
+        return await self.add_seat(table_id, AgentSeat(name, agent))
+
+    async def _run_table(self, table: Table) -> None:
+        try:
+            self.results[table.table_id] = await table.play()
+        finally:
+            del self.tables[table.table_id]
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        inbox: "asyncio.Queue[Optional[dict]]" = asyncio.Queue()
+        seat: Optional[RemoteSeat] = None
+        table_id = ""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    message = None
+                if not isinstance(message, dict):
+                    writer.write(b'{"type": "error", "message": "Malformed message"}\n')
+                    continue
+                if seat is None:
+                    if message.get("type") != "join":
+                        writer.write(
+                            b'{"type": "error", "message": "Join a table first"}\n'
+                        )
+                        continue
+                    seat = RemoteSeat(
+                        str(message.get("name", "Player")),
+                        writer,
+                        inbox,
+                        self.move_timeout,
+                    )
+                    table_id = str(message.get("table", "default"))
+                    try:
+                        await self.add_seat(table_id, seat)
+                    except ValueError as e:
+                        seat = None
+                        writer.write(
+                            json.dumps({"type": "error", "message": str(e)}).encode()
+                            + b"\n"
+                        )
+                else:
+                    inbox.put_nowait(message)
+        except ConnectionError:
+            pass
+        finally:
+            inbox.put_nowait(None)
+            if seat is not None:
+                seat.connected = False
+                self.remove_seat(table_id, seat)
+            writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Host multi-table games")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="Listen on a Unix socket instead of TCP")
+    parser.add_argument("--seats", type=int, default=4)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    async def serve():
+        server = GameServer(args.seats, args.timeout)
+        if args.unix:
+            await server.start_unix(args.unix)
+            print(f"Listening on {args.unix}")
+        else:
+            port = await server.start(args.host, args.port)
+            print(f"Listening on {args.host}:{port}")
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+import math
+import os
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from src.cli_game import RoundConfig
+from src.ml.agent import Agent
+from src.sim.checkpoint import game_seed
+from src.sim.runner import RoundResult, play_configured_round
+
+
+class RunningStats:
+    """Mergeable count / mean / variance / min / max (Welford, Chan et al.)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def update_many(self, values: Sequence[float]) -> None:
+        values = np.asarray(values, dtype=np.float64)
+        if values.size:
+            batch = RunningStats()
+            batch.count = values.size
+            batch.mean = float(values.mean())
+            batch.m2 = float(((values - batch.mean) ** 2).sum())
+            batch.min = float(values.min())
+            batch.max = float(values.max())
+            self.merge(batch)
+
+    def merge(self, other: "RunningStats") -> None:
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stderr(self) -> float:
+        return math.sqrt(self.variance / self.count) if self.count else math.inf
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RunningStats":
+        stats = cls()
+        stats.count, stats.mean, stats.m2 = data["count"], data["mean"], data["m2"]
+        if stats.count:
+            stats.min, stats.max = data["min"], data["max"]
+        return stats
+
+
+class Histogram:
+    """Fixed-bin counts over [low, high), with underflow and overflow bins."""
+
+    def __init__(self, low: float, high: float, bins: int):
+        self.low = low
+        self.high = high
+        self.bins = bins
+        # counts[0] is underflow, counts[-1] overflow
+        self.counts = np.zeros(bins + 2, dtype=np.int64)
+
+    def update(self, values: Sequence[float]) -> None:
+        values = np.asarray(values, dtype=np.float64)
+        scaled = np.floor((values - self.low) * self.bins / (self.high - self.low))
+        slots = np.clip(scaled, -1, self.bins).astype(np.int64) + 1
+        self.counts += np.bincount(slots, minlength=self.bins + 2)
+
+    def merge(self, other: "Histogram") -> None:
+        if (other.low, other.high, other.bins) != (self.low, self.high, self.bins):
+            raise ValueError("Cannot merge histograms with different bins")
+        self.counts += other.counts
+
+    @property
+    def edges(self) -> np.ndarray:
+        return np.linspace(self.low, self.high, self.bins + 1)
+
+    def to_dict(self) -> dict:
+        return {
+            "low": self.low,
+            "high": self.high,
+            "bins": self.bins,
+            "counts": self.counts.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Histogram":
+        histogram = cls(data["low"], data["high"], data["bins"])
+        histogram.counts = np.array(data["counts"], dtype=np.int64)
+        return histogram
+
+
+class ScoreBreakdown:
+    """Round score statistics for one scorer type."""
+
+    def __init__(self):
+        self.points = RunningStats()
+        self.histogram = Histogram(-30, 40, 70)
+        self.bids = 0
+        self.bids_made = 0
+
+    def add(self, result: RoundResult) -> None:
+        self.points.update_many(result.points)
+        self.histogram.update(result.points)
+        if result.bids is not None:
+            self.bids += len(result.bids)
+            self.bids_made += sum(b == t for b, t in zip(result.bids, result.tricks))
+
+    @property
+    def bid_accuracy(self) -> Optional[float]:
+        return self.bids_made / self.bids if self.bids else None
+
+    def merge(self, other: "ScoreBreakdown") -> None:
+        self.points.merge(other.points)
+        self.histogram.merge(other.histogram)
+        self.bids += other.bids
+        self.bids_made += other.bids_made
+
+    def to_dict(self) -> dict:
+        return {
+            "points": self.points.to_dict(),
+            "histogram": self.histogram.to_dict(),
+            "bids": self.bids,
+            "bids_made": self.bids_made,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ScoreBreakdown":
+        breakdown = cls()
+        breakdown.points = RunningStats.from_dict(data["points"])
+        breakdown.histogram = Histogram.from_dict(data["histogram"])
+        breakdown.bids, breakdown.bids_made = data["bids"], data["bids_made"]
+        return breakdown
+
+
+class ScoreAggregator:
+    """
+    Bounded-memory summary of any number of games: per-game total
+    statistics and histogram, plus a per-scorer-type breakdown of round
+    scores and bid accuracy. Aggregators built in different workers
+    merge exactly, and serialise to small dicts, so workers ship deltas
+    instead of raw results.
+
+    Also satisfies ResumableRun's aggregate protocol, where each result
+    is a delta from to_dict().
+    """
+
+    def __init__(self):
+        self.games = RunningStats()
+        self.game_histogram = Histogram(-200, 400, 60)
+        self.by_scorer: Dict[str, ScoreBreakdown] = {}
+
+    def add_round(self, scorer_name: str, result: RoundResult) -> None:
+        if scorer_name not in self.by_scorer:
+            self.by_scorer[scorer_name] = ScoreBreakdown()
+        self.by_scorer[scorer_name].add(result)
+
+    def add_game(self, totals: Sequence[int]) -> None:
+        self.games.update_many(totals)
+        self.game_histogram.update(totals)
+
+    def merge(self, other: "ScoreAggregator") -> None:
+        self.games.merge(other.games)
+        self.game_histogram.merge(other.game_histogram)
+        for name, breakdown in other.by_scorer.items():
+            # Merge into a fresh breakdown so `other` is never aliased
+            if name not in self.by_scorer:
+                self.by_scorer[name] = ScoreBreakdown()
+            self.by_scorer[name].merge(breakdown)
+
+    def update(self, result: dict) -> None:
+        self.merge(ScoreAggregator.from_dict(result))
+
+    def to_dict(self) -> dict:
+        return {
+            "games": self.games.to_dict(),
+            "game_histogram": self.game_histogram.to_dict(),
+            "by_scorer": {k: v.to_dict() for k, v in self.by_scorer.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ScoreAggregator":
+        aggregator = cls()
+        aggregator.games = RunningStats.from_dict(data["games"])
+        aggregator.game_histogram = Histogram.from_dict(data["game_histogram"])
+        aggregator.by_scorer = {
+            k: ScoreBreakdown.from_dict(v) for k, v in data["by_scorer"].items()
+        }
+        return aggregator
+
+
+def aggregate_games(
+    player_names: List[str],
+    round_configs: Sequence[RoundConfig],
+    agents: Sequence[Agent],
+    games: Sequence[int],
+    seed: int,
+) -> ScoreAggregator:
+    """
+    Play the given game indices of the run seeded with `seed`, and
+    summarise them in one aggregator.
+    """
+    aggregator = ScoreAggregator()
+    for game in games:
+        rng = random.Random(game_seed(seed, game))
+        totals = [0] * len(player_names)
+        for config in round_configs:
+            result = play_configured_round(
+                player_names, config, agents, rng.getrandbits(32)
+            )
+            aggregator.add_round(config.scorer_type.__name__, result)
+            totals = [t + p for t, p in zip(totals, result.points)]
+        aggregator.add_game(totals)
+    return aggregator
+
+
+def run_aggregated(
+    player_names: List[str],
+    round_configs: Sequence[RoundConfig],
+    agents: Sequence[Agent],
+    num_games: int,
+    seed: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 100,
+) -> ScoreAggregator:
+    """
+    Simulate num_games games across worker processes. Each worker
+    returns one aggregator per chunk of games, which the parent merges
+    as it arrives; at most two chunks per worker are in flight, so parent
+    memory does not grow with the run length. Without a seed one is
+    drawn at random, so every chunk plays the same run.
+    """
+    if seed is None:
+        seed = random.Random().getrandbits(32)
+    result = ScoreAggregator()
+    chunks = (
+        range(start, min(start + chunk_size, num_games))
+        for start in range(0, num_games, chunk_size)
+    )
+    limit = 2 * (max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        in_flight = set()
+        for chunk in chunks:
+            if len(in_flight) >= limit:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result.merge(future.result())
+            in_flight.add(
+                executor.submit(
+                    aggregate_games, player_names, round_configs, agents, chunk, seed
+                )
+            )
+        for future in in_flight:
+            result.merge(future.result())
+    return result
@@ -0,0 +1,292 @@
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List, Optional, Sequence, Set, Tuple
+from src.cli_game import RoundConfig
+from src.ml.agent import Agent
+from src.sim.runner import play_game
+
+
+def game_seed(seed: int, game: int) -> int:
+    """
+    Seed for one game of a run. Derived from the run seed and game index
+    alone, so a game's RNG stream can be restarted from its index.
+    """
+    return random.Random(f"{seed}:{game}").getrandbits(32)
+
+
+class ResultsJournal:
+    """
+    Append-only JSON-lines log of completed games.
+    Writes are flushed and fsynced every `fsync_every` records rather
+    than per record; a crash loses at most that many unsynced results,
+    which are simply replayed.
+    """
+
+    def __init__(self, path: str, fsync_every: int = 100):
+        self.path = path
+        self.fsync_every = fsync_every
+        self._pending = 0
+        self._truncate_partial_line()
+        self._file = open(path, "ab")
+
+    def _truncate_partial_line(self) -> None:
+        """Drop a half-written last record left behind by a crash."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r+b") as f:
+            # Scan back from the end so a long journal is never read whole
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(0, position - 4096)
+                f.seek(start)
+                block = f.read(position - start)
+                newline = block.rfind(b"\n")
+                if newline != -1:
+                    last_complete = start + newline + 1
+                    break
+                position = start
+            else:
+                last_complete = 0
+            if last_complete != end:
+                f.truncate(last_complete)
+
+    @property
+    def offset(self) -> int:
+        """Byte offset just past the last appended record."""
+        return self._file.tell()
+
+    def append(self, record: dict) -> None:
+        self._file.write(json.dumps(record, separators=(",", ":")).encode() + b"\n")
+        self._pending += 1
+        if self._pending >= self.fsync_every:
+            self.sync()
+
+    def sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def close(self) -> None:
+        self.sync()
+        self._file.close()
+
+    @staticmethod
+    def read(path: str, offset: int = 0) -> Iterator[dict]:
+        """Yield complete records from `offset` on, ignoring a partial tail."""
+        if not os.path.exists(path):
+            return
+        with open(path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    return
+                yield json.loads(line)
+
+
+class CompletedGames:
+    """
+    Set of finished game indices stored compactly: everything below
+    `low_water` is done, plus a sparse set of finished games above it.
+    """
+
+    def __init__(self, low_water: int = 0, above: Sequence[int] = ()):
+        self.low_water = low_water
+        self.above: Set[int] = set(above)
+        self._compact()
+
+    def _compact(self) -> None:
+        while self.low_water in self.above:
+            self.above.remove(self.low_water)
+            self.low_water += 1
+
+    def add(self, game: int) -> None:
+        if game >= self.low_water:
+            self.above.add(game)
+            self._compact()
+
+    def __contains__(self, game: int) -> bool:
+        return game < self.low_water or game in self.above
+
+    def __len__(self) -> int:
+        return self.low_water + len(self.above)
+
+    def to_dict(self) -> dict:
+        return {"low_water": self.low_water, "above": sorted(self.above)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CompletedGames":
+        return cls(data["low_water"], data["above"])
+
+
+@dataclass
+class ScoreTotals:
+    """Default run aggregate: games played and per-seat score sums."""
+
+    games: int = 0
+    totals: List[int] = field(default_factory=list)
+
+    def update(self, result: dict) -> None:
+        scores = result["totals"]
+        if not self.totals:
+            self.totals = [0] * len(scores)
+        self.totals = [a + b for a, b in zip(self.totals, scores)]
+        self.games += 1
+
+    def to_dict(self) -> dict:
+        return {"games": self.games, "totals": self.totals}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ScoreTotals":
+        return cls(data["games"], data["totals"])
+
+
+class GameTask:
+    """
+    Picklable task that plays game `index` of a seeded run. The seed is
+    required: a resumed run must deal its remaining games exactly as the
+    interrupted one would have.
+    """
+
+    def __init__(
+        self,
+        player_names: List[str],
+        round_configs: Sequence[RoundConfig],
+        agents: Sequence[Agent],
+        seed: int,
+    ):
+        if seed is None:
+            raise ValueError("A resumable run needs a seed")
+        self.player_names = player_names
+        self.round_configs = round_configs
+        self.agents = agents
+        self.seed = seed
+
+    def __call__(self, index: int) -> dict:
+        seed = game_seed(self.seed, index)
+        return {
+            "totals": play_game(
+                self.player_names, self.round_configs, self.agents, seed
+            )
+        }
+
+
+class ResumableRun:
+    """
+    Run `num_games` tasks with crash recovery.
+
+    Every finished game is appended to a journal, and every
+    `checkpoint_every` games a compact checkpoint records the completed
+    games, the journal offset and the partial aggregate. On restart the
+    checkpoint is loaded and only the journal written after it is
+    replayed, so recovery costs one checkpoint interval, not the run.
+    Resuming with a different `num_games` or aggregate type than the
+    checkpoint was written with raises ValueError.
+
+    `task(index)` must return a JSON-serialisable dict; `aggregate_type`
+    must provide update(result), to_dict() and a from_dict() classmethod.
+    """
+
+    CHECKPOINT = "checkpoint.json"
+    JOURNAL = "journal.jsonl"
+
+    def __init__(
+        self,
+        directory: str,
+        task: Callable[[int], dict],
+        num_games: int,
+        aggregate_type=ScoreTotals,
+        checkpoint_every: int = 1000,
+        fsync_every: int = 100,
+        max_workers: Optional[int] = None,
+    ):
+        self.directory = directory
+        self.task = task
+        self.num_games = num_games
+        self.aggregate_type = aggregate_type
+        self.checkpoint_every = checkpoint_every
+        self.fsync_every = fsync_every
+        self.max_workers = max_workers
+        self.replayed = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self.completed, self.aggregate, offset = self._load_checkpoint()
+        self._journal = ResultsJournal(self._path(self.JOURNAL), fsync_every)
+        self._replay(offset)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _load_checkpoint(self) -> Tuple[CompletedGames, object, int]:
+        path = self._path(self.CHECKPOINT)
+        if not os.path.exists(path):
+            return CompletedGames(), self.aggregate_type(), 0
+        with open(path) as f:
+            data = json.load(f)
+        if data["num_games"] != self.num_games:
+            raise ValueError(
+                f"Checkpoint is for {data['num_games']} games, " f"not {self.num_games}"
+            )
+        if data["aggregate_type"] != self.aggregate_type.__name__:
+            raise ValueError(
+                f"Checkpoint aggregate is {data['aggregate_type']}, "
+                f"not {self.aggregate_type.__name__}"
+            )
+        return (
+            CompletedGames.from_dict(data["completed"]),
+            self.aggregate_type.from_dict(data["aggregate"]),
+            data["journal_offset"],
+        )
+
+    def _replay(self, offset: int) -> None:
+        for record in ResultsJournal.read(self._path(self.JOURNAL), offset):
+            if record["game"] not in self.completed:
+                self._record(record["game"], record["result"])
+                self.replayed += 1
+
+    def _record(self, game: int, result: dict) -> None:
+        self.completed.add(game)
+        self.aggregate.update(result)
+
+    def checkpoint(self) -> None:
+        """Sync the journal and atomically replace the checkpoint file."""
+        self._journal.sync()
+        data = {
+            "num_games": self.num_games,
+            "aggregate_type": self.aggregate_type.__name__,
+            "completed": self.completed.to_dict(),
+            "journal_offset": self._journal.offset,
+            "aggregate": self.aggregate.to_dict(),
+        }
+        path = self._path(self.CHECKPOINT)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    def run(self):
+        """Play every unfinished game and return the aggregate."""
+        pending = [g for g in range(self.num_games) if g not in self.completed]
+        executor = ProcessPoolExecutor(self.max_workers) if self.max_workers else None
+        try:
+            for start in range(0, len(pending), self.checkpoint_every):
+                window = pending[start : start + self.checkpoint_every]
+                results = (
+                    executor.map(self.task, window)
+                    if executor
+                    else map(self.task, window)
+                )
+                for game, result in zip(window, results):
+                    self._journal.append({"game": game, "result": result})
+                    self._record(game, result)
+                self.checkpoint()
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            self._journal.close()
+        return self.aggregate
@@ -0,0 +1,244 @@
+import argparse
+import json
+import os
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+from src.ml.double_dummy import DoubleDummySolver
+from src.models.card import Suit
+from src.models.deck import Deck
+
+# Strain s is Suit(s + 1) as trumps; the last strain is no trumps
+STRAIN_NAMES = [suit.name.lower() for suit in Suit] + ["notrump"]
+NO_TRUMP = len(Suit)
+
+
+def strains_for(trump: bool) -> List[int]:
+    """Every trump suit a trump round could turn up, or no trumps."""
+    return list(range(len(Suit))) if trump else [NO_TRUMP]
+
+
+def check_deal_size(num_players: int, cards_per_player: int, trump: bool) -> None:
+    """Deals are single-deck, so every hand and the trump card must fit in one."""
+    needed = num_players * cards_per_player + (1 if trump else 0)
+    if needed > Deck.STANDARD_DECK_SIZE:
+        extra = " and the trump card" if trump else ""
+        raise ValueError(
+            f"{num_players} hands of {cards_per_player} cards{extra} need "
+            f"{needed} cards, more than one deck holds"
+        )
+
+
+def deal_hands(seed: int, num_players: int, cards_per_player: int) -> np.ndarray:
+    """
+    The hands GameRound.setup_round deals from Deck.standard_deck seeded
+    with `seed`, as a (num_players, cards_per_player) array of Card.index.
+    """
+    cards = Deck.standard_deck(random.Random(seed)).cards
+    hands = np.empty((num_players, cards_per_player), dtype=np.int8)
+    end = len(cards)
+    for seat in range(num_players):
+        dealt = cards[end - cards_per_player : end]
+        hands[seat] = [card.index for card in dealt]
+        end -= cards_per_player
+    return hands
+
+
+def solve_deal(hands: np.ndarray, strains: Sequence[int]) -> np.ndarray:
+    """(len(strains), num_players) double-dummy tricks, seat 0 leading."""
+    num_players, cards = hands.shape
+    result = np.empty((len(strains), num_players), dtype=np.int8)
+    for row, strain in enumerate(strains):
+        trump = Suit(strain + 1) if strain != NO_TRUMP else None
+        solver = DoubleDummySolver.from_indices(hands.tolist(), trump)
+        if num_players == 2:
+            # Zero-sum: whatever seat 0 cannot hold on to goes to seat 1
+            first = solver.tricks(0)
+            result[row] = (first, cards - first)
+        else:
+            result[row] = solver.all_tricks()
+    return result
+
+
+def solve_chunk(hands: np.ndarray, strains: Sequence[int]) -> np.ndarray:
+    """Solve a (n, players, cards) block of deals; one task per worker call."""
+    return np.stack([solve_deal(deal, strains) for deal in hands])
+
+
+def solve_seed_chunk(
+    seeds: range, num_players: int, cards_per_player: int, strains: Sequence[int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Deal and solve a range of seeds in the worker, so only seeds are shipped."""
+    hands = np.stack([deal_hands(s, num_players, cards_per_player) for s in seeds])
+    return hands, solve_chunk(hands, strains)
+
+
+def read_deals(path: str, num_players: int, cards_per_player: int) -> np.ndarray:
+    """
+    Load deals as a (n, players, cards) Card.index array. Accepts the .npz
+    written by this command (its "hands" column) or JSON lines with one
+    deal per line, each a list of per-seat lists of Card.index.
+    """
+    if path.endswith(".npz"):
+        with np.load(path) as data:
+            hands = data["hands"]
+    else:
+        with open(path, encoding="utf-8") as f:
+            hands = np.array(
+                [json.loads(line) for line in f if line.strip()], dtype=np.int8
+            )
+    if hands.shape[1:] != (num_players, cards_per_player):
+        raise ValueError(
+            f"Expected deals of {num_players} hands of {cards_per_player} cards, "
+            f"got shape {hands.shape[1:]}"
+        )
+    return hands.astype(np.int8)
+
+
+def analyse_deals(
+    num_players: int,
+    cards_per_player: int,
+    trump: bool = True,
+    hands: Optional[np.ndarray] = None,
+    seeds: Optional[range] = None,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 256,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Double-dummy tricks for every deal, strain and seat, as a
+    (deals, strains, players) int8 array, returned with the hands.
+    Give either `hands` or a range of `seeds` to deal from. Deals are
+    solved in chunks across worker processes, with at most two chunks per
+    worker in flight; results land in preallocated arrays in deal order.
+    """
+    if (hands is None) == (seeds is None):
+        raise ValueError("Give exactly one of hands or seeds")
+    check_deal_size(num_players, cards_per_player, trump)
+    strains = strains_for(trump)
+    count = len(hands) if hands is not None else len(seeds)
+    tricks = np.empty((count, len(strains), num_players), dtype=np.int8)
+    if hands is None:
+        hands = np.empty((count, num_players, cards_per_player), dtype=np.int8)
+        from_seeds = True
+    else:
+        from_seeds = False
+
+    limit = 2 * (max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        in_flight = {}
+
+        def collect(futures):
+            for future in futures:
+                start = in_flight.pop(future)
+                if from_seeds:
+                    dealt, solved = future.result()
+                    hands[start : start + len(dealt)] = dealt
+                else:
+                    solved = future.result()
+                tricks[start : start + len(solved)] = solved
+
+        for start in range(0, count, chunk_size):
+            if len(in_flight) >= limit:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+            stop = min(start + chunk_size, count)
+            if from_seeds:
+                future = executor.submit(
+                    solve_seed_chunk,
+                    seeds[start:stop],
+                    num_players,
+                    cards_per_player,
+                    strains,
+                )
+            else:
+                future = executor.submit(solve_chunk, hands[start:stop], strains)
+            in_flight[future] = start
+        collect(list(in_flight))
+    return hands, tricks
+
+
+def summarise(tricks: np.ndarray, cards_per_player: int, trump: bool = True) -> dict:
+    """Per strain and seat: mean and spread of tricks, and their histogram."""
+    summary = {"deals": int(len(tricks)), "strains": {}}
+    for row, strain in enumerate(strains_for(trump)):
+        column = tricks[:, row, :].astype(np.int64)
+        summary["strains"][STRAIN_NAMES[strain]] = {
+            "mean": column.mean(axis=0).tolist(),
+            "std": column.std(axis=0).tolist(),
+            "histogram": [
+                np.bincount(column[:, seat], minlength=cards_per_player + 1).tolist()
+                for seat in range(column.shape[1])
+            ],
+        }
+    return summary
+
+
+def save_table(
+    path: str,
+    hands: np.ndarray,
+    tricks: np.ndarray,
+    trump: bool = True,
+    seeds: Optional[range] = None,
+) -> None:
+    """Write the columnar table: hands, tricks and the strain labels."""
+    columns = {
+        "hands": hands,
+        "tricks": tricks,
+        "strains": np.array([STRAIN_NAMES[s] for s in strains_for(trump)]),
+    }
+    if seeds is not None:
+        columns["seeds"] = np.arange(seeds.start, seeds.stop, dtype=np.int64)
+    np.savez_compressed(path, **columns)
+
+
+def _seed_range(text: str) -> range:
+    start, _, stop = text.partition(":")
+    return range(int(start), int(stop))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Double-dummy trick tables for a set of deals"
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--deals", help="JSON-lines or .npz file of deals")
+    source.add_argument(
+        "--seeds", type=_seed_range, help="deal from seeds START:STOP instead"
+    )
+    parser.add_argument("--players", type=int, required=True)
+    parser.add_argument("--cards", type=int, required=True)
+    parser.add_argument("--no-trump", action="store_true", help="no-trump rounds")
+    parser.add_argument("--out", required=True, help="output .npz path")
+    parser.add_argument("--workers", type=int, help="worker processes (all cores)")
+    parser.add_argument("--chunk-size", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    trump = not args.no_trump
+    try:
+        check_deal_size(args.players, args.cards, trump)
+    except ValueError as e:
+        parser.error(str(e))
+    hands = read_deals(args.deals, args.players, args.cards) if args.deals else None
+    hands, tricks = analyse_deals(
+        args.players,
+        args.cards,
+        trump,
+        hands=hands,
+        seeds=args.seeds,
+        max_workers=args.workers,
+        chunk_size=args.chunk_size,
+    )
+    save_table(args.out, hands, tricks, trump, args.seeds)
+    summary = summarise(tricks, args.cards, trump)
+    with open(os.path.splitext(args.out)[0] + ".summary.json", "w") as f:
+        json.dump(summary, f, indent=2)
+
+    print(f"Solved {summary['deals']} deals, written to {args.out}")
+    for name, stats in summary["strains"].items():
+        means = " ".join(f"{m:5.2f}" for m in stats["mean"])
+        print(f"{name:>10}: mean tricks by seat {means}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import permutations
+from typing import List, Optional, Sequence, Tuple
+from src.cli_game import GameController, RoundConfig
+from src.ml.agent import Agent
+from src.models.card import Card
+from src.models.deck import Deck
+from src.models.game_round import GameRound, HistoryMode
+from src.sim.runner import play_round
+
+
+def deal_seed(seed: int, game: int, round_num: int) -> int:
+    """Derive the seed for one deal, independent of play order or process."""
+    return random.Random(f"{seed}:{game}:{round_num}").getrandbits(32)
+
+
+def seat_orders(
+    num_agents: int, all_permutations: bool = False
+) -> List[Tuple[int, ...]]:
+    """
+    Seatings to replay each deal with; order[seat] is the agent in that seat.
+    Cyclic rotations by default, so each agent holds every hand once.
+    """
+    if all_permutations:
+        return list(permutations(range(num_agents)))
+    return [
+        tuple((seat + shift) % num_agents for seat in range(num_agents))
+        for shift in range(num_agents)
+    ]
+
+
+@dataclass
+class DealResult:
+    """One deal replayed under every seating; points are indexed by agent."""
+
+    game: int
+    round: int
+    rotations: List[List[int]]
+
+    @property
+    def scores(self) -> List[float]:
+        """Each agent's mean points over the seatings."""
+        return [sum(column) / len(column) for column in zip(*self.rotations)]
+
+
+def play_duplicate_deal(
+    player_names: List[str],
+    config: RoundConfig,
+    agents: Sequence[Agent],
+    orders: Sequence[Tuple[int, ...]],
+    game: int,
+    round_num: int,
+    seed: int,
+) -> DealResult:
+    """Deal one round once and replay it with every seating of the agents."""
+    deal = deal_seed(seed, game, round_num)
+    cards: Tuple[Card, ...] = config.new_deck(
+        len(player_names), random.Random(deal)
+    ).cards
+    rotations = []
+    for order in orders:
+        seated = [agents[i] for i in order]
+        for agent in seated:
+            agent.reset(deal)
+        round = GameRound(player_names, history=HistoryMode.COUNTS)
+        round.setup_round(
+            config.cards_per_player, trump=config.use_trump, deck=Deck(cards)
+        )
+        result = play_round(round, config.scorer_type(**config.scorer_params), seated)
+        by_agent = [0] * len(agents)
+        for seat, agent_idx in enumerate(order):
+            by_agent[agent_idx] = result.points[seat]
+        rotations.append(by_agent)
+    return DealResult(game, round_num, rotations)
+
+
+def _play_duplicate_deal_task(args) -> DealResult:
+    return play_duplicate_deal(*args)
+
+
+@dataclass
+class DuplicateResult:
+    deals: List[DealResult] = field(default_factory=list)
+    # The run's base seed, drawn at random when none was given
+    seed: Optional[int] = None
+
+    def paired_differences(self, first: int, second: int) -> List[float]:
+        """Per-deal score difference between two agents on identical cards."""
+        return [deal.scores[first] - deal.scores[second] for deal in self.deals]
+
+    def compare(self, first: int, second: int) -> Tuple[float, float]:
+        """Mean paired difference per deal and its standard error."""
+        diffs = self.paired_differences(first, second)
+        n = len(diffs)
+        mean = sum(diffs) / n
+        if n < 2:
+            return mean, math.inf
+        variance = sum((d - mean) ** 2 for d in diffs) / (n - 1)
+        return mean, math.sqrt(variance / n)
+
+    def totals(self) -> List[float]:
+        """Each agent's summed mean score over all deals."""
+        return [sum(column) for column in zip(*(d.scores for d in self.deals))]
+
+
+def run_duplicate(
+    agents: Sequence[Agent],
+    games: int,
+    seed: Optional[int] = None,
+    round_configs: Optional[Sequence[RoundConfig]] = None,
+    all_permutations: bool = False,
+    max_workers: Optional[int] = None,
+) -> DuplicateResult:
+    """
+    Duplicate-format tournament: every (game, round) of the schedule is
+    dealt once from a seeded deck, with the same trump card, and replayed
+    under each seating of the agents. Results are paired per deal, which
+    cancels out most of the card luck.
+
+    Deals run in-process unless max_workers is given. Without a seed a
+    random one is drawn, as in runner, and kept on the result.
+    """
+    if seed is None:
+        seed = random.Random().getrandbits(32)
+    player_names = [f"Seat {i + 1}" for i in range(len(agents))]
+    if round_configs is None:
+        round_configs = GameController(player_names).round_configs
+    orders = seat_orders(len(agents), all_permutations)
+    tasks = [
+        (player_names, config, agents, orders, game, round_num, seed)
+        for game in range(games)
+        for round_num, config in enumerate(round_configs, 1)
+    ]
+
+    if max_workers is None:
+        return DuplicateResult([_play_duplicate_deal_task(t) for t in tasks], seed)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        deals = list(executor.map(_play_duplicate_deal_task, tasks))
+    return DuplicateResult(deals, seed)
@@ -0,0 +1,95 @@
+import random
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Optional, Sequence
+from src.ml.agent import Agent
+from src.models.game_round import GameRound, HistoryMode, Phase
+from src.models.scoring import RoundScorer, BiddingScorer
+
+if TYPE_CHECKING:
+    from src.cli_game import RoundConfig
+
+
+@dataclass
+class RoundResult:
+    """Per-seat outcome of one round, in seat order. Cheap to pickle."""
+
+    points: List[int]
+    tricks: List[int]
+    bids: Optional[List[int]] = None
+
+
+def play_round(
+    round: GameRound, scorer: RoundScorer, agents: Sequence[Agent]
+) -> RoundResult:
+    """Play a dealt round to completion with one agent per seat."""
+    if len(agents) != len(round.players):
+        raise ValueError(f"Expected {len(round.players)} agents, got {len(agents)}")
+
+    num_tricks = len(round.get_hand(round.players[0]))
+    bidding = isinstance(scorer, BiddingScorer)
+    if bidding:
+        round.start_bidding()
+
+    while round.phase != Phase.OVER:
+        seat = round.to_move_index
+        player = round.players[seat]
+        if round.phase == Phase.BIDDING:
+            round.step(agents[seat].choose_bid(round, player, num_tricks, round.bids))
+        else:
+            round.step(agents[seat].choose_card(round, player))
+
+    if bidding and not scorer.set_bids(round.bids, num_tricks):
+        raise ValueError("Invalid bids")
+
+    score = scorer.score_round(round)
+    return RoundResult(
+        points=[score.points[player] for player in round.players],
+        tricks=[round.trick_count(player) for player in round.players],
+        bids=[round.bids[player] for player in round.players] if bidding else None,
+    )
+
+
+def play_configured_round(
+    player_names: List[str],
+    config: "RoundConfig",
+    agents: Sequence[Agent],
+    seed: Optional[int] = None,
+) -> RoundResult:
+    """
+    Deal and play one round of a GameController schedule.
+    Module-level so it can be shipped to worker processes.
+    """
+    # Without a seed the round draws fresh entropy, and agents are still
+    # reseeded so copies unpickled from one state do not share a stream
+    rng = random.Random(seed)
+    for agent in agents:
+        agent.reset(rng.getrandbits(32))
+
+    round = GameRound(player_names, history=HistoryMode.COUNTS)
+    round.setup_round(
+        config.cards_per_player,
+        trump=config.use_trump,
+        deck=config.new_deck(len(player_names), rng),
+    )
+    scorer = config.scorer_type(**config.scorer_params)
+    return play_round(round, scorer, agents)
+
+
+def play_game(
+    player_names: List[str],
+    round_configs: Sequence["RoundConfig"],
+    agents: Sequence[Agent],
+    seed: Optional[int] = None,
+) -> List[int]:
+    """
+    Play a whole schedule in-process and return per-seat totals.
+    Rounds are seeded exactly as GameController.play_game_parallel seeds them.
+    """
+    rng = random.Random(seed)
+    totals = [0] * len(player_names)
+    for config in round_configs:
+        result = play_configured_round(
+            player_names, config, agents, rng.getrandbits(32)
+        )
+        totals = [total + points for total, points in zip(totals, result.points)]
+    return totals
@@ -0,0 +1,140 @@
+import math
+import random
+from dataclasses import dataclass
+from enum import Enum, auto
+from typing import Callable, List, Optional, Sequence
+from src.cli_game import GameController, RoundConfig
+from src.ml.agent import Agent
+from src.sim.runner import play_game
+
+
+class Decision(Enum):
+    FIRST_BETTER = auto()
+    SECOND_BETTER = auto()
+    EQUIVALENT = auto()
+
+
+@dataclass
+class MatchEstimate:
+    """Running estimate of the mean per-game score difference."""
+
+    games: int
+    mean: float
+    stderr: float
+    decision: Optional[Decision] = None
+
+    def interval(self, z: float = 1.96) -> tuple:
+        return (self.mean - z * self.stderr, self.mean + z * self.stderr)
+
+    def __str__(self):
+        low, high = self.interval()
+        verdict = self.decision.name if self.decision else "undecided"
+        return (
+            f"{self.games} games: {self.mean:+.2f} ± {1.96 * self.stderr:.2f} "
+            f"[{low:+.2f}, {high:+.2f}] {verdict}"
+        )
+
+
+class SequentialTest:
+    """
+    Sobel-Wald three-way sequential probability ratio test on a stream
+    of score differences (first agent minus second).
+
+    Two one-sided SPRTs run side by side, each testing "no difference"
+    against a true mean difference of +margin or -margin, with the
+    variance estimated from the data so far. The stream stops as soon
+    as either alternative is accepted, or both are rejected, which means
+    the agents are equivalent to within the margin.
+    """
+
+    def __init__(
+        self,
+        margin: float,
+        alpha: float = 0.05,
+        beta: float = 0.05,
+        min_games: int = 20,
+    ):
+        if margin <= 0:
+            raise ValueError("margin must be positive")
+        self.margin = margin
+        self.min_games = max(min_games, 2)
+        # Each one-sided test gets half the false-positive budget
+        self.upper_bound = math.log((1 - beta) / (alpha / 2))
+        self.lower_bound = math.log(beta / (1 - alpha / 2))
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.decision: Optional[Decision] = None
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def estimate(self) -> MatchEstimate:
+        stderr = math.sqrt(self.variance / self.count) if self.count else math.inf
+        return MatchEstimate(self.count, self._mean, stderr, self.decision)
+
+    def log_likelihood_ratios(self) -> tuple:
+        """LLRs for "first better by margin" and "second better by margin"."""
+        if self.count < 2:
+            return (0.0, 0.0)
+        # Guard against a degenerate all-equal stream
+        variance = max(self.variance, 1e-9)
+        scale = self.count * self.margin / variance
+        return (
+            scale * (self._mean - self.margin / 2),
+            scale * (-self._mean - self.margin / 2),
+        )
+
+    def update(self, difference: float) -> Optional[Decision]:
+        """Add one observation; returns the decision once one is reached."""
+        self.count += 1
+        delta = difference - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (difference - self._mean)
+
+        if self.decision is None and self.count >= self.min_games:
+            first, second = self.log_likelihood_ratios()
+            if first >= self.upper_bound:
+                self.decision = Decision.FIRST_BETTER
+            elif second >= self.upper_bound:
+                self.decision = Decision.SECOND_BETTER
+            elif first <= self.lower_bound and second <= self.lower_bound:
+                self.decision = Decision.EQUIVALENT
+        return self.decision
+
+
+def run_match(
+    first: Agent,
+    second: Agent,
+    test: SequentialTest,
+    max_games: int = 10000,
+    seed: Optional[int] = None,
+    round_configs: Optional[Sequence[RoundConfig]] = None,
+    callback: Optional[Callable[[MatchEstimate], None]] = None,
+) -> MatchEstimate:
+    """
+    Play two-player games between two agents until the test reaches a
+    decision or max_games is hit. Agents swap seats every game.
+    `callback` receives the live estimate after each game.
+    """
+    names: List[str] = ["First", "Second"]
+    if round_configs is None:
+        round_configs = GameController(names).round_configs
+    rng = random.Random(seed)
+
+    for game in range(max_games):
+        swapped = game % 2 == 1
+        agents = [second, first] if swapped else [first, second]
+        game_seed = rng.getrandbits(32) if seed is not None else None
+        totals = play_game(names, round_configs, agents, game_seed)
+        difference = totals[1] - totals[0] if swapped else totals[0] - totals[1]
+
+        decision = test.update(difference)
+        if callback is not None:
+            callback(test.estimate)
+        if decision is not None:
+            break
+
+    return test.estimate
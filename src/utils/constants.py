@@ -0,0 +1,3 @@
+# Table sizes the CLIs and the server accept; extra decks are added as needed
+MIN_PLAYERS = 2
+MAX_PLAYERS = 10
@@ -0,0 +1,14 @@
+from src.ml.agent import Agent
+
+
+class LowestCardAgent(Agent):
+    def choose_bid(self, round, player, num_tricks, bids):
+        return 0
+
+    def choose_card(self, round, player):
+        return min(round.get_valid_plays(player), key=lambda c: c.rank.value)
+
+
+class HighestCardAgent(LowestCardAgent):
+    def choose_card(self, round, player):
+        return max(round.get_valid_plays(player), key=lambda c: c.rank.value)
@@ -0,0 +1,124 @@
+import numpy as np
+from src.cli_game import RoundConfig
+from src.ml.agent import RandomAgent
+from src.models.scoring import AllOrNothingScorer, BiddingScorer, FixedBidScorer
+from src.sim.aggregate import (
+    Histogram,
+    RunningStats,
+    ScoreAggregator,
+    aggregate_games,
+    run_aggregated,
+)
+from src.sim.checkpoint import GameTask, ResumableRun
+from src.sim.runner import RoundResult
+
+SCHEDULE = [
+    RoundConfig(3, True, BiddingScorer, {}),
+    RoundConfig(3, True, AllOrNothingScorer, {}),
+    RoundConfig(4, False, FixedBidScorer, {"target_tricks": 2, "points": 20}),
+]
+NAMES = ["A", "B", "C"]
+AGENTS = [RandomAgent(), RandomAgent(), RandomAgent()]
+
+
+def test_running_stats_merge_matches_numpy():
+    values = np.random.default_rng(0).normal(5, 3, size=1000)
+    left, right = RunningStats(), RunningStats()
+    for v in values[:300]:
+        left.update(v)
+    right.update_many(values[300:])
+    left.merge(right)
+
+    assert left.count == 1000
+    assert np.isclose(left.mean, values.mean())
+    assert np.isclose(left.variance, values.var(ddof=1))
+    assert left.min == values.min() and left.max == values.max()
+    assert RunningStats.from_dict(left.to_dict()).to_dict() == left.to_dict()
+
+
+def test_histogram_bins_and_overflow():
+    histogram = Histogram(0, 10, 5)
+    histogram.update([-1, 0, 1.9, 2, 9.99, 10, 50])
+    assert histogram.counts.tolist() == [1, 2, 1, 0, 0, 1, 2]
+    other = Histogram.from_dict(histogram.to_dict())
+    histogram.merge(other)
+    assert histogram.counts.sum() == 14
+
+
+def test_breakdown_tracks_bid_accuracy():
+    aggregator = ScoreAggregator()
+    aggregator.add_round("BiddingScorer", RoundResult([12, 0], [2, 1], [2, 0]))
+    aggregator.add_round("FixedBidScorer", RoundResult([20, 0], [3, 0]))
+    assert aggregator.by_scorer["BiddingScorer"].bid_accuracy == 0.5
+    assert aggregator.by_scorer["FixedBidScorer"].bid_accuracy is None
+
+
+def test_split_aggregation_merges_exactly():
+    whole = aggregate_games(NAMES, SCHEDULE, AGENTS, range(20), seed=1)
+    first = aggregate_games(NAMES, SCHEDULE, AGENTS, range(0, 7), seed=1)
+    second = aggregate_games(NAMES, SCHEDULE, AGENTS, range(7, 20), seed=1)
+    first.merge(ScoreAggregator.from_dict(second.to_dict()))
+
+    assert first.games.count == whole.games.count == 60
+    assert np.isclose(first.games.mean, whole.games.mean)
+    assert np.isclose(first.games.m2, whole.games.m2)
+    assert set(first.by_scorer) == {
+        "BiddingScorer",
+        "AllOrNothingScorer",
+        "FixedBidScorer",
+    }
+    for name, breakdown in whole.by_scorer.items():
+        merged = first.by_scorer[name]
+        assert merged.histogram.counts.tolist() == breakdown.histogram.counts.tolist()
+        assert merged.bids_made == breakdown.bids_made
+
+
+def test_merge_leaves_other_unchanged():
+    first = aggregate_games(NAMES, SCHEDULE, AGENTS, range(0, 3), seed=1)
+    second = aggregate_games(NAMES, SCHEDULE, AGENTS, range(3, 6), seed=1)
+    before = second.to_dict()
+    target = ScoreAggregator()
+    target.merge(second)
+    target.merge(first)
+
+    assert second.to_dict() == before
+    assert target.games.count == 18
+
+
+def test_games_match_checkpoint_task_seeding():
+    task = GameTask(NAMES, SCHEDULE, AGENTS, seed=4)
+    aggregator = aggregate_games(NAMES, SCHEDULE, AGENTS, [3], seed=4)
+    totals = task(3)["totals"]
+    assert np.isclose(aggregator.games.mean, np.mean(totals))
+
+
+def test_parallel_run():
+    serial = aggregate_games(NAMES, SCHEDULE, AGENTS, range(30), seed=2)
+    parallel = run_aggregated(
+        NAMES, SCHEDULE, AGENTS, 30, seed=2, max_workers=2, chunk_size=4
+    )
+    assert parallel.games.count == serial.games.count
+    assert np.isclose(parallel.games.mean, serial.games.mean)
+    assert (
+        parallel.game_histogram.counts.tolist() == serial.game_histogram.counts.tolist()
+    )
+
+
+def test_unseeded_runs_differ():
+    runs = [
+        run_aggregated(NAMES, SCHEDULE, AGENTS, 8, max_workers=2, chunk_size=4)
+        for _ in range(2)
+    ]
+    assert runs[0].to_dict() != runs[1].to_dict()
+
+
+def test_resumable_run_with_aggregator(tmp_path):
+    def task(game):
+        return aggregate_games(NAMES, SCHEDULE, AGENTS, [game], seed=3).to_dict()
+
+    result = ResumableRun(
+        str(tmp_path), task, 10, aggregate_type=ScoreAggregator, checkpoint_every=3
+    ).run()
+    expected = aggregate_games(NAMES, SCHEDULE, AGENTS, range(10), seed=3)
+    assert result.games.count == expected.games.count
+    assert np.isclose(result.games.mean, expected.games.mean)
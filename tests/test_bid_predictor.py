@@ -0,0 +1,94 @@
+import random
+import numpy as np
+from src.ml.agent import RandomAgent
+from src.ml.bid_predictor import (
+    FEATURE_NAMES,
+    FEATURE_SIZE,
+    NUM_CLASSES,
+    BidPredictor,
+    BidPredictorAgent,
+    best_bid,
+    hand_features,
+    simulate_distribution,
+    simulate_rounds,
+)
+from src.models.card import Card, Rank, Suit
+from src.models.deck import Deck
+from src.models.game_round import GameRound
+from src.models.scoring import BiddingScorer
+from src.sim.runner import play_round
+
+
+def test_hand_features():
+    hand = [
+        Card(Suit.SPADES, Rank.ACE),
+        Card(Suit.SPADES, Rank.TWO),
+        Card(Suit.HEARTS, Rank.ACE),
+        Card(Suit.HEARTS, Rank.KING),
+        Card(Suit.CLUBS, Rank.FIVE),
+    ]
+    features = dict(zip(FEATURE_NAMES, hand_features(hand, Suit.SPADES, 1, 3)))
+    assert features["trumps"] == 2
+    assert features["trump_honours"] == 1
+    assert features["side_aces"] == 1
+    assert features["side_kings"] == 1
+    assert features["voids"] == 1
+    assert features["singletons"] == 1
+    assert features["longest_side_suit"] == 2
+    assert features["seat"] == 0.5
+    assert features["cards_per_player"] == 5
+
+
+def test_fit_learns_and_masks_impossible_counts():
+    features, tricks = simulate_rounds(400, seed=0, cards_range=(1, 4))
+    predictor = BidPredictor.fit(features, tricks, epochs=100)
+    probs = predictor.predict(features)
+    assert probs.shape == (len(features), NUM_CLASSES)
+    np.testing.assert_allclose(probs.sum(axis=1), 1.0)
+    cards = features[:, FEATURE_NAMES.index("cards_per_player")]
+    assert np.all(probs[np.arange(NUM_CLASSES) > cards[:, None]] == 0)
+    # Better than a uniform guess over the possible trick counts
+    loss = -np.log(probs[np.arange(len(tricks)), tricks]).mean()
+    assert loss < np.log(cards + 1).mean()
+
+
+def test_save_load_round_trip(tmp_path):
+    features, tricks = simulate_rounds(50, seed=1)
+    predictor = BidPredictor.fit(features, tricks, epochs=10)
+    path = str(tmp_path / "bids.npz")
+    predictor.save(path)
+    np.testing.assert_allclose(
+        BidPredictor.load(path).predict(features), predictor.predict(features)
+    )
+
+
+def test_shipped_weights_load():
+    predictor = BidPredictor.load()
+    assert predictor.weights.shape == (FEATURE_SIZE, NUM_CLASSES)
+
+
+def test_best_bid_maximises_expected_points():
+    distribution = np.zeros(NUM_CLASSES)
+    distribution[[1, 2]] = [0.4, 0.45]
+    assert best_bid(distribution, [0, 1, 2]) == 2
+    assert best_bid(distribution, [0, 1]) == 1
+
+
+def test_agent_bids_legally():
+    agent = BidPredictorAgent(BidPredictor.load(), RandomAgent(seed=0))
+    for seed in range(5):
+        round = GameRound(["A", "B", "C"])
+        round.setup_round(4, trump=True, deck=Deck.standard_deck(random.Random(seed)))
+        result = play_round(round, BiddingScorer(), [agent] * 3)
+        assert sum(result.bids) != 4
+
+
+def test_simulated_distribution():
+    hand = [Card(Suit.HEARTS, Rank.ACE), Card(Suit.HEARTS, Rank.KING)]
+    trump = Card(Suit.HEARTS, Rank.TWO)
+    distribution = simulate_distribution(
+        hand, trump, 0, 2, samples=50, rng=random.Random(0)
+    )
+    assert distribution.sum() == 1.0
+    # Top trumps always win both tricks
+    assert distribution[2] == 1.0
@@ -0,0 +1,107 @@
+import random
+from multiprocessing import Manager
+from src.ml.agent import Agent
+from src.ml.cache import CachedAgent, information_set_key
+from src.ml.rollout import HeuristicAgent
+from src.models.deck import Deck
+from src.models.game_round import GameRound
+from src.models.scoring import BiddingScorer
+from src.sim.runner import play_round
+
+
+class LowBidHeuristic(HeuristicAgent):
+    """HeuristicAgent with deterministic bids: zero unless that is illegal."""
+
+    def choose_bid(self, round, player, num_tricks, bids):
+        is_last = len(bids) == len(round.players) - 1
+        return 1 if is_last and sum(bids.values()) + 1 == num_tricks else 0
+
+
+class CountingAgent(Agent):
+    """Deterministic agent that counts how often it is really asked."""
+
+    def __init__(self):
+        self.inner = LowBidHeuristic()
+        self.calls = 0
+
+    def choose_bid(self, round, player, num_tricks, bids):
+        self.calls += 1
+        return self.inner.choose_bid(round, player, num_tricks, bids)
+
+    def choose_card(self, round, player):
+        self.calls += 1
+        return self.inner.choose_card(round, player)
+
+
+def play(agent, seed, cards=3):
+    round = GameRound(["A", "B"])
+    round.setup_round(cards, deck=Deck.standard_deck(random.Random(seed)))
+    return play_round(round, BiddingScorer(), [agent, agent])
+
+
+def test_key_ignores_hand_order():
+    round = GameRound(["A", "B"])
+    round.setup_round(3, deck=Deck.standard_deck(random.Random(0)))
+    player = round.players[0]
+    key = information_set_key(round, player)
+    round.hands[player].reverse()
+    assert information_set_key(round, player) == key
+    assert information_set_key(round, player, bids={}) != key
+
+
+def test_key_tracks_played_cards():
+    round = GameRound(["A", "B"])
+    round.setup_round(2, trump=False, deck=Deck.standard_deck(random.Random(0)))
+    before = information_set_key(round, round.players[1])
+    round.step(round.get_valid_plays(round.players[0])[0])
+    assert information_set_key(round, round.players[1]) != before
+
+
+def test_repeat_rounds_hit_the_cache():
+    agent = CountingAgent()
+    cached = CachedAgent(agent)
+    first = play(cached, seed=5)
+    calls = agent.calls
+    second = play(cached, seed=5)
+    assert second == first
+    assert agent.calls == calls
+    assert cached.stats.hits == calls
+    assert cached.stats.misses == calls
+    assert cached.stats.hit_rate == 0.5
+
+
+def test_cached_play_matches_uncached():
+    for seed in range(10):
+        assert play(CachedAgent(CountingAgent()), seed, 5) == play(
+            CountingAgent(), seed, 5
+        )
+
+
+def test_lru_evicts_oldest():
+    cached = CachedAgent(CountingAgent(), max_size=4)
+    play(cached, seed=1, cards=5)
+    assert len(cached) == 4
+
+
+def test_shared_tier_across_agents():
+    with Manager() as manager:
+        shared = manager.dict()
+        first = CachedAgent(CountingAgent(), shared=shared)
+        play(first, seed=2)
+        inner = CountingAgent()
+        second = CachedAgent(inner, shared=shared)
+        play(second, seed=2)
+        assert inner.calls == 0
+        assert second.stats.shared_hits == first.stats.misses
+
+
+def test_cache_returns_card_from_hand():
+    cached = CachedAgent(HeuristicAgent())
+    round = GameRound(["A", "B"])
+    round.setup_round(2, trump=False, deck=Deck.standard_deck(random.Random(4)))
+    player = round.players[0]
+    first = cached.choose_card(round, player)
+    again = cached.choose_card(round, player)
+    assert cached.stats.hits == 1
+    assert again == first
+    assert any(card is again for card in round.get_hand(player))
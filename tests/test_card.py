@@ -48,3 +48,10 @@ def test_card_str_all_suits():
     assert str(diamonds) == "7♦"
     assert str(clubs) == "7♣"
     assert str(spades) == "7♠"
+
+
+def test_card_index_is_dense():
+    from src.models.deck import Deck
+
+    indices = sorted(card.index for card in Deck.standard_deck().cards)
+    assert indices == list(range(52))
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from src.ml.cfr import CFRSolver
+from src.models.card import Card, Suit, Rank
+
+CARDS = [
+    Card(suit, rank)
+    for suit in (Suit.HEARTS, Suit.SPADES)
+    for rank in (Rank.TWO, Rank.FIVE, Rank.NINE)
+]
+
+
+def test_rejects_large_variants():
+    with pytest.raises(ValueError):
+        CFRSolver(CARDS, 5)
+    with pytest.raises(ValueError):
+        CFRSolver(CARDS[:3], 2)
+
+
+def test_strategies_are_distributions():
+    solver = CFRSolver(CARDS, 2, trump_suit=Suit.SPADES)
+    solver.solve(10)
+    strategy = solver.average_strategy()
+    assert strategy.shape == (solver.num_infosets, solver.num_actions)
+    np.testing.assert_allclose(strategy.sum(axis=1), 1.0)
+    assert (strategy[~solver._mask] == 0).all()
+
+
+@pytest.mark.parametrize("plus", [True, False])
+def test_exploitability_converges(plus):
+    solver = CFRSolver(CARDS[:4], 1, trump_suit=Suit.HEARTS, plus=plus)
+    uniform = solver.average_strategy()
+    solver.solve(300)
+    assert solver.exploitability(uniform) > 1.0
+    assert 0 <= solver.exploitability() < 0.05
+
+
+def test_exploitability_of_heuristic_policy():
+    solver = CFRSolver(CARDS, 2)
+    solver.solve(200)
+
+    def bid_zero_play_lowest(player, hand, history, actions):
+        if len(history) < 2:
+            return min(actions)
+        return min(actions, key=lambda card: card.rank.value)
+
+    heuristic = solver.policy_strategy(bid_zero_play_lowest)
+    assert solver.exploitability(heuristic) > solver.exploitability()
+
+
+def test_infoset_lookup():
+    solver = CFRSolver(CARDS, 1)
+    hand = [CARDS[0]]
+    index = solver.infoset_index(0, hand, ())
+    assert solver.infoset_keys[index][0] == 0
+    follow_up = solver.infoset_index(1, [CARDS[1]], (0, 0, CARDS[0]))
+    assert solver.infoset_keys[follow_up][0] == 1
+    with pytest.raises(ValueError):
+        solver.infoset_index(0, hand, (0, 0, CARDS[0]))
@@ -0,0 +1,123 @@
+import json
+import os
+import pytest
+from src.cli_game import RoundConfig
+from src.ml.agent import RandomAgent
+from src.models.scoring import BiddingScorer
+from src.sim.checkpoint import (
+    CompletedGames,
+    GameTask,
+    ResultsJournal,
+    ResumableRun,
+    ScoreTotals,
+)
+
+SCHEDULE = [RoundConfig(2, True, BiddingScorer, {})]
+
+
+def make_task():
+    return GameTask(["A", "B"], SCHEDULE, [RandomAgent(), RandomAgent()], seed=9)
+
+
+class Crash(Exception):
+    pass
+
+
+class CrashingTask:
+    def __init__(self, task, crash_at):
+        self.task = task
+        self.crash_at = crash_at
+
+    def __call__(self, index):
+        if index == self.crash_at:
+            raise Crash()
+        return self.task(index)
+
+
+def test_completed_games_compacts():
+    completed = CompletedGames()
+    for game in [0, 2, 1, 5]:
+        completed.add(game)
+    assert completed.to_dict() == {"low_water": 3, "above": [5]}
+    assert 4 not in completed and 5 in completed
+    assert len(CompletedGames.from_dict(completed.to_dict())) == 4
+
+
+def test_journal_ignores_partial_tail(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    journal = ResultsJournal(path, fsync_every=2)
+    journal.append({"game": 0})
+    journal.append({"game": 1})
+    journal.close()
+    with open(path, "ab") as f:
+        f.write(b'{"game": 2')  # Torn write
+
+    assert [r["game"] for r in ResultsJournal.read(path)] == [0, 1]
+    ResultsJournal(path).close()
+    with open(path, "rb") as f:
+        assert f.read().endswith(b"}\n")
+
+
+def test_resume_after_crash_matches_clean_run(tmp_path):
+    clean = ResumableRun(str(tmp_path / "clean"), make_task(), 25).run()
+
+    directory = str(tmp_path / "crashy")
+    run = ResumableRun(
+        directory, CrashingTask(make_task(), 17), 25, checkpoint_every=5, fsync_every=1
+    )
+    with pytest.raises(Crash):
+        run.run()
+
+    with open(os.path.join(directory, ResumableRun.CHECKPOINT)) as f:
+        assert json.load(f)["completed"]["low_water"] == 15
+
+    resumed = ResumableRun(directory, make_task(), 25, checkpoint_every=5)
+    # Only games journaled after the last checkpoint are replayed
+    assert resumed.replayed == 2
+    assert len(resumed.completed) == 17
+    result = resumed.run()
+
+    assert result == clean
+    assert result.games == 25
+
+
+def test_resume_rejects_mismatched_checkpoint(tmp_path):
+    directory = str(tmp_path / "run")
+    ResumableRun(directory, make_task(), 4).run()
+
+    with pytest.raises(ValueError, match="4 games"):
+        ResumableRun(directory, make_task(), 5)
+
+    class OtherTotals(ScoreTotals):
+        pass
+
+    with pytest.raises(ValueError, match="ScoreTotals"):
+        ResumableRun(directory, make_task(), 4, aggregate_type=OtherTotals)
+
+
+def test_parallel_run(tmp_path):
+    serial = ResumableRun(str(tmp_path / "serial"), make_task(), 12).run()
+    parallel = ResumableRun(
+        str(tmp_path / "parallel"), make_task(), 12, checkpoint_every=4, max_workers=2
+    ).run()
+    assert parallel == serial
+
+
+def test_score_totals_round_trip():
+    totals = ScoreTotals()
+    totals.update({"totals": [3, -1]})
+    totals.update({"totals": [1, 1]})
+    assert ScoreTotals.from_dict(totals.to_dict()) == ScoreTotals(2, [4, 0])
+
+
+def test_journal_truncates_unterminated_single_record(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    with open(path, "wb") as f:
+        f.write(b'{"game": 0')
+    ResultsJournal(path).close()
+    assert os.path.getsize(path) == 0
+
+
+def test_game_task_requires_seed():
+    with pytest.raises(ValueError):
+        GameTask(["A", "B"], SCHEDULE, [RandomAgent(), RandomAgent()], seed=None)
@@ -0,0 +1,87 @@
+import io
+import json
+import pytest
+from src import cli, cli_game
+from src.cli_helpers import Console, ScriptedConsole, set_console
+from src.models.deck import Deck
+from src.models.events import JsonlSink
+from src.models.game_round import GameRound
+
+# Two players, no trump, one card each, all-or-nothing scoring, then play
+ROUND_SCRIPT = "\n".join(["2", "Alice", "Bob", "n", "1", "2", "0", "0"]) + "\n"
+
+
+def write_script(tmp_path, text):
+    path = tmp_path / "script.txt"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_scripted_round(tmp_path, capsys):
+    cli.main(["--script", write_script(tmp_path, ROUND_SCRIPT), "--seed", "1"])
+    captured = capsys.readouterr()
+    assert "Final scores:" in captured.out
+    assert "Enter name for Player 1: Alice" in captured.out
+    assert "Played 1 games" in captured.err
+
+
+def test_scripted_rounds_back_to_back_quiet(tmp_path, capsys):
+    script = "# three games\n" + ROUND_SCRIPT * 3
+    cli.main(["--script", write_script(tmp_path, script), "--quiet"])
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "Played 3 games" in captured.err
+
+
+def test_scripted_replay_is_deterministic(tmp_path, capsys):
+    path = write_script(tmp_path, ROUND_SCRIPT)
+    cli.main(["--script", path, "--seed", "7"])
+    first = capsys.readouterr().out
+    cli.main(["--script", path, "--seed", "7"])
+    assert capsys.readouterr().out == first
+
+
+def test_script_ending_mid_game(tmp_path):
+    with pytest.raises(SystemExit, match="middle of game 1"):
+        cli.main(["--script", write_script(tmp_path, "2\nAlice\n"), "--quiet"])
+
+
+def test_quiet_requires_script():
+    with pytest.raises(SystemExit):
+        cli.main(["--quiet"])
+
+
+def test_scripted_full_game(tmp_path, capsys):
+    # Card 0 is always playable and all-zero bids are always legal for two players
+    script = "2\nAlice\nBob\n" + "0\n" * 360
+    cli_game.main(["--script", write_script(tmp_path, script), "--quiet"])
+    assert "Played 1 games" in capsys.readouterr().err
+
+
+def test_scripted_ten_player_round(tmp_path, capsys):
+    # Ten hands of 20 cards plus the trump card need four decks
+    assert Deck.decks_needed(10, 20) == 4
+    names = [f"P{i}" for i in range(10)]
+    script = ["10", *names, "y", "20", "2"] + ["0"] * 200
+    cli.main(["--script", write_script(tmp_path, "\n".join(script) + "\n")])
+    out = capsys.readouterr().out
+    assert "Final scores:" in out
+    assert "P9:" in out
+
+
+def test_bidding_scorer_reports_bids_as_events():
+    out = io.StringIO()
+    round = GameRound(["Alice", "Bob"], sink=JsonlSink(out, flush_every=1))
+    round.setup_round(2)
+    set_console(ScriptedConsole(["1", "0"], quiet=True))
+    try:
+        scorer = cli.get_bidding_scorer(round)
+    finally:
+        set_console(Console())
+
+    assert scorer is not None
+    events = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [e for e in events if e["type"] == "bid"] == [
+        {"type": "bid", "player": "Alice", "bid": 1},
+        {"type": "bid", "player": "Bob", "bid": 0},
+    ]
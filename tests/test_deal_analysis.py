@@ -0,0 +1,94 @@
+import json
+import random
+import numpy as np
+import pytest
+from src.ml.double_dummy import DoubleDummySolver
+from src.models.card import Suit
+from src.models.deck import Deck
+from src.models.game_round import GameRound
+from src.sim import deal_analysis
+from src.sim.deal_analysis import (
+    NO_TRUMP,
+    analyse_deals,
+    deal_hands,
+    read_deals,
+    solve_deal,
+    strains_for,
+    summarise,
+)
+
+
+def test_deal_hands_match_game_round():
+    round = GameRound(["A", "B", "C"])
+    round.setup_round(4, deck=Deck.standard_deck(random.Random(9)))
+    hands = deal_hands(9, 3, 4)
+    for seat, player in enumerate(round.players):
+        assert hands[seat].tolist() == [c.index for c in round.get_hand(player)]
+
+
+def test_solve_deal_covers_every_strain():
+    hands = deal_hands(3, 2, 4)
+    tricks = solve_deal(hands, strains_for(True))
+    assert tricks.shape == (4, 2)
+    assert (tricks.sum(axis=1) == 4).all()
+    hearts = DoubleDummySolver.from_indices(hands.tolist(), Suit.HEARTS)
+    assert tricks[0].tolist() == hearts.all_tricks()
+    notrump = solve_deal(hands, [NO_TRUMP])
+    assert notrump[0].tolist() == DoubleDummySolver.from_indices(hands).all_tricks()
+
+
+def test_analyse_seed_range_in_parallel():
+    hands, tricks = analyse_deals(
+        3, 3, seeds=range(10, 30), max_workers=2, chunk_size=6
+    )
+    assert tricks.shape == (20, 4, 3)
+    for i, seed in enumerate(range(10, 30)):
+        assert (hands[i] == deal_hands(seed, 3, 3)).all()
+        assert (tricks[i] == solve_deal(hands[i], strains_for(True))).all()
+
+
+def test_deals_file_round_trip(tmp_path):
+    path = tmp_path / "deals.jsonl"
+    dealt = [deal_hands(seed, 2, 3) for seed in range(5)]
+    path.write_text("\n".join(json.dumps(h.tolist()) for h in dealt) + "\n")
+    hands = read_deals(str(path), 2, 3)
+    assert hands.shape == (5, 2, 3)
+    with pytest.raises(ValueError):
+        read_deals(str(path), 3, 3)
+
+    _, tricks = analyse_deals(2, 3, trump=False, hands=hands, max_workers=1)
+    assert tricks.shape == (5, 1, 2)
+
+
+def test_summary_histograms():
+    tricks = np.array([[[2, 0]], [[1, 1]], [[2, 0]]], dtype=np.int8)
+    summary = summarise(tricks, 2, trump=False)
+    notrump = summary["strains"]["notrump"]
+    assert summary["deals"] == 3
+    assert notrump["histogram"][0] == [0, 1, 2]
+    assert notrump["mean"][1] == pytest.approx(1 / 3)
+
+
+def test_command_writes_table_and_summary(tmp_path, capsys):
+    out = tmp_path / "table.npz"
+    deal_analysis.main(
+        ["--seeds", "0:8", "--players", "2", "--cards", "3", "--out", str(out)]
+        + ["--workers", "1"]
+    )
+    with np.load(out) as data:
+        assert data["tricks"].shape == (8, 4, 2)
+        assert data["seeds"].tolist() == list(range(8))
+        assert list(data["strains"]) == ["hearts", "diamonds", "clubs", "spades"]
+    summary = json.loads((tmp_path / "table.summary.json").read_text())
+    assert summary["deals"] == 8
+    assert "Solved 8 deals" in capsys.readouterr().out
+
+
+def test_deals_must_fit_one_deck(tmp_path, capsys):
+    deal_analysis.check_deal_size(3, 17, trump=True)
+    with pytest.raises(ValueError, match="61 cards"):
+        analyse_deals(10, 6, seeds=range(1))
+    argv = ["--seeds", "0:1", "--players", "10", "--cards", "6"]
+    with pytest.raises(SystemExit):
+        deal_analysis.main(argv + ["--out", str(tmp_path / "dd.npz")])
+    assert "more than one deck holds" in capsys.readouterr().err
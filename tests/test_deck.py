@@ -28,3 +28,25 @@ def test_custom_deck():
     assert len(deck.cards) == 2
     assert deck.cards[0].suit == Suit.HEARTS
     assert deck.cards[1].suit == Suit.SPADES
+
+def test_multi_deck():
+    from src.models.card import Card, Suit, Rank
+    deck = Deck.standard_deck(num_decks=3)
+    assert len(deck.cards) == 156
+    assert len({card.uid for card in deck.cards}) == 156
+    aces = [c for c in deck.cards if (c.suit, c.rank) == (Suit.SPADES, Rank.ACE)]
+    assert sorted(c.deck for c in aces) == [0, 1, 2]
+    assert Card(Suit.SPADES, Rank.ACE) != Card(Suit.SPADES, Rank.ACE, deck=1)
+
+def test_decks_needed():
+    assert Deck.decks_needed(4, 12) == 1
+    assert Deck.decks_needed(2, 26) == 2
+    assert Deck.decks_needed(2, 26, trump=False) == 1
+    assert Deck.decks_needed(10, 12) == 3
+
+def test_single_deck_shuffle_unchanged():
+    import random
+    from src.models.card import Card, Suit, Rank
+    cards = [Card(suit, rank) for suit in Suit for rank in Rank]
+    random.Random(5).shuffle(cards)
+    assert Deck.standard_deck(random.Random(5)).cards == tuple(cards)
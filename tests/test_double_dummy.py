@@ -0,0 +1,75 @@
+import random
+import pytest
+from src.ml.double_dummy import DoubleDummySolver, hand_mask, trick_winner
+from src.models.card import Card, Rank, Suit
+from src.models.deck import Deck
+from src.models.game_round import trick_winner_index
+
+
+def brute_force(hands, trump, seat, leader=0):
+    """Plain minimax over card indices, for checking the solver."""
+    n = len(hands)
+
+    def search(hands, leader, trick):
+        if len(trick) == n:
+            winner = (leader + trick_winner(trick, trump)) % n
+            won = int(winner == seat)
+            return won + (search(hands, winner, []) if any(hands) else 0)
+        player = (leader + len(trick)) % n
+        hand = hands[player]
+        legal = hand
+        if trick:
+            legal = [c for c in hand if c // 13 == trick[0] // 13] or hand
+        values = []
+        for card in legal:
+            rest = list(hands)
+            rest[player] = [c for c in hand if c != card]
+            values.append(search(rest, leader, trick + [card]))
+        return max(values) if player == seat else min(values)
+
+    return search(hands, leader, [])
+
+
+def test_trick_winner_matches_engine():
+    rng = random.Random(0)
+    for _ in range(200):
+        cards = list(Deck.standard_deck(rng).cards[:4])
+        trump = rng.choice([None, *Suit])
+        expected = trick_winner_index(cards, trump)
+        got = trick_winner([c.index for c in cards], trump.value - 1 if trump else None)
+        assert got == expected
+
+
+def test_hand_mask():
+    hand = [Card(Suit.HEARTS, Rank.TWO), Card(Suit.SPADES, Rank.ACE)]
+    assert hand_mask(hand) == 1 | 1 << 51
+
+
+def test_top_cards_take_every_trick():
+    hands = [
+        [Card(Suit.SPADES, Rank.ACE), Card(Suit.SPADES, Rank.KING)],
+        [Card(Suit.SPADES, Rank.TWO), Card(Suit.HEARTS, Rank.ACE)],
+    ]
+    assert DoubleDummySolver(hands).all_tricks() == [2, 0]
+    # Leading from the other side gives the heart ace a trick
+    assert DoubleDummySolver(hands, leader=1).all_tricks() == [1, 1]
+
+
+def test_matches_brute_force():
+    rng = random.Random(1)
+    for _ in range(60):
+        players = rng.choice([2, 3, 4])
+        cards = rng.randint(1, 3)
+        deck = list(Deck.standard_deck(rng).cards)
+        hands = [deck[i * cards : (i + 1) * cards] for i in range(players)]
+        trump = rng.choice([None, *Suit])
+        indices = [[c.index for c in hand] for hand in hands]
+        trump_number = trump.value - 1 if trump else None
+        expected = [brute_force(indices, trump_number, seat) for seat in range(players)]
+        assert DoubleDummySolver(hands, trump).all_tricks() == expected
+
+
+def test_rejects_multi_deck_deal():
+    copies = [[Card(Suit.SPADES, Rank.ACE)], [Card(Suit.SPADES, Rank.ACE, deck=1)]]
+    with pytest.raises(ValueError):
+        DoubleDummySolver(copies)
@@ -0,0 +1,55 @@
+from src.cli_game import RoundConfig
+from src.ml.agent import RandomAgent
+from src.models.scoring import BiddingScorer, FixedBidScorer
+from src.sim.duplicate import deal_seed, run_duplicate, seat_orders
+from tests.agents import HighestCardAgent, LowestCardAgent
+
+SCHEDULE = [
+    RoundConfig(3, True, BiddingScorer, {}),
+    RoundConfig(3, False, FixedBidScorer, {"target_tricks": 0, "points": 20}),
+]
+
+
+def test_seat_orders():
+    assert seat_orders(3) == [(0, 1, 2), (1, 2, 0), (2, 0, 1)]
+    assert len(seat_orders(3, all_permutations=True)) == 6
+
+
+def test_deal_seed_is_stable():
+    assert deal_seed(1, 2, 3) == deal_seed(1, 2, 3)
+    assert deal_seed(1, 2, 3) != deal_seed(1, 3, 2)
+
+
+def test_identical_agents_tie_on_every_deal():
+    # Deterministic, identical agents see the same hands once each
+    agents = [LowestCardAgent(), LowestCardAgent()]
+    result = run_duplicate(agents, games=3, seed=5, round_configs=SCHEDULE)
+    assert len(result.deals) == 6
+    assert all(d == 0 for d in result.paired_differences(0, 1))
+
+
+def test_paired_comparison():
+    agents = [LowestCardAgent(), HighestCardAgent()]
+    result = run_duplicate(agents, games=40, seed=1, round_configs=SCHEDULE[1:])
+    mean, stderr = result.compare(0, 1)
+    assert stderr < mean
+    assert mean > 0
+    assert result.totals()[0] > result.totals()[1]
+
+
+def test_parallel_matches_serial():
+    agents = [RandomAgent(), RandomAgent(), RandomAgent()]
+    serial = run_duplicate(agents, games=2, seed=3, round_configs=SCHEDULE)
+    parallel = run_duplicate(
+        agents, games=2, seed=3, round_configs=SCHEDULE, max_workers=2
+    )
+    assert serial == parallel
+
+
+def test_unseeded_runs_draw_fresh_deals():
+    agents = [RandomAgent(), RandomAgent()]
+    first = run_duplicate(agents, games=1, round_configs=SCHEDULE)
+    second = run_duplicate(agents, games=1, round_configs=SCHEDULE)
+    assert first.seed != second.seed
+    replay = run_duplicate(agents, games=1, seed=first.seed, round_configs=SCHEDULE)
+    assert replay == first
@@ -0,0 +1,116 @@
+import io
+import json
+from src.cli_game import GameController, RoundConfig
+from src.cli_helpers import Console, ScriptedConsole, set_console
+from src.ml.agent import RandomAgent
+from src.models.events import (
+    Bid,
+    CardPlayed,
+    Deal,
+    EventSink,
+    GameOver,
+    GameStarted,
+    JsonlSink,
+    RoundScored,
+    RoundStarted,
+    TrickWon,
+)
+from src.models.game_round import GameRound
+from src.sim.runner import play_round
+from src.models.scoring import BiddingScorer
+
+
+class ListSink(EventSink):
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event):
+        self.events.append(event)
+
+
+def test_jsonl_sink_buffers_until_flush():
+    out = io.StringIO()
+    sink = JsonlSink(out, flush_every=3)
+    sink.emit(Bid("Alice", 2))
+    sink.emit(Bid("Bob", 0))
+    assert out.getvalue() == ""
+    sink.emit(GameOver(["Alice", "Bob"], [10, -2]))
+    lines = out.getvalue().splitlines()
+    assert len(lines) == 3
+    assert json.loads(lines[0]) == {"type": "bid", "player": "Alice", "bid": 2}
+    assert json.loads(lines[2])["totals"] == [10, -2]
+
+
+def test_jsonl_sink_close_writes_remainder(tmp_path):
+    path = str(tmp_path / "events.jsonl")
+    sink = JsonlSink(path)
+    sink.emit(GameStarted(["Alice", "Bob"]))
+    sink.close()
+    with open(path, encoding="utf-8") as f:
+        assert json.loads(f.read()) == {
+            "type": "game_started",
+            "players": ["Alice", "Bob"],
+        }
+
+
+def test_round_emits_events_in_order():
+    sink = ListSink()
+    round = GameRound(["Alice", "Bob"], sink=sink)
+    round.setup_round(3, trump=True)
+    agents = [RandomAgent(seed=1), RandomAgent(seed=2)]
+    play_round(round, BiddingScorer(), agents)
+
+    kinds = [type(event) for event in sink.events]
+    assert kinds[0] is Deal
+    assert kinds[1:3] == [Bid, Bid]
+    assert kinds.count(CardPlayed) == 6
+    assert kinds.count(TrickWon) == 3
+    assert kinds[-1] is TrickWon
+    assert sink.events[0].trump is not None
+    assert len(sink.events[0].hands[0]) == 3
+
+
+def test_interactive_game_reports_every_event_in_order():
+    sink = ListSink()
+    controller = GameController(["Alice", "Bob"], sink=sink)
+    controller.round_configs = [RoundConfig(2, True, BiddingScorer, {})]
+    # Zero bids, then the first playable card for each of the four plays
+    set_console(ScriptedConsole(["0"] * 6, quiet=True))
+    try:
+        controller.play_game()
+    finally:
+        set_console(Console())
+
+    kinds = [type(event) for event in sink.events]
+    assert kinds == [
+        GameStarted,
+        RoundStarted,
+        Deal,
+        Bid,
+        Bid,
+        CardPlayed,
+        CardPlayed,
+        TrickWon,
+        CardPlayed,
+        CardPlayed,
+        TrickWon,
+        RoundScored,
+        GameOver,
+    ]
+    assert [e.bid for e in sink.events if isinstance(e, Bid)] == [0, 0]
+
+
+def test_game_controller_reports_to_sink(capsys):
+    sink = ListSink()
+    controller = GameController(
+        ["Alice", "Bob"], agents=[RandomAgent(1), RandomAgent(2)], sink=sink
+    )
+    controller.play_game_parallel(max_workers=1, seed=3)
+    assert capsys.readouterr().out == ""
+
+    assert isinstance(sink.events[0], GameStarted)
+    assert sum(isinstance(e, RoundStarted) for e in sink.events) == 20
+    scored = [e for e in sink.events if isinstance(e, RoundScored)]
+    assert [e.round_num for e in scored] == list(range(1, 21))
+    assert isinstance(sink.events[-1], GameOver)
+    assert sink.events[-1].totals == scored[-1].totals
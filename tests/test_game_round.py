@@ -1,6 +1,12 @@
 import pytest
 from src.models.deck import Deck
-from src.models.game_round import GameRound, PlayedCard
+from src.models.game_round import (
+    GameRound,
+    HistoryMode,
+    PlayedCard,
+    Phase,
+    trick_winner_index,
+)
 from src.models.card import Card, Suit, Rank
 
 
@@ -128,3 +134,126 @@ def test_trump_card_wins():
     assert winner == player2  # Trump wins even against high card
     assert len(round.tricks_won[player2]) == 1
     assert round.tricks_won[player2][0] == [spade_ace, heart_two]
+
+
+def test_step_bidding_then_play():
+    # Dealt from the end: player 1 gets the last two cards, player 2 the two before
+    deck = create_test_deck(
+        Card(Suit.CLUBS, Rank.TWO),
+        Card(Suit.HEARTS, Rank.KING),
+        Card(Suit.SPADES, Rank.THREE),
+        Card(Suit.HEARTS, Rank.TWO),
+        Card(Suit.SPADES, Rank.ACE),
+    )
+    round = GameRound(["Player 1", "Player 2"])
+    round.setup_round(2, trump=False, deck=deck)
+    player1, player2 = round.players
+
+    round.start_bidding()
+    assert round.phase == Phase.BIDDING
+    assert round.to_move == player1
+    round.step(1)
+    assert round.to_move == player2
+    assert round.get_valid_bids() == [0, 2]
+    with pytest.raises(ValueError):
+        round.step(1)  # Bids may not sum to the number of tricks
+    round.step(0)
+    assert round.bids == {player1: 1, player2: 0}
+
+    assert round.phase == Phase.PLAYING
+    assert round.to_move == player1
+    assert round.step(Card(Suit.HEARTS, Rank.TWO)) is None
+    assert round.to_move == player2
+    winner = round.step(Card(Suit.HEARTS, Rank.KING))
+    assert winner == player2
+    assert round.to_move == player2  # Trick winner leads
+    assert [p.card for p in round.last_trick] == [
+        Card(Suit.HEARTS, Rank.TWO),
+        Card(Suit.HEARTS, Rank.KING),
+    ]
+
+    round.step(Card(Suit.SPADES, Rank.THREE))
+    assert round.step(Card(Suit.SPADES, Rank.ACE)) == player1
+    assert round.phase == Phase.OVER
+    assert round.to_move is None
+    with pytest.raises(ValueError):
+        round.step(Card(Suit.CLUBS, Rank.TWO))
+
+
+def test_step_rejects_bid_while_playing():
+    round = GameRound(["Player 1", "Player 2"])
+    round.setup_round(2)
+    with pytest.raises(ValueError):
+        round.step(1)
+
+
+def play_out(round: GameRound) -> None:
+    while round.phase != Phase.OVER:
+        round.step(round.get_valid_plays(round.to_move)[0])
+
+
+def test_counts_only_history():
+    round = GameRound(["Player 1", "Player 2", "Player 3"], history=HistoryMode.COUNTS)
+    round.setup_round(5)
+    play_out(round)
+    assert sum(round.trick_count(p) for p in round.players) == 5
+    assert all(tricks == [] for tricks in round.tricks_won.values())
+    assert round.last_trick == []
+
+
+def test_recent_history_ring_buffer():
+    round = GameRound(
+        ["Player 1", "Player 2"], history=HistoryMode.RECENT, recent_tricks=2
+    )
+    round.setup_round(5)
+    play_out(round)
+    assert sum(round.trick_count(p) for p in round.players) == 5
+    assert len(round.recent_tricks) == 2
+    assert round.recent_tricks[-1] is round.last_trick
+    assert all(len(trick) == 2 for trick in round.recent_tricks)
+
+
+def test_history_modes_agree_on_counts():
+    deck_cards = Deck.standard_deck().cards
+    counts = []
+    for mode in HistoryMode:
+        round = GameRound(["Player 1", "Player 2"], history=mode)
+        round.setup_round(6, deck=Deck(deck_cards))
+        play_out(round)
+        counts.append([round.trick_count(p) for p in round.players])
+    assert counts[0] == counts[1] == counts[2]
+
+
+def test_identical_cards_first_played_wins():
+    first = Card(Suit.HEARTS, Rank.KING, deck=0)
+    second = Card(Suit.HEARTS, Rank.KING, deck=1)
+    low = Card(Suit.HEARTS, Rank.TWO)
+    assert trick_winner_index([first, second, low], None) == 0
+    assert trick_winner_index([low, second, first], Suit.HEARTS) == 1
+
+
+def test_removing_a_copy_keeps_the_other():
+    round = GameRound(["Player 1", "Player 2"])
+    player = round.players[0]
+    copies = [Card(Suit.CLUBS, Rank.ACE, deck=d) for d in range(2)]
+    round.add_cards_to_hand(player, list(copies))
+    round.remove_card_from_hand(player, copies[1])
+    assert round.get_hand(player) == [copies[0]]
+    assert round.get_hand(player)[0].deck == 0
+
+
+def test_ten_player_multi_deck_round():
+    names = [f"Player {i}" for i in range(10)]
+    round = GameRound(names, history=HistoryMode.COUNTS)
+    round.setup_round(12, deck=Deck.standard_deck(num_decks=Deck.decks_needed(10, 12)))
+    play_out(round)
+    assert sum(round.trick_count(p) for p in round.players) == 12
+    assert bin(round.played_mask).count("1") == 120
+
+
+def test_recent_history_sets_last_trick():
+    round = GameRound(["Player 1", "Player 2"], history=HistoryMode.RECENT)
+    round.setup_round(2)
+    play_out(round)
+    assert len(round.last_trick) == 2
+    assert all(len(tricks) == 0 for tricks in round.tricks_won.values())
@@ -0,0 +1,127 @@
+import asyncio
+import threading
+import numpy as np
+import pytest
+from src.ml.agent import ACTION_SIZE, OBSERVATION_SIZE, PolicyAgent, encode_observation
+from src.ml.inference import MLP, InferenceBroker
+from src.models.game_round import GameRound
+from src.models.scoring import BiddingScorer
+from src.sim.runner import play_round
+
+
+def test_mlp_forward_shape():
+    model = MLP.random([10, 16, 4], seed=0)
+    out = model.forward(np.ones((3, 10)))
+    assert out.shape == (3, 4)
+
+
+def test_mlp_save_load(tmp_path):
+    model = MLP.random([5, 8, 2], seed=1)
+    path = tmp_path / "policy.npz"
+    model.save(str(path))
+    loaded = MLP.load(str(path))
+    x = np.arange(5, dtype=np.float32)[None, :]
+    np.testing.assert_allclose(model.forward(x), loaded.forward(x))
+
+
+def test_broker_matches_direct_forward():
+    model = MLP.random([6, 12, 3], seed=2)
+    x = np.random.default_rng(0).standard_normal((20, 6)).astype(np.float32)
+    with InferenceBroker(model, max_batch_size=8) as broker:
+        futures = [broker.submit(row) for row in x]
+        results = np.stack([f.result() for f in futures])
+    np.testing.assert_allclose(results, model.forward(x), rtol=1e-5, atol=1e-6)
+
+
+def test_broker_batches_concurrent_threads():
+    model = MLP.random([4, 4], seed=3)
+    barrier = threading.Barrier(8)
+    results = {}
+
+    with InferenceBroker(model, max_batch_size=8, max_latency=0.2) as broker:
+
+        def worker(i):
+            barrier.wait()
+            results[i] = broker.infer(np.full(4, i, dtype=np.float32))
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    assert len(results) == 8
+    assert broker.stats.requests == 8
+    assert broker.stats.batches < 8
+
+
+def test_broker_async():
+    model = MLP.random([4, 2], seed=4)
+
+    async def main(broker):
+        rows = [np.full(4, i, dtype=np.float32) for i in range(5)]
+        return await asyncio.gather(*(broker.infer_async(r) for r in rows))
+
+    with InferenceBroker(model, max_batch_size=5, max_latency=0.05) as broker:
+        outputs = asyncio.run(main(broker))
+    assert len(outputs) == 5
+
+
+def test_broker_requires_start():
+    broker = InferenceBroker(MLP.random([2, 2]))
+    with pytest.raises(RuntimeError):
+        broker.submit(np.zeros(2))
+
+
+def test_submit_during_stop_never_hangs():
+    broker = InferenceBroker(MLP.random([2, 2]), max_latency=0.01).start()
+    outcomes = []
+
+    def client():
+        while True:
+            try:
+                future = broker.submit(np.zeros(2, dtype=np.float32))
+            except RuntimeError:
+                return
+            try:
+                future.result(timeout=5)
+                outcomes.append("served")
+            except RuntimeError:
+                outcomes.append("failed")
+
+    threads = [threading.Thread(target=client) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    broker.stop()
+    for thread in threads:
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+    with pytest.raises(RuntimeError):
+        broker.submit(np.zeros(2))
+
+
+def test_stop_fails_requests_left_in_queue():
+    from src.ml.inference import _STOP
+
+    broker = InferenceBroker(MLP.random([2, 2])).start()
+    # Make the worker exit early, leaving the next request unserved
+    broker._requests.put(_STOP)
+    broker._worker.join()
+    future = broker.submit(np.zeros(2, dtype=np.float32))
+    broker.stop()
+    with pytest.raises(RuntimeError):
+        future.result(timeout=1)
+
+
+def test_policy_agent_plays_legal_round():
+    model = MLP.random([OBSERVATION_SIZE, 32, ACTION_SIZE], seed=5)
+    round = GameRound(["A", "B", "C"])
+    round.setup_round(4)
+    assert encode_observation(round, round.players[0]).shape == (OBSERVATION_SIZE,)
+
+    with InferenceBroker(model) as broker:
+        agents = [PolicyAgent(broker) for _ in round.players]
+        result = play_round(round, BiddingScorer.create(), agents)
+
+    assert sum(result.tricks) == 4
+    assert sum(result.bids) != 4
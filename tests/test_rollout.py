@@ -0,0 +1,179 @@
+import random
+import pytest
+from src.ml.agent import RandomAgent
+from src.ml.rollout import (
+    BIDDING_RULES,
+    HandIndex,
+    HeuristicAgent,
+    RolloutPolicy,
+    TrickView,
+    duck_when_over_bid,
+    dump_lowest_loser,
+    greedy_policy,
+    play_to_win,
+    policy_for,
+    position,
+    trump_in_when_void,
+    win_cheaply_when_last,
+)
+from src.models.card import Card, Rank, Suit
+from src.models.deck import Deck
+from src.models.game_round import GameRound, HistoryMode, Phase
+from src.models.scoring import AllOrNothingScorer, BiddingScorer, FixedBidScorer
+from src.sim.runner import play_round
+
+
+def card(text):
+    ranks = {"A": Rank.ACE, "K": Rank.KING, "Q": Rank.QUEEN, "J": Rank.JACK}
+    suits = {"s": Suit.SPADES, "h": Suit.HEARTS, "d": Suit.DIAMONDS, "c": Suit.CLUBS}
+    rank = ranks.get(text[:-1]) or Rank(int(text[:-1]))
+    return Card(suits[text[-1]], rank)
+
+
+def view(hand, played, trump=None, want=True, players=3):
+    """A TrickView for the player to move after `played` cards in a trick."""
+    round = GameRound([f"P{i}" for i in range(players)])
+    round.setup_round(1, trump=False)
+    round.trump_suit = trump
+    player = round.players[len(played)]
+    for seat, text in enumerate(played):
+        round.hands[round.players[seat]] = [card(text)]
+        round.step(card(text))
+    round.hands[player] = [card(text) for text in hand]
+    return TrickView(round, player, want)
+
+
+def test_view_orders_trumps_last():
+    v = view(["Ah", "2s", "Kc"], [], trump=Suit.SPADES)
+    assert v.legal == [card("Kc"), card("Ah"), card("2s")]
+
+
+def test_win_cheaply_when_last():
+    v = view(["3h", "Jh", "Ah"], ["9h", "10h"])
+    assert win_cheaply_when_last(v) == card("Jh")
+    assert win_cheaply_when_last(view(["Jh", "Ah"], ["9h"])) is None
+
+
+def test_trump_in_when_void():
+    v = view(["5s", "9s", "4c"], ["Ah"], trump=Suit.SPADES)
+    assert trump_in_when_void(v) == card("5s")
+    # Must overruff an earlier trump
+    v = view(["5s", "9s"], ["Ah", "6s"], trump=Suit.SPADES)
+    assert trump_in_when_void(v) == card("9s")
+    # Not void: following suit comes first
+    assert trump_in_when_void(view(["2h", "5s"], ["Ah"], Suit.SPADES)) is None
+
+
+def test_dump_lowest_loser():
+    v = view(["3h", "9h"], ["Ah"])
+    assert dump_lowest_loser(v) == card("3h")
+    assert dump_lowest_loser(view(["3h", "Kh"], ["Qh"])) is None
+
+
+def test_duck_when_over_bid():
+    v = view(["3h", "9h", "Kh"], ["10h"], want=False)
+    assert duck_when_over_bid(v) == card("9h")
+    # Forced to win as last player: get rid of the highest card
+    v = view(["Jh", "Kh"], ["2h", "10h"], want=False)
+    assert duck_when_over_bid(v) == card("Kh")
+    assert duck_when_over_bid(view(["3h"], ["10h"], want=True)) is None
+
+
+@pytest.mark.parametrize(
+    "scorer", [BiddingScorer(), AllOrNothingScorer(), FixedBidScorer(2, 20)]
+)
+def test_agents_play_legal_rounds_for_every_scorer(scorer):
+    agent = HeuristicAgent.for_scorer(scorer, RandomAgent(seed=0))
+    for seed in range(5):
+        round = GameRound(["A", "B", "C"])
+        round.setup_round(6, deck=Deck.standard_deck(random.Random(seed)))
+        play_round(round, scorer, [agent] * 3)
+        assert round.is_over()
+
+
+def test_policy_for_uses_scorer_targets():
+    round = GameRound(["A", "B"])
+    round.setup_round(3)
+    player = round.players[0]
+    assert policy_for(FixedBidScorer(2)).target(round, player) == 2
+    assert policy_for(AllOrNothingScorer()).target(round, player) == 0
+    assert isinstance(greedy_policy(), RolloutPolicy)
+    assert policy_for(BiddingScorer()).rules == BIDDING_RULES
+
+
+def test_greedy_beats_random_on_tricks():
+    rng = random.Random(3)
+    greedy = HeuristicAgent(greedy_policy())
+    tricks = 0
+    for _ in range(100):
+        round = GameRound(["Greedy", "Random"])
+        round.setup_round(8, deck=Deck.standard_deck(rng))
+        play_round(round, FixedBidScorer(), [greedy, RandomAgent(rng.random())])
+        tricks += round.trick_count(round.players[0])
+    assert tricks > 100 * 8 / 2
+
+
+def test_hand_index_orders_positions():
+    index = HandIndex([card("Ah"), card("2s"), card("Kh")], trump=3)
+    bits = sorted(position(c, 3) for c in index.hand)
+    assert [index.cards[b] for b in bits] == [card("Kh"), card("Ah"), card("2s")]
+    index.discard(card("Ah"))
+    assert index.mask == (1 << bits[0]) | (1 << bits[2])
+    assert index.size == 2
+
+
+def test_hand_index_keeps_copies():
+    copies = [Card(Suit.HEARTS, Rank.ACE, deck=d) for d in range(2)]
+    index = HandIndex(copies + [card("2h")])
+    bit = position(copies[0], -1)
+    assert index.at(bit) == copies
+    index.discard(copies[0])
+    assert index.mask >> bit & 1
+    assert index.at(bit) == [copies[1]]
+    index.discard(copies[1])
+    assert not index.mask >> bit & 1
+
+
+def test_incremental_index_matches_rebuilt_views():
+    # The policy's kept-up index must choose as a view built from scratch
+    policy = greedy_policy()
+    for seed in range(20):
+        round = GameRound(["A", "B", "C", "D"], history=HistoryMode.COUNTS)
+        round.setup_round(8, deck=Deck.standard_deck(random.Random(seed)))
+        while round.phase != Phase.OVER:
+            player = round.to_move
+            fresh = TrickView(round, player, True)
+            expected = None
+            for rule in policy.rules:
+                expected = rule(fresh)
+                if expected is not None:
+                    break
+            card = policy.choose(round, player)
+            assert card is (expected or play_to_win(fresh))
+            round.step(card)
+
+
+def test_policy_rebuilds_a_replaced_hand():
+    policy = greedy_policy()
+    round = GameRound(["A", "B"])
+    round.setup_round(3, trump=False)
+    player = round.players[0]
+    policy.choose(round, player)
+    round.hands[player] = [card("2c"), card("3c")]
+    assert policy.choose(round, player) == card("3c")
+
+
+def test_redealt_round_reindexes_with_new_trump():
+    policy = greedy_policy()
+    round = GameRound(["A", "B", "C"])
+    trumps = set()
+    for seed in range(20):
+        round.setup_round(5, deck=Deck.standard_deck(random.Random(seed)))
+        trumps.add(round.trump_suit)
+        player = round.to_move
+        round.step(policy.choose(round, player))
+        index = policy._hands[player]
+        fresh = HandIndex(round.get_hand(player), round.trump_suit.value - 1)
+        assert index.trump == fresh.trump
+        assert index.mask == fresh.mask
+    assert len(trumps) > 1
@@ -0,0 +1,78 @@
+import pytest
+from src.cli_game import GameController
+from src.ml.agent import RandomAgent
+from src.models.game_round import GameRound, legal_bids
+from src.models.scoring import BiddingScorer, AllOrNothingScorer
+from src.sim.runner import play_round, play_configured_round, play_game
+
+
+def test_legal_bids_last_player_restricted():
+    assert legal_bids(3, {}, is_last=False) == [0, 1, 2, 3]
+    assert legal_bids(3, {"a": 1}, is_last=True) == [0, 1, 3]
+
+
+def test_play_round_with_agents():
+    round = GameRound(["Alice", "Bob", "Carol"])
+    round.setup_round(5, trump=True)
+    scorer = BiddingScorer.create()
+
+    result = play_round(round, scorer, [RandomAgent(seed=i) for i in range(3)])
+
+    assert round.is_over()
+    assert sum(result.tricks) == 5
+    assert len(result.bids) == 3
+    assert sum(result.bids) != 5
+
+
+def test_play_round_wrong_agent_count():
+    round = GameRound(["Alice", "Bob"])
+    round.setup_round(2)
+    with pytest.raises(ValueError):
+        play_round(round, AllOrNothingScorer(), [RandomAgent()])
+
+
+def test_configured_round_is_reproducible():
+    config = GameController(["A", "B"]).round_configs[0]
+    agents = [RandomAgent(), RandomAgent()]
+    first = play_configured_round(["A", "B"], config, agents, seed=7)
+    second = play_configured_round(["A", "B"], config, agents, seed=7)
+    assert first == second
+
+
+class SeedRecorder(RandomAgent):
+    def __init__(self):
+        super().__init__(seed=0)
+        self.seeds = []
+
+    def reset(self, seed=None):
+        self.seeds.append(seed)
+        super().reset(seed)
+
+
+def test_unseeded_rounds_reseed_agents():
+    config = GameController(["A", "B"]).round_configs[0]
+    agents = [SeedRecorder(), SeedRecorder()]
+    for _ in range(3):
+        play_configured_round(["A", "B"], config, agents)
+    seeds = agents[0].seeds + agents[1].seeds
+    assert None not in seeds
+    assert len(set(seeds)) == len(seeds)
+
+
+def test_parallel_game_matches_sequential_rounds(capsys):
+    names = ["A", "B", "C"]
+    agents = [RandomAgent(), RandomAgent(), RandomAgent()]
+    game = GameController(names, agents=agents)
+
+    totals = game.play_game_parallel(max_workers=2, seed=42)
+
+    # Replaying the schedule in-process with the same seed gives the same totals
+    expected = play_game(names, game.round_configs, agents, seed=42)
+
+    assert [totals[player] for player in game.players] == expected
+    assert "=== Final Scores ===" in capsys.readouterr().out
+
+
+def test_parallel_game_requires_agents():
+    with pytest.raises(ValueError):
+        GameController(["A", "B"]).play_game_parallel()
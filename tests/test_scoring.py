@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from src.models.scoring import (
     BiddingScorer,
@@ -5,7 +6,7 @@ from src.models.scoring import (
     FixedBidScorer,
     RoundScore,
 )
-from src.models.game_round import GameRound
+from src.models.game_round import GameRound, HistoryMode, Phase
 from src.models.card import Card, Suit
 from src.models.player import Player
 
@@ -132,3 +133,84 @@ class TestFixedBidScorer:
 
         assert score.points[alice] == 15  # Met target of 2
         assert score.points[bob] == 0  # Didn't meet target
+
+
+class TestScoreBatch:
+    def random_rounds(self, num_players, num_rounds, num_tricks=3, seed=0):
+        """Random trick splits, including sweeps, as rounds and as an array."""
+        rng = np.random.default_rng(seed)
+        names = [f"P{i}" for i in range(num_players)]
+        rounds, rows = [], []
+        for _ in range(num_rounds):
+            round = GameRound(names)
+            if rng.random() < 0.3:
+                winners = [round.players[rng.integers(num_players)]] * num_tricks
+            else:
+                winners = [
+                    round.players[i] for i in rng.integers(num_players, size=num_tricks)
+                ]
+            simulate_tricks(round, winners)
+            rounds.append(round)
+            rows.append([len(round.tricks_won[p]) for p in round.players])
+        return rounds, np.array(rows)
+
+    def per_round(self, scorer, rounds):
+        return np.array(
+            [[scorer.score_round(r).points[p] for p in r.players] for r in rounds]
+        )
+
+    @pytest.mark.parametrize("num_players", [2, 3, 4])
+    def test_all_or_nothing_matches(self, num_players):
+        rounds, tricks = self.random_rounds(num_players, 200)
+        scorer = AllOrNothingScorer()
+        np.testing.assert_array_equal(
+            scorer.score_batch(tricks), self.per_round(scorer, rounds)
+        )
+
+    def test_all_or_nothing_no_tricks(self):
+        round = create_test_round(["Alice", "Bob"])
+        scorer = AllOrNothingScorer()
+        np.testing.assert_array_equal(
+            scorer.score_batch(np.zeros((1, 2), dtype=int)),
+            self.per_round(scorer, [round]),
+        )
+
+    def test_fixed_bid_matches(self):
+        rounds, tricks = self.random_rounds(3, 200, num_tricks=6)
+        scorer = FixedBidScorer(target_tricks=2, points=15)
+        np.testing.assert_array_equal(
+            scorer.score_batch(tricks), self.per_round(scorer, rounds)
+        )
+
+    def test_bidding_matches(self):
+        rounds, tricks = self.random_rounds(3, 200, seed=1)
+        rng = np.random.default_rng(2)
+        batch_bids = rng.integers(0, 4, size=tricks.shape)
+        expected = []
+        for round, bids in zip(rounds, batch_bids):
+            scorer = BiddingScorer.create()
+            scorer._bids = dict(zip(round.players, bids.tolist()))
+            expected.append(
+                [scorer.score_round(round).points[p] for p in round.players]
+            )
+        np.testing.assert_array_equal(
+            BiddingScorer.create().score_batch(tricks, batch_bids), expected
+        )
+
+    def test_bidding_requires_bids(self):
+        with pytest.raises(ValueError):
+            BiddingScorer.create().score_batch(np.zeros((1, 2), dtype=int))
+
+
+def test_scorers_read_counts_only_rounds():
+    round = GameRound(["Alice", "Bob"], history=HistoryMode.COUNTS)
+    round.setup_round(cards_per_player=3, trump=False)
+    while round.phase != Phase.OVER:
+        round.step(round.get_valid_plays(round.to_move)[0])
+    tricks = np.array([[round.trick_count(p) for p in round.players]])
+
+    for scorer in (AllOrNothingScorer(), FixedBidScorer(target_tricks=2)):
+        points = scorer.score_round(round).points
+        np.testing.assert_array_equal(
+            [[points[p] for p in round.players]], scorer.score_batch(tricks)
+        )
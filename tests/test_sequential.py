@@ -0,0 +1,79 @@
+import random
+import pytest
+from src.cli_game import RoundConfig
+from src.ml.agent import RandomAgent
+from src.models.scoring import FixedBidScorer
+from src.sim.sequential import Decision, SequentialTest, run_match
+from tests.agents import HighestCardAgent, LowestCardAgent
+
+# Taking no tricks scores 20, so ducking with the lowest card is clearly better
+DUCKING_SCHEDULE = [
+    RoundConfig(3, False, FixedBidScorer, {"target_tricks": 0, "points": 20}),
+]
+
+
+def stream(test, mean, sd, seed=0, limit=100000):
+    rng = random.Random(seed)
+    for _ in range(limit):
+        decision = test.update(rng.gauss(mean, sd))
+        if decision is not None:
+            return decision
+    return None
+
+
+def test_detects_first_better():
+    test = SequentialTest(margin=1.0)
+    assert stream(test, 3.0, 10.0) == Decision.FIRST_BETTER
+
+
+def test_detects_second_better():
+    test = SequentialTest(margin=1.0)
+    assert stream(test, -3.0, 10.0) == Decision.SECOND_BETTER
+
+
+def test_detects_equivalence():
+    test = SequentialTest(margin=2.0)
+    assert stream(test, 0.0, 3.0) == Decision.EQUIVALENT
+    low, high = test.estimate.interval()
+    assert low < 0 < high
+
+
+def test_waits_for_min_games():
+    test = SequentialTest(margin=1.0, min_games=30)
+    for _ in range(29):
+        assert test.update(100.0 + random.random()) is None
+    assert test.update(100.0) == Decision.FIRST_BETTER
+
+
+def test_rejects_bad_margin():
+    with pytest.raises(ValueError):
+        SequentialTest(margin=0)
+
+
+def test_match_stops_early_with_live_estimates():
+    estimates = []
+    result = run_match(
+        LowestCardAgent(),
+        HighestCardAgent(),
+        SequentialTest(margin=2.0),
+        max_games=2000,
+        seed=1,
+        round_configs=DUCKING_SCHEDULE,
+        callback=estimates.append,
+    )
+    assert result.decision == Decision.FIRST_BETTER
+    assert result.games == len(estimates) < 2000
+    assert result.mean > 0
+
+
+def test_match_respects_max_games():
+    result = run_match(
+        RandomAgent(),
+        RandomAgent(),
+        SequentialTest(margin=0.1, min_games=1000),
+        max_games=10,
+        seed=2,
+        round_configs=DUCKING_SCHEDULE,
+    )
+    assert result.games == 10
+    assert result.decision is None
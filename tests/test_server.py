@@ -0,0 +1,237 @@
+import asyncio
+import json
+from src.cli_game import RoundConfig
+from src.ml.agent import RandomAgent
+from src.models.scoring import BiddingScorer, AllOrNothingScorer
+from src.server import GameServer
+
+SHORT_SCHEDULE = [
+    RoundConfig(3, True, BiddingScorer, {}),
+    RoundConfig(2, False, AllOrNothingScorer, {}),
+]
+
+BAD_VALUES = [[1], True, "0", {"x": 1}, None]
+
+
+async def fake_client(port, table, name, respond=True, malformed=False):
+    """
+    Join a table and answer every prompt with the first legal option,
+    after first sending an unusable reply to each prompt when `malformed`.
+    """
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        json.dumps({"type": "join", "table": table, "name": name}).encode() + b"\n"
+    )
+    await writer.drain()
+    messages = []
+    prompts = 0
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        message = json.loads(line)
+        messages.append(message)
+        if respond and message["type"] == "bid_request":
+            reply = {"type": "bid", "bid": message["options"][0]}
+        elif respond and message["type"] == "play_request":
+            reply = {"type": "play", "card": message["options"][0]}
+        elif message["type"] == "game_over":
+            break
+        else:
+            continue
+        if malformed:
+            # Alternate: an unusable reply, then the legal one on the re-prompt
+            prompts += 1
+            if prompts % 2:
+                key = "bid" if reply["type"] == "bid" else "card"
+                reply[key] = BAD_VALUES[prompts // 2 % len(BAD_VALUES)]
+        writer.write(json.dumps(reply).encode() + b"\n")
+        await writer.drain()
+    writer.close()
+    return messages
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, timeout=10))
+
+
+def test_many_tables_with_fake_clients():
+    async def main():
+        server = GameServer(seats_per_table=2, round_configs=SHORT_SCHEDULE)
+        port = await server.start()
+        clients = [
+            fake_client(port, f"t{t}", f"p{seat}")
+            for t in range(10)
+            for seat in range(2)
+        ]
+        results = await asyncio.gather(*clients)
+        await server.wait_for_games()
+        await server.close()
+        return server, results
+
+    server, results = run(main())
+    assert len(server.results) == 10
+    assert not server.tables
+    for messages in results:
+        types = [m["type"] for m in messages]
+        assert types[0] == "seated"
+        assert types.count("round_scores") == 2
+        assert types[-1] == "game_over"
+
+
+def test_human_and_bot_at_same_table():
+    async def main():
+        server = GameServer(seats_per_table=2, round_configs=SHORT_SCHEDULE)
+        port = await server.start()
+        client = asyncio.create_task(fake_client(port, "mixed", "human"))
+        await asyncio.sleep(0.05)
+        await server.add_bot("mixed", "bot", RandomAgent(seed=1))
+        messages = await client
+        await server.close()
+        return server, messages
+
+    server, messages = run(main())
+    assert len(server.results["mixed"]) == 2
+    assert messages[-1]["type"] == "game_over"
+
+
+def test_move_timeout_plays_default():
+    async def main():
+        server = GameServer(
+            seats_per_table=2, move_timeout=0.01, round_configs=SHORT_SCHEDULE
+        )
+        port = await server.start()
+        silent = asyncio.create_task(fake_client(port, "t", "silent", respond=False))
+        await asyncio.sleep(0.05)
+        await server.add_bot("t", "bot", RandomAgent(seed=2))
+        messages = await silent
+        await server.close()
+        return messages
+
+    messages = run(main())
+    assert messages[-1]["type"] == "game_over"
+
+
+def test_malformed_moves_are_rejected():
+    async def main():
+        server = GameServer(seats_per_table=2, round_configs=SHORT_SCHEDULE)
+        port = await server.start()
+        client = asyncio.create_task(fake_client(port, "t", "bad", malformed=True))
+        await asyncio.sleep(0.05)
+        await server.add_bot("t", "bot", RandomAgent(seed=3))
+        messages = await client
+        await server.wait_for_games()
+        await server.close()
+        return server, messages
+
+    server, messages = run(main())
+    errors = {m["message"] for m in messages if m["type"] == "error"}
+    assert errors == {"Illegal bid", "Illegal card"}
+    assert messages[-1]["type"] == "game_over"
+    assert len(server.results["t"]) == 2
+
+
+def test_disconnect_before_start_frees_the_seat():
+    async def main():
+        server = GameServer(seats_per_table=2, round_configs=SHORT_SCHEDULE)
+        port = await server.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        join = {"type": "join", "table": "t", "name": "gone"}
+        writer.write(json.dumps(join).encode() + b"\n")
+        await reader.readline()
+        writer.close()
+        while "t" in server.tables:
+            await asyncio.sleep(0.01)
+        client = asyncio.create_task(fake_client(port, "t", "human"))
+        await asyncio.sleep(0.05)
+        await server.add_bot("t", "bot", RandomAgent(seed=7))
+        messages = await client
+        await server.wait_for_games()
+        await server.close()
+        return server, messages
+
+    server, messages = run(main())
+    assert messages[0] == {"type": "seated", "table": "t", "seat": 0}
+    assert messages[-1]["type"] == "game_over"
+    assert len(server.results["t"]) == 2
+
+
+def test_totals_are_per_seat_with_duplicate_names():
+    async def main():
+        server = GameServer(seats_per_table=2, round_configs=SHORT_SCHEDULE)
+        await server.add_bot("t", "Player", RandomAgent(seed=4))
+        await server.add_bot("t", "Player", RandomAgent(seed=5))
+        await server.wait_for_games()
+        return server
+
+    server = run(main())
+    assert len(server.results["t"]) == 2
+
+
+def test_retries_do_not_extend_the_move_timeout():
+    async def main():
+        server = GameServer(
+            seats_per_table=2, move_timeout=0.2, round_configs=SHORT_SCHEDULE
+        )
+        port = await server.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        join = {"type": "join", "table": "t", "name": "stall"}
+        writer.write(json.dumps(join).encode() + b"\n")
+        await asyncio.sleep(0.05)
+        await server.add_bot("t", "bot", RandomAgent(seed=6))
+        loop = asyncio.get_running_loop()
+        started = None
+        while True:
+            message = json.loads(await reader.readline())
+            if message["type"] == "bid_request" and started is None:
+                started = loop.time()
+            if message["type"] == "bid" and message["seat"] == 0:
+                break
+            if started is not None:
+                # Keep answering illegally, each reply inside the timeout
+                await asyncio.sleep(0.05)
+                writer.write(b'{"type": "bid", "bid": -1}\n')
+        elapsed = loop.time() - started
+        writer.close()
+        await server.close()
+        return elapsed
+
+    # The default bid is made once the first deadline passes
+    assert run(main()) < 1.0
+
+
+def test_multi_deck_table_keeps_copies_apart():
+    # Six hands of nine cards plus the trump card need two decks
+    schedule = [RoundConfig(9, True, BiddingScorer, {})]
+
+    async def main():
+        server = GameServer(seats_per_table=6, round_configs=schedule)
+        port = await server.start()
+        clients = [
+            asyncio.create_task(fake_client(port, "big", f"p{seat}"))
+            for seat in range(6)
+        ]
+        results = await asyncio.gather(*clients)
+        await server.close()
+        return server, results
+
+    server, results = run(main())
+    assert len(server.results["big"]) == 6
+    for messages in results:
+        assert messages[-1]["type"] == "game_over"
+        first = next(m for m in messages if m["type"] == "play_request")
+        uids = [card["uid"] for card in first["hand"]]
+        assert len(set(uids)) == len(uids) == 9
+        assert set(first["options"]) <= set(uids)
+    played = [m["card"]["uid"] for m in results[0] if m["type"] == "played"]
+    assert len(set(played)) == len(played) == 54
+    assert max(played) >= 52
+
+
+def test_table_size_limits():
+    import pytest
+
+    GameServer(seats_per_table=10)
+    for seats in (1, 11):
+        with pytest.raises(ValueError):
+            GameServer(seats_per_table=seats)